@@ -1,16 +1,65 @@
+from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 
 from app.api.security import security
 from app.depends import AsyncSession, provider
-from app.domain.services.bookings import BookingParams, booking_service
+from app.domain.services.bookings import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    BookingFailureReason,
+    BookingParams,
+    BookingResult,
+    IdempotencyScope,
+    booking_service,
+    idempotency_service,
+)
+from app.domain.services.bookings.idempotency import StoredResponse
 from app.infrastructure.database import Booking, Customer, Resource, User
 
-from .schema import BookingCreate, BookingResponse
+from .schema import (
+    BookingBulkCreate,
+    BookingBulkItemResult,
+    BookingCreate,
+    BookingResponse,
+)
+from .series import router as series_router
 
 router = APIRouter(tags=["Bookings"], prefix="/bookings")
+router.include_router(series_router)
+
+IdempotencyKeyHeader = Annotated[
+    str | None,
+    Header(
+        alias="Idempotency-Key",
+        max_length=255,
+        description="Retries with the same key return the original response",
+    ),
+]
+
+
+def _booking_response(result: BookingResult) -> BookingResponse:
+    return BookingResponse(
+        **result.booking.to_dict(),
+        resource_name=result.resource_name,
+    )
+
+
+def _replay(stored: StoredResponse) -> dict:
+    """Return stored response, rejecting a key reused for another request."""
+    if not stored.same_request:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="Idempotency-Key was already used with a different request",
+        )
+    if stored.pending:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A request with this Idempotency-Key is in progress",
+        )
+    return stored.response
 
 
 @router.post(
@@ -24,21 +73,45 @@ router = APIRouter(tags=["Bookings"], prefix="/bookings")
         400: {"description": "Invalid time range or resource not available"},
         403: {"description": "Resource does not belong to your customer"},
         404: {"description": "Resource not found"},
+        409: {"description": "Request with this Idempotency-Key is in progress"},
+        422: {"description": "Idempotency-Key reused with a different request"},
     },
 )
 async def create_booking(
     data: BookingCreate,
     current_user: Annotated[User, Depends(security.get_current_user)],
     session: Annotated[AsyncSession, Depends(provider.get_session)],
+    idempotency_key: IdempotencyKeyHeader = None,
 ):
-    """Create a new booking with automatic conflict detection."""
-    # Verify customer exists
-    customer = await Customer.get(id=data.customer_id, session=session)
-    if not customer:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Customer not found",
+    """Create a new booking with automatic conflict detection.
+
+    Resource check, conflict check and inserts run as one statement; the
+    returned reason code is mapped to the HTTP error. With Idempotency-Key
+    the key is reserved first and its response is stored in the booking
+    transaction: a retry of a successful request (or a concurrent one, once
+    the first finishes) is answered from the stored response.
+    """
+    payload = data.model_dump(mode="json")
+    before_commit = None
+    if idempotency_key:
+        stored = await idempotency_service.reserve(
+            user_id=current_user.id,
+            scope=IdempotencyScope.BOOKING_CREATE,
+            key=idempotency_key,
+            payload=payload,
+            session=session,
         )
+        if stored:
+            return _replay(stored)
+
+        async def before_commit(result: BookingResult) -> None:
+            await idempotency_service.complete(
+                user_id=current_user.id,
+                scope=IdempotencyScope.BOOKING_CREATE,
+                key=idempotency_key,
+                response=_booking_response(result).model_dump(mode="json"),
+                session=session,
+            )
 
     # Validate time range
     if data.end_time <= data.start_time:
@@ -47,22 +120,8 @@ async def create_booking(
             detail="End time must be after start time",
         )
 
-    # Check if resource exists and belongs to customer
-    resource = await Resource.get(id=data.resource_id, session=session)
-    if not resource:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Resource not found",
-        )
-
-    if resource.customer_id != data.customer_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Resource does not belong to specified customer",
-        )
-
     # Create booking with conflict detection
-    booking = await booking_service.create_booking(
+    result = await booking_service.try_create_booking(
         params=BookingParams(
             user_id=current_user.id,
             customer_id=data.customer_id,
@@ -71,65 +130,162 @@ async def create_booking(
             end_time=data.end_time,
             source="api",
         ),
+        before_commit=before_commit,
         session=session,
     )
 
-    if not booking:
+    if result.reason == BookingFailureReason.RESOURCE_NOT_FOUND:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resource not found",
+        )
+    if result.reason == BookingFailureReason.WRONG_CUSTOMER:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Resource does not belong to specified customer",
+        )
+    if result.reason == BookingFailureReason.CLOSED:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Resource is closed at the selected time",
+        )
+    if not result.ok:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Resource is not available for the selected time",
         )
 
-    return BookingResponse(
-        **booking.to_dict(),
-        resource_name=resource.name,
+    return _booking_response(result)
+
+
+@router.post(
+    "/bulk",
+    response_model=list[BookingBulkItemResult],
+    summary="Create many bookings",
+    description="Create up to 500 bookings of one customer in one transaction. "
+    "Each item succeeds or fails on its own; failures carry a reason code",
+    responses={
+        200: {"description": "Per-item results in request order"},
+    },
+)
+async def create_bookings_bulk(
+    data: BookingBulkCreate,
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_session)],
+):
+    """Create many bookings with set-based conflict detection."""
+    results = await booking_service.create_bookings(
+        items=[
+            BookingParams(
+                user_id=current_user.id,
+                customer_id=data.customer_id,
+                resource_id=item.resource_id,
+                start_time=item.start_time,
+                end_time=item.end_time,
+                source="api",
+            )
+            for item in data.items
+        ],
+        session=session,
     )
+    return [
+        BookingBulkItemResult(
+            index=index,
+            booking=BookingResponse(
+                **result.booking.to_dict(),
+                resource_name=result.resource_name,
+            )
+            if result.ok
+            else None,
+            error=result.reason,
+        )
+        for index, result in enumerate(results)
+    ]
+
+
+class BookingListQueryParams:
+    """Query params for booking list; grouped to satisfy linting argument limit."""
+
+    def __init__(
+        self,
+        customer_id: UUID,
+        limit: Annotated[
+            int,
+            Query(ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+        ] = DEFAULT_PAGE_SIZE,
+        cursor: Annotated[
+            str | None,
+            Query(description="X-Next-Cursor of the previous page"),
+        ] = None,
+        since: Annotated[
+            datetime | None,
+            Query(description="Only bookings not yet ended at this moment"),
+        ] = None,
+    ):
+        self.customer_id = customer_id
+        self.limit = limit
+        self.cursor = cursor
+        self.since = since
 
 
 @router.get(
     "/",
     response_model=list[BookingResponse],
     summary="Get user's bookings",
-    description="Get all bookings for the current user within a customer",
+    description="Get bookings of the current user within a customer ordered by "
+    "start time, one page at a time. The X-Next-Cursor response header holds "
+    "the cursor of the next page and is absent on the last one",
     responses={
-        200: {"description": "List of bookings"},
-        400: {"description": "Missing required customer_id parameter"},
+        200: {"description": "Page of bookings"},
+        400: {"description": "Invalid cursor"},
         403: {"description": "Customer not found"},
     },
 )
 async def list_user_bookings(
-    customer_id: UUID,
+    params: Annotated[BookingListQueryParams, Depends()],
+    response: Response,
     current_user: Annotated[User, Depends(security.get_current_user)],
     session: Annotated[AsyncSession, Depends(provider.get_session)],
 ):
-    """Get all bookings for the current user."""
+    """Get a page of bookings for the current user."""
     # Verify customer exists
-    customer = await Customer.get(id=customer_id, session=session)
+    customer = await Customer.get(id=params.customer_id, session=session)
     if not customer:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Customer not found",
         )
 
-    # Get all bookings for user in this customer
-    bookings = await booking_service.get_user_bookings(
-        user_id=current_user.id,
-        customer_id=customer_id,
-        session=session,
-    )
+    try:
+        page = await booking_service.get_user_bookings(
+            user_id=current_user.id,
+            customer_id=params.customer_id,
+            limit=params.limit,
+            cursor=params.cursor,
+            since=params.since,
+            session=session,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
 
     # Enrich with resource names
-    result = []
-    for booking in bookings:
-        resource = await Resource.get(id=booking.resource_id, session=session)
-        result.append(
-            BookingResponse(
-                **booking.to_dict(),
-                resource_name=resource.name if resource else None,
-            ),
+    resources = await Resource.get_by_id_list(
+        id_list=sorted({booking.resource_id for booking in page.items}),
+        session=session,
+    )
+    resource_name_by_id = {resource.id: resource.name for resource in resources}
+    return [
+        BookingResponse(
+            **booking.to_dict(),
+            resource_name=resource_name_by_id.get(booking.resource_id),
         )
-
-    return result
+        for booking in page.items
+    ]
 
 
 @router.delete(
@@ -140,14 +296,45 @@ async def list_user_bookings(
         200: {"description": "Booking cancelled successfully"},
         403: {"description": "Booking does not belong to you"},
         404: {"description": "Booking not found"},
+        409: {"description": "Request with this Idempotency-Key is in progress"},
+        422: {"description": "Idempotency-Key reused with a different request"},
     },
 )
 async def cancel_booking(
     booking_id: int,
     current_user: Annotated[User, Depends(security.get_current_user)],
     session: Annotated[AsyncSession, Depends(provider.get_session)],
+    idempotency_key: IdempotencyKeyHeader = None,
 ):
-    """Cancel (delete) a booking."""
+    """Cancel (delete) a booking.
+
+    With Idempotency-Key a retry after success returns the original
+    response instead of 404 for the already deleted booking; the response
+    is stored in the transaction that deletes the booking.
+    """
+    payload = {"booking_id": booking_id}
+    response = {"message": "Booking cancelled successfully"}
+    before_commit = None
+    if idempotency_key:
+        stored = await idempotency_service.reserve(
+            user_id=current_user.id,
+            scope=IdempotencyScope.BOOKING_CANCEL,
+            key=idempotency_key,
+            payload=payload,
+            session=session,
+        )
+        if stored:
+            return _replay(stored)
+
+        async def before_commit() -> None:
+            await idempotency_service.complete(
+                user_id=current_user.id,
+                scope=IdempotencyScope.BOOKING_CANCEL,
+                key=idempotency_key,
+                response=response,
+                session=session,
+            )
+
     # Check if booking exists first
     booking = await Booking.get(id=booking_id, session=session)
     if not booking:
@@ -161,6 +348,7 @@ async def cancel_booking(
         booking_id=booking_id,
         user_id=current_user.id,
         source="api",
+        before_commit=before_commit,
         session=session,
     )
 
@@ -170,4 +358,4 @@ async def cancel_booking(
             detail="Booking does not belong to you",
         )
 
-    return {"message": "Booking cancelled successfully"}
+    return response
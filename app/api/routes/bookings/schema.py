@@ -3,6 +3,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.domain.services.bookings import MAX_BULK_BOOKINGS
+
 
 class BookingCreate(BaseModel):
     """Schema for creating a new booking."""
@@ -16,6 +18,29 @@ class BookingCreate(BaseModel):
     end_time: datetime = Field(..., description="Booking end time (ISO format)")
 
 
+class BookingBulkItem(BaseModel):
+    """One booking of a bulk create request."""
+
+    resource_id: int = Field(..., description="ID of the resource to book")
+    start_time: datetime = Field(..., description="Booking start time (ISO format)")
+    end_time: datetime = Field(..., description="Booking end time (ISO format)")
+
+
+class BookingBulkCreate(BaseModel):
+    """Schema for creating many bookings at once."""
+
+    customer_id: UUID = Field(
+        ...,
+        description="ID of the customer who owns the resources",
+    )
+    items: list[BookingBulkItem] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_BOOKINGS,
+        description="Bookings to create",
+    )
+
+
 class BookingResponse(BaseModel):
     """Schema for booking response."""
 
@@ -34,3 +59,62 @@ class BookingListResponse(BaseModel):
     """Schema for booking list response."""
 
     bookings: list[BookingResponse]
+
+
+class BookingBulkItemResult(BaseModel):
+    """Outcome of one item of a bulk create request."""
+
+    index: int = Field(..., description="Position of the item in the request")
+    booking: BookingResponse | None = None
+    error: str | None = Field(
+        None,
+        description="Failure reason code: invalid_time, resource_not_found, "
+        "wrong_customer, closed, not_available or batch_conflict",
+    )
+
+
+class SeriesCreate(BaseModel):
+    """Schema for creating a recurring booking series."""
+
+    customer_id: UUID = Field(
+        ...,
+        description="ID of the customer who owns the resource",
+    )
+    resource_id: int = Field(..., description="ID of the resource to book")
+    start_time: datetime = Field(..., description="First occurrence start time")
+    end_time: datetime = Field(..., description="First occurrence end time")
+    rrule: str = Field(
+        ...,
+        max_length=255,
+        description="RRULE with FREQ=DAILY|WEEKLY, INTERVAL, BYDAY, COUNT or "
+        "UNTIL, e.g. FREQ=WEEKLY;BYDAY=TU;UNTIL=20270418",
+    )
+    timezone: str = Field(
+        "UTC",
+        max_length=64,
+        description="IANA timezone in which the local time of day repeats",
+    )
+
+
+class SeriesUpdate(BaseModel):
+    """Schema for changing a series; applies to future occurrences only."""
+
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    rrule: str | None = Field(None, max_length=255)
+    timezone: str | None = Field(None, max_length=64)
+
+
+class SeriesResponse(BaseModel):
+    """Schema for series response with its newly created occurrences."""
+
+    id: int
+    user_id: UUID
+    resource_id: int
+    start_time: datetime
+    end_time: datetime
+    rrule: str
+    timezone: str
+    bookings: list[BookingResponse] = Field(default_factory=list)
+
+    model_config = {"from_attributes": True}
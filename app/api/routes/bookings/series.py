@@ -0,0 +1,166 @@
+"""Recurring booking series: /api/bookings/series."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api.security import security
+from app.depends import AsyncSession, provider
+from app.domain.services.bookings import (
+    BookingFailureReason,
+    SeriesParams,
+    SeriesResult,
+    SeriesUpdate,
+    booking_service,
+)
+from app.infrastructure.database import User
+
+from .schema import (
+    BookingResponse,
+    SeriesCreate,
+    SeriesResponse,
+    SeriesUpdate as SeriesUpdateSchema,
+)
+
+router = APIRouter(prefix="/series")
+
+
+def _series_response(result: SeriesResult) -> SeriesResponse:
+    """Map a series result to the response or raise the matching HTTP error."""
+    if result.reason == BookingFailureReason.RESOURCE_NOT_FOUND:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resource not found",
+        )
+    if result.reason == BookingFailureReason.WRONG_CUSTOMER:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Resource does not belong to specified customer",
+        )
+    if result.reason == BookingFailureReason.INVALID_TIME:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid time range",
+        )
+    if not result.ok:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "message": "Resource is not available for some occurrences",
+                "conflicts": [start.isoformat() for start in result.conflicts],
+            },
+        )
+
+    series = result.series
+    return SeriesResponse(
+        **series.to_dict(),
+        bookings=[BookingResponse(**b.to_dict()) for b in result.bookings],
+    )
+
+
+@router.post(
+    "/",
+    response_model=SeriesResponse,
+    summary="Create a recurring booking series",
+    description="Create a series and all its occurrences, or nothing if any "
+    "occurrence conflicts with existing bookings",
+    responses={
+        400: {"description": "Invalid rule or time range, or conflicts"},
+        403: {"description": "Resource does not belong to your customer"},
+        404: {"description": "Resource not found"},
+    },
+)
+async def create_series(
+    data: SeriesCreate,
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_session)],
+):
+    """Create a recurring booking series."""
+    try:
+        result = await booking_service.create_series(
+            params=SeriesParams(
+                user_id=current_user.id,
+                customer_id=data.customer_id,
+                resource_id=data.resource_id,
+                start_time=data.start_time,
+                end_time=data.end_time,
+                rrule=data.rrule,
+                timezone=data.timezone,
+                source="api",
+            ),
+            session=session,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    return _series_response(result)
+
+
+@router.patch(
+    "/{series_id}",
+    response_model=SeriesResponse,
+    summary="Update a recurring booking series",
+    description="Change time, rule or timezone. Past occurrences are kept; "
+    "future ones are re-created from the updated rule",
+    responses={
+        400: {"description": "Invalid rule or time range, or conflicts"},
+        404: {"description": "Series not found"},
+    },
+)
+async def update_series(
+    series_id: int,
+    data: SeriesUpdateSchema,
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_session)],
+):
+    """Update future occurrences of a series."""
+    try:
+        result = await booking_service.update_series(
+            series_id=series_id,
+            user_id=current_user.id,
+            changes=SeriesUpdate(**data.model_dump()),
+            source="api",
+            session=session,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Series not found",
+        )
+    return _series_response(result)
+
+
+@router.delete(
+    "/{series_id}",
+    summary="Cancel a recurring booking series",
+    description="Delete future occurrences; past ones are kept",
+    responses={
+        200: {"description": "Series cancelled successfully"},
+        404: {"description": "Series not found"},
+    },
+)
+async def cancel_series(
+    series_id: int,
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_session)],
+):
+    """Cancel future occurrences of a series."""
+    success = await booking_service.cancel_series(
+        series_id=series_id,
+        user_id=current_user.id,
+        source="api",
+        session=session,
+    )
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Series not found",
+        )
+    return {"message": "Series cancelled successfully"}
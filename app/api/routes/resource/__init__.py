@@ -7,14 +7,23 @@ Structure:
                GET    /api/resources/{id}  - get resource details
 - update.py  - PATCH  /api/resources/{id}  - partial update
 - delete.py  - DELETE /api/resources/{id}  - delete resource
+- free_slots.py - GET  /api/resources/{id}/free_slots        - free slots
+                  GET  /api/resources/{id}/free_slots/stream - NDJSON, multi-day
+                  POST /api/resources/free_slots             - many resources
+- earliest_slot.py - GET /api/resources/free_slots/earliest - first fitting slot
+- schedule.py - GET/PUT /api/resources/{id}/hours        - opening hours
+                GET/POST /api/resources/{id}/blackouts   - blackouts
+                DELETE /api/resources/{id}/blackouts/{blackout_id}
 """
 
 from fastapi import APIRouter
 
 from .create import router as create_router
 from .delete import router as delete_router
+from .earliest_slot import router as earliest_slot_router
 from .free_slots import router as free_slots_router
 from .read import router as read_router
+from .schedule import router as schedule_router
 from .update import router as update_router
 
 router = APIRouter(prefix="/resources", tags=["Resource"])
@@ -23,5 +32,7 @@ router = APIRouter(prefix="/resources", tags=["Resource"])
 router.include_router(create_router)
 router.include_router(read_router)
 router.include_router(free_slots_router)
+router.include_router(earliest_slot_router)
+router.include_router(schedule_router)
 router.include_router(update_router)
 router.include_router(delete_router)
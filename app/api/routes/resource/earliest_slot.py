@@ -0,0 +1,88 @@
+"""GET /api/resources/free_slots/earliest - earliest free slot on any resource."""
+
+from datetime import datetime, timedelta
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.api.security import security
+from app.depends import AsyncSession, provider
+from app.domain.services.resource import resource_service
+from app.infrastructure.database.models.users import User
+
+from .schema import EarliestSlotResponse
+
+router = APIRouter()
+
+
+class EarliestSlotQueryParams:
+    """Query params for earliest slot; grouped to satisfy linting argument limit."""
+
+    def __init__(
+        self,
+        duration: Annotated[
+            int,
+            Query(..., gt=0, description="Required duration in seconds"),
+        ],
+        horizon_days: Annotated[
+            int,
+            Query(ge=1, le=366, description="How many days ahead to search"),
+        ] = 7,
+        customer_id: Annotated[
+            UUID | None,
+            Query(description="Customer ID. If not provided, uses user's customer."),
+        ] = None,
+        start: Annotated[
+            datetime | None,
+            Query(description="Search from this moment (defaults to now)"),
+        ] = None,
+    ):
+        self.duration = duration
+        self.horizon_days = horizon_days
+        self.customer_id = customer_id
+        self.start = start
+
+
+@router.get(
+    "/free_slots/earliest",
+    response_model=EarliestSlotResponse,
+    summary="Find the earliest free slot across customer resources",
+)
+async def get_earliest_slot(
+    params: Annotated[EarliestSlotQueryParams, Depends()],
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_session)],
+):
+    """Return the first interval of the given duration free on any resource.
+
+    Searches resources of the customer where user is member, admin or owner.
+    If customer_id is not provided, uses the user's customer.
+    """
+    try:
+        slot = await resource_service.find_earliest_slot(
+            current_user=current_user,
+            duration=params.duration,
+            horizon=timedelta(days=params.horizon_days),
+            customer_id=params.customer_id,
+            start=params.start,
+            session=session,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    if slot is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No free slot found within horizon or access denied",
+        )
+
+    return EarliestSlotResponse(
+        resource_id=slot.resource_id,
+        resource_name=slot.resource_name,
+        start_time=slot.start,
+        end_time=slot.end,
+    )
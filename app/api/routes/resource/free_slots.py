@@ -1,19 +1,25 @@
 """
-GET /api/resources/{resource_id}/free_slots - list free slots for resource.
+GET  /api/resources/{resource_id}/free_slots        - list free slots for resource.
+GET  /api/resources/{resource_id}/free_slots/stream - NDJSON stream, up to a year.
+POST /api/resources/free_slots                      - free slots for many resources.
 
 Supports two modes:
 - By interval: start, end, slot. For the day containing "now", slots start from
-  current time; for future days, full day is considered.
+  the first slot boundary (counted from start) after current time; for future
+  days, full day is considered.
 - By day: date, slot. Slots for that single day (UTC). If date is today,
-  slots start from current time; otherwise for the whole day.
+  slots start from the first slot boundary after current time; otherwise for
+  the whole day. Whole-day results are cached per (resource, day, slot).
 """
 
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta, timezone
-from typing import Annotated
+import json
+from typing import TYPE_CHECKING, Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 from app.api.security import security
 from app.depends import AsyncSession, provider
@@ -21,10 +27,20 @@ from app.domain.services.resource import resource_service
 from app.domain.services.resource.resource import FreeSlotsParams
 from app.infrastructure.database.models.users import User  # noqa: TC001
 
-from .schema import FreeSlotResponse
+from .schema import (
+    FreeSlotResponse,
+    FreeSlotsBatchRequest,
+    ResourceFreeSlotsResponse,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 router = APIRouter()
 
+# Slots serialized per chunk of the NDJSON stream
+STREAM_CHUNK_SLOTS = 500
+
 
 def _day_bounds_utc(d: date) -> tuple[datetime, datetime]:
     """Return (start_of_day_utc, end_of_day_utc) for the given date."""
@@ -33,6 +49,27 @@ def _day_bounds_utc(d: date) -> tuple[datetime, datetime]:
     return start, end
 
 
+def _resolve_interval(
+    start: datetime | None,
+    end: datetime | None,
+    day: date | None,
+) -> tuple[datetime, datetime]:
+    """Return (start, end) from either date or start+end, 400 otherwise."""
+    if day is not None:
+        if start is not None or end is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Use either date or start+end, not both",
+            )
+        return _day_bounds_utc(day)
+    if start is None or end is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide start and end, or date",
+        )
+    return start, end
+
+
 class FreeSlotsQueryParams:
     """Query params for free slots; grouped to satisfy linting argument limit."""
 
@@ -74,21 +111,7 @@ async def get_free_slots(
     current_user: Annotated[User, Depends(security.get_current_user)],
     session: Annotated[AsyncSession, Depends(provider.get_session)],
 ):
-    if params.date is not None:
-        if params.start is not None or params.end is not None:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Use either date or start+end, not both",
-            )
-        start, end = _day_bounds_utc(params.date)
-    else:
-        if params.start is None or params.end is None:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Provide start and end, or date",
-            )
-        start = params.start
-        end = params.end
+    start, end = _resolve_interval(params.start, params.end, params.date)
 
     try:
         slots = await resource_service.get_free_slots(
@@ -110,3 +133,108 @@ async def get_free_slots(
         )
 
     return [FreeSlotResponse(start_time=s, end_time=e) for (s, e) in slots]
+
+
+async def _ndjson_chunks(
+    slots: AsyncIterator[tuple[datetime, datetime]],
+) -> AsyncIterator[str]:
+    """Serialize slots as NDJSON lines, STREAM_CHUNK_SLOTS per chunk."""
+    lines: list[str] = []
+    async for start, end in slots:
+        lines.append(
+            json.dumps(
+                {"start_time": start.isoformat(), "end_time": end.isoformat()},
+            ),
+        )
+        if len(lines) >= STREAM_CHUNK_SLOTS:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+@router.get(
+    "/{resource_id}/free_slots/stream",
+    summary="Stream free slots for resource (multi-day)",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": "One FreeSlotResponse JSON object per line",
+        },
+    },
+)
+async def stream_free_slots(
+    resource_id: int,
+    params: Annotated[FreeSlotsQueryParams, Depends()],
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_session)],
+):
+    """Free slots for week/month views as newline-delimited JSON.
+
+    Same params as the list endpoint, but the interval may span up to a year.
+    Slots are produced while bookings are read, so memory stays flat.
+    """
+    start, end = _resolve_interval(params.start, params.end, params.date)
+
+    try:
+        slots = await resource_service.stream_free_slots(
+            resource_id=resource_id,
+            current_user=current_user,
+            params=FreeSlotsParams(start=start, end=end, slot=params.slot),
+            session=session,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    if slots is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resource not found or access denied",
+        )
+
+    return StreamingResponse(
+        _ndjson_chunks(slots),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.post(
+    "/free_slots",
+    response_model=list[ResourceFreeSlotsResponse],
+    summary="Get free slots for several resources",
+)
+async def get_free_slots_batch(
+    data: FreeSlotsBatchRequest,
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_session)],
+):
+    """Free slots for many resources with one interval and slot size.
+
+    Resources that are not found or not accessible are omitted from the result.
+    """
+    start, end = _resolve_interval(data.start, data.end, data.date)
+
+    try:
+        slots_by_resource = await resource_service.get_free_slots_batch(
+            resource_ids=data.resource_ids,
+            current_user=current_user,
+            params=FreeSlotsParams(start=start, end=end, slot=data.slot),
+            session=session,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    return [
+        ResourceFreeSlotsResponse(
+            resource_id=resource_id,
+            slots=[FreeSlotResponse(start_time=s, end_time=e) for (s, e) in slots],
+        )
+        for resource_id, slots in slots_by_resource.items()
+    ]
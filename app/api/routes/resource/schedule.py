@@ -0,0 +1,167 @@
+"""Opening hours and blackouts of a resource."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api.security import security
+from app.depends import AsyncSession, provider
+from app.domain.services.resource import resource_service
+from app.infrastructure.database.models.users import User
+
+from .schema import (
+    BlackoutCreate,
+    BlackoutResponse,
+    OpeningHoursItem,
+    OpeningHoursUpdate,
+)
+
+router = APIRouter()
+
+
+def _not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Resource not found or access denied",
+    )
+
+
+@router.get(
+    "/{resource_id}/hours",
+    response_model=list[OpeningHoursItem],
+    summary="Get opening hours of resource",
+)
+async def get_hours(
+    resource_id: int,
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_session)],
+):
+    """Get opening hours in the resource timezone.
+
+    Empty list means the resource is open around the clock.
+    """
+    hours = await resource_service.get_hours(
+        resource_id=resource_id,
+        current_user=current_user,
+        session=session,
+    )
+    if hours is None:
+        raise _not_found()
+    return hours
+
+
+@router.put(
+    "/{resource_id}/hours",
+    response_model=list[OpeningHoursItem],
+    summary="Replace opening hours of resource",
+)
+async def set_hours(
+    resource_id: int,
+    hours_in: OpeningHoursUpdate,
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_session)],
+):
+    """Replace opening hours of the resource.
+
+    Weekdays without hours are closed. Bookings already made outside the
+    new hours are kept. Invalid or overlapping hours are rejected with 400.
+    """
+    try:
+        hours = await resource_service.set_hours(
+            resource_id=resource_id,
+            current_user=current_user,
+            hours=[
+                (item.weekday, item.open_minute, item.close_minute)
+                for item in hours_in.hours
+            ],
+            session=session,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    if hours is None:
+        raise _not_found()
+    return hours
+
+
+@router.get(
+    "/{resource_id}/blackouts",
+    response_model=list[BlackoutResponse],
+    summary="List current and upcoming blackouts of resource",
+)
+async def get_blackouts(
+    resource_id: int,
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_session)],
+):
+    """List blackouts of the resource that have not ended yet."""
+    blackouts = await resource_service.get_blackouts(
+        resource_id=resource_id,
+        current_user=current_user,
+        session=session,
+    )
+    if blackouts is None:
+        raise _not_found()
+    return blackouts
+
+
+@router.post(
+    "/{resource_id}/blackouts",
+    response_model=BlackoutResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Close resource for a period",
+)
+async def add_blackout(
+    resource_id: int,
+    blackout_in: BlackoutCreate,
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_session)],
+):
+    """Close the resource for [start_time, end_time).
+
+    Bookings already made in the period are kept.
+    """
+    try:
+        blackout = await resource_service.add_blackout(
+            resource_id=resource_id,
+            current_user=current_user,
+            start=blackout_in.start_time,
+            end=blackout_in.end_time,
+            reason=blackout_in.reason,
+            session=session,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    if blackout is None:
+        raise _not_found()
+    return blackout
+
+
+@router.delete(
+    "/{resource_id}/blackouts/{blackout_id}",
+    summary="Delete a blackout",
+)
+async def delete_blackout(
+    resource_id: int,
+    blackout_id: int,
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_session)],
+):
+    """Delete a blackout, opening the resource for the period again."""
+    success = await resource_service.delete_blackout(
+        resource_id=resource_id,
+        blackout_id=blackout_id,
+        current_user=current_user,
+        session=session,
+    )
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Blackout not found or access denied",
+        )
+    return {"ok": True}
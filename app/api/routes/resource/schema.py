@@ -1,6 +1,9 @@
 """Pydantic schemas for resource operations."""
 
-from datetime import datetime
+from datetime import (
+    date as datetime_date,
+    datetime,
+)
 import uuid
 
 from pydantic import BaseModel, Field
@@ -19,12 +22,33 @@ class ResourceCreate(BaseModel):
         max_length=255,
         description="Resource name",
     )
+    capacity: int = Field(
+        1,
+        ge=1,
+        description="Number of concurrent bookings (seats, desks, units)",
+    )
 
 
 class ResourceUpdate(BaseModel):
     """Schema for partial resource update (PATCH /api/resources/{id})."""
 
     name: str | None = Field(None, min_length=1, max_length=255)
+    capacity: int | None = Field(None, ge=1)
+    timezone: str | None = Field(
+        None,
+        max_length=64,
+        description="IANA timezone of opening hours, e.g. Europe/Moscow",
+    )
+    buffer_before: int | None = Field(
+        None,
+        ge=0,
+        description="Setup time before each booking, seconds",
+    )
+    buffer_after: int | None = Field(
+        None,
+        ge=0,
+        description="Turnaround time after each booking, seconds",
+    )
 
 
 class ResourceResponse(BaseModel):
@@ -33,6 +57,10 @@ class ResourceResponse(BaseModel):
     id: int
     customer_id: uuid.UUID
     name: str
+    capacity: int
+    timezone: str
+    buffer_before: int
+    buffer_after: int
     created_at: datetime
 
     class Config:
@@ -44,3 +72,95 @@ class FreeSlotResponse(BaseModel):
 
     start_time: datetime = Field(..., description="Slot start time (ISO format)")
     end_time: datetime = Field(..., description="Slot end time (ISO format)")
+
+
+class FreeSlotsBatchRequest(BaseModel):
+    """Request schema for free slots of several resources (POST .../free_slots)."""
+
+    resource_ids: list[int] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Resource IDs",
+    )
+    slot: int = Field(..., gt=0, description="Slot size in seconds")
+    start: datetime | None = Field(
+        None,
+        description="Interval start (ISO datetime with timezone)",
+    )
+    end: datetime | None = Field(
+        None,
+        description="Interval end (ISO datetime with timezone)",
+    )
+    date: datetime_date | None = Field(
+        None,
+        description="Slots for this single day (UTC). Use date or start+end.",
+    )
+
+
+class ResourceFreeSlotsResponse(BaseModel):
+    """Free slots of one resource in a batch response."""
+
+    resource_id: int
+    slots: list[FreeSlotResponse]
+
+
+class EarliestSlotResponse(BaseModel):
+    """Earliest free slot found across resources of a customer."""
+
+    resource_id: int
+    resource_name: str
+    start_time: datetime = Field(..., description="Slot start time (ISO format)")
+    end_time: datetime = Field(..., description="Slot end time (ISO format)")
+
+
+class OpeningHoursItem(BaseModel):
+    """Opening hours of one weekday interval, in the resource timezone."""
+
+    weekday: int = Field(..., ge=0, le=6, description="Monday = 0, Sunday = 6")
+    open_minute: int = Field(
+        ...,
+        ge=0,
+        lt=1440,
+        description="Opening, minutes from local midnight",
+    )
+    close_minute: int = Field(
+        ...,
+        gt=0,
+        le=1440,
+        description="Closing, minutes from local midnight (1440 - end of day)",
+    )
+
+    class Config:
+        from_attributes = True
+
+
+class OpeningHoursUpdate(BaseModel):
+    """Schema for replacing opening hours (PUT .../hours).
+
+    Empty list makes the resource open around the clock.
+    """
+
+    hours: list[OpeningHoursItem] = Field(..., max_length=7 * 24)
+
+
+class BlackoutCreate(BaseModel):
+    """Schema for closing a resource for a period (POST .../blackouts)."""
+
+    start_time: datetime = Field(..., description="Start (ISO datetime with timezone)")
+    end_time: datetime = Field(..., description="End (ISO datetime with timezone)")
+    reason: str | None = Field(None, max_length=255)
+
+
+class BlackoutResponse(BaseModel):
+    """Response schema with blackout data."""
+
+    id: int
+    resource_id: int
+    start_time: datetime
+    end_time: datetime
+    reason: str | None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -28,16 +28,24 @@ async def update_resource(
     """Update resource data (partial update).
 
     User must be owner or admin of the customer that owns this resource.
-    Only provided fields will be updated.
+    Only provided fields will be updated. Lowering capacity below the
+    number of concurrent future bookings is rejected with 400. Buffers
+    apply to new bookings only.
     """
     update_data = resource_in.model_dump(exclude_unset=True)
 
-    resource = await resource_service.update_resource(
-        resource_id=resource_id,
-        current_user=current_user,
-        session=session,
-        **update_data,
-    )
+    try:
+        resource = await resource_service.update_resource(
+            resource_id=resource_id,
+            current_user=current_user,
+            session=session,
+            **update_data,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
 
     if resource is None:
         raise HTTPException(
@@ -1,25 +1,41 @@
-# ruff: noqa: RUF001, PLR0915
+# ruff: noqa: RUF001, PLR0911, PLR0915
 """Handlers for creating bookings."""
 
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from uuid import UUID
+
 from aiogram import Router, types
 from aiogram.fsm.context import FSMContext
 
 from app.bot.fsm.booking_states import BookingStates
 from app.bot.handler import handler
 from app.bot.keyboards.main_menu import get_main_menu
-from app.domain.services.bookings import BookingParams, booking_service
+from app.depends import AsyncSession
+from app.domain.services.bookings import (
+    BookingFailureReason,
+    BookingParams,
+    BookingResult,
+    IdempotencyScope,
+    booking_service,
+    idempotency_service,
+)
 from app.domain.services.resource import resource_service
+from app.domain.services.resource.holds import HOLD_TTL_SECONDS
+from app.domain.services.resource.resource import MAX_INTERVAL, FreeSlotsParams
 from app.infrastructure.database import Resource
 from app.infrastructure.database.models.users import User
 
 from .helpers import (
-    format_bookings_list,
+    SLOT_SECONDS,
     format_dt,
     get_customer_id,
     get_status_emoji,
+    hold_inline,
     main_back_inline,
     parse_period,
     resources_inline,
+    slots_inline,
 )
 
 
@@ -68,30 +84,82 @@ def get_create_router() -> Router:
             await callback.answer("Ресурс не найден")
             return
 
-        # Get existing bookings for this resource
-        existing_bookings = await booking_service.get_resource_bookings(
-            resource_id=resource_id,
-        )
-        bookings_text = format_bookings_list(existing_bookings)
-
+        slots = await _offered_slots(resource_id, customer_id)
         await state.update_data(resource_id=resource_id)
         await state.set_state(BookingStates.time)
         await callback.message.edit_text(
             f"Выбран ресурс: *{resource.name}*\n\n"
-            f"{bookings_text}\n\n"
-            "Введите дату и время в формате:\n"
+            f"{_slots_text(slots)}\n\n"
+            "Или введите дату и время в формате:\n"
             "`26.01.2026 10:00-12:00`\n"
             "или\n"
             "`2026-01-26 10:00-12:00`",
             parse_mode="Markdown",
-            reply_markup=main_back_inline(),
+            reply_markup=slots_inline(resource_id, slots),
+        )
+        await callback.answer()
+
+    @router.callback_query(lambda c: c.data and c.data.startswith("slot:hold:"))
+    @handler
+    async def pick_slot(callback: types.CallbackQuery, state: FSMContext, user: User):
+        """Hold the chosen free slot until the user confirms it."""
+        try:
+            _, _, resource_id_str, start_str, end_str = callback.data.split(":")
+            resource_id = int(resource_id_str)
+            start_time = datetime.fromtimestamp(int(start_str), tz=timezone.utc)
+            end_time = datetime.fromtimestamp(int(end_str), tz=timezone.utc)
+        except ValueError:
+            await callback.answer("Некорректный слот")
+            return
+
+        customer_id = await get_customer_id(callback.bot.id)
+        result = await booking_service.place_hold(
+            params=BookingParams(
+                user_id=user.id,
+                customer_id=customer_id,
+                resource_id=resource_id,
+                start_time=start_time,
+                end_time=end_time,
+                source="bot",
+            ),
+        )
+        if not result.ok:
+            # Taken since the list was shown: offer the current free slots
+            slots = await _offered_slots(resource_id, customer_id)
+            await callback.message.edit_reply_markup(
+                reply_markup=slots_inline(resource_id, slots),
+            )
+            await callback.answer(
+                "Этот слот уже занят, выберите другой.",
+                show_alert=True,
+            )
+            return
+
+        await state.clear()
+        await callback.message.edit_text(
+            f"⏳ *Время удержано за вами на {HOLD_TTL_SECONDS // 60} мин.*\n\n"
+            f"- Ресурс: `{resource_id}`\n"
+            f"- С: {format_dt(start_time)}\n"
+            f"- По: {format_dt(end_time)}\n\n"
+            "Подтвердите бронирование.",
+            parse_mode="Markdown",
+            reply_markup=hold_inline(result.hold.id),
         )
         await callback.answer()
 
     @router.message(BookingStates.time)
     @handler
-    async def receive_period(message: types.Message, state: FSMContext, user: User):
-        """Handle time period input and create booking."""
+    async def receive_period(
+        message: types.Message,
+        state: FSMContext,
+        user: User,
+        session: AsyncSession,
+    ):
+        """Handle time period input and create the booking.
+
+        A redelivered update carries the same message, so the booking is
+        created once and a retry replays the stored result.
+        """
         data = await state.get_data()
         resource_id = data.get("resource_id")
         if not resource_id:
@@ -110,42 +178,83 @@ def get_create_router() -> Router:
             )
             return
         start_time, end_time = parsed
-
+        resource_id = int(resource_id)
         customer_id = await get_customer_id(message.bot.id)
 
-        # Check availability
-        is_available = await booking_service.check_availability(
-            resource_id=int(resource_id),
-            start_time=start_time,
-            end_time=end_time,
-        )
-
-        if not is_available:
-            # Get existing bookings to show what's already booked
-            existing_bookings = await booking_service.get_resource_bookings(
-                resource_id=int(resource_id),
-            )
-            bookings_text = format_bookings_list(existing_bookings)
-
+        async def answer_busy() -> None:
+            slots = await _offered_slots(resource_id, customer_id)
             status_emoji = get_status_emoji(False)
             await message.answer(
-                f"{status_emoji} *Ресурс занят на выбранное время*\n\n"
+                f"{status_emoji} *Ресурс занят или закрыт на выбранное время*\n\n"
                 f"Интервал: {format_dt(start_time)} – {format_dt(end_time)}\n\n"
-                f"{bookings_text}\n\n"
-                "Попробуйте выбрать другой день или время.",
+                f"{_slots_text(slots)}",
                 parse_mode="Markdown",
+                reply_markup=slots_inline(resource_id, slots),
             )
-            return
 
-        params = BookingParams(
-            user_id=user.id,
-            customer_id=customer_id,
-            resource_id=int(resource_id),
+        # Quick in-memory pre-check: a busy interval needs no key and no insert
+        if start_time < end_time and not await booking_service.check_availability(
+            resource_id=resource_id,
             start_time=start_time,
             end_time=end_time,
+            use_index=True,
+            user_id=user.id,
+            session=session,
+        ):
+            await answer_busy()
+            return
+
+        idempotency_key = f"tg:{message.chat.id}:{message.message_id}"
+        stored = await idempotency_service.reserve(
+            user_id=user.id,
+            scope=IdempotencyScope.BOOKING_CREATE,
+            key=idempotency_key,
+            payload={"text": message.text},
+            session=session,
         )
-        booking = await booking_service.create_booking(params=params)
-        if not booking:
+        if stored and stored.pending:
+            await message.answer("Бронирование уже создаётся, подождите.")
+            return
+        if stored:
+            await state.clear()
+            await answer_booking_created(message, **stored.response)
+            return
+
+        async def before_commit(result: BookingResult) -> None:
+            await idempotency_service.complete(
+                user_id=user.id,
+                scope=IdempotencyScope.BOOKING_CREATE,
+                key=idempotency_key,
+                response=_created_response(result),
+                session=session,
+            )
+
+        result = await booking_service.try_create_booking(
+            params=BookingParams(
+                user_id=user.id,
+                customer_id=customer_id,
+                resource_id=resource_id,
+                start_time=start_time,
+                end_time=end_time,
+                source="bot",
+            ),
+            before_commit=before_commit,
+            session=session,
+        )
+        if not result.ok:
+            # Release the key reservation so the user can retry
+            await session.rollback()
+
+        if result.reason == BookingFailureReason.NOT_AVAILABLE:
+            await answer_busy()
+            return
+        if result.reason == BookingFailureReason.CLOSED:
+            await message.answer(
+                "Ресурс закрыт в это время (нерабочие часы или перерыв). "
+                "Попробуйте другой интервал.",
+            )
+            return
+        if not result.ok:
             msg = (
                 "Не удалось создать бронирование "
                 "(время занято или введены некорректные даты). "
@@ -155,14 +264,143 @@ def get_create_router() -> Router:
             return
 
         await state.clear()
-        status_emoji = get_status_emoji(True)
-        await message.answer(
-            f"{status_emoji} *Бронирование успешно создано!*\n\n"
-            f"- Ресурс: `{params.resource_id}`\n"
-            f"- С: {format_dt(params.start_time)}\n"
-            f"- По: {format_dt(params.end_time)}",
-            parse_mode="Markdown",
-            reply_markup=get_main_menu(),
+        await answer_booking_created(message, **_created_response(result))
+
+    @router.callback_query(lambda c: c.data and c.data.startswith("hold:confirm:"))
+    @handler
+    async def confirm_hold(
+        callback: types.CallbackQuery,
+        user: User,
+        session: AsyncSession,
+    ):
+        """Turn the held interval into a booking.
+
+        A redelivered callback comes from the same message, so the booking
+        is created once and a retry replays the stored result. The key is
+        reserved first and its result is stored in the booking transaction.
+        """
+        _, _, hold_id = callback.data.split(":", 2)
+        idempotency_key = f"tg:{callback.message.chat.id}:{callback.message.message_id}"
+        payload = {"hold_id": hold_id}
+        stored = await idempotency_service.reserve(
+            user_id=user.id,
+            scope=IdempotencyScope.BOOKING_CREATE,
+            key=idempotency_key,
+            payload=payload,
+            session=session,
         )
+        if stored and stored.pending:
+            await callback.answer("Бронирование уже создаётся")
+            return
+        if stored:
+            await callback.answer()
+            await answer_booking_created(callback.message, **stored.response)
+            return
+
+        async def before_commit(result: BookingResult) -> None:
+            await idempotency_service.complete(
+                user_id=user.id,
+                scope=IdempotencyScope.BOOKING_CREATE,
+                key=idempotency_key,
+                response=_created_response(result),
+                session=session,
+            )
+
+        customer_id = await get_customer_id(callback.bot.id)
+        result = await booking_service.confirm_hold(
+            hold_id=hold_id,
+            user_id=user.id,
+            customer_id=customer_id,
+            before_commit=before_commit,
+            session=session,
+        )
+        if not result.ok:
+            # Release the key reservation so the user can retry
+            await session.rollback()
+        if result.reason == BookingFailureReason.HOLD_EXPIRED:
+            await callback.message.edit_text(
+                "Время удержания истекло. Выберите интервал заново.",
+                reply_markup=main_back_inline(),
+            )
+            await callback.answer()
+            return
+        if not result.ok:
+            await callback.message.edit_text(
+                "Не удалось создать бронирование: время уже занято. "
+                "Попробуйте другой интервал.",
+                reply_markup=main_back_inline(),
+            )
+            await callback.answer()
+            return
+
+        await callback.message.edit_reply_markup(reply_markup=None)
+        await callback.answer()
+        await answer_booking_created(callback.message, **_created_response(result))
+
+    @router.callback_query(lambda c: c.data and c.data.startswith("hold:release:"))
+    @handler
+    async def release_hold(callback: types.CallbackQuery, user: User):
+        """Release the held interval without booking it."""
+        _, _, hold_id = callback.data.split(":", 2)
+        await booking_service.release_hold(hold_id=hold_id, user_id=user.id)
+        await callback.message.edit_text(
+            "Бронирование отменено, время освобождено.",
+            reply_markup=main_back_inline(),
+        )
+        await callback.answer()
 
     return router
+
+
+async def _offered_slots(
+    resource_id: int,
+    customer_id: UUID,
+) -> Sequence[tuple[datetime, datetime]]:
+    """Free slots of SLOT_SECONDS on the hour grid within the next day."""
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    slots = await resource_service.get_customer_free_slots(
+        resource_id=resource_id,
+        customer_id=customer_id,
+        params=FreeSlotsParams(
+            start=start,
+            end=start + MAX_INTERVAL,
+            slot=SLOT_SECONDS,
+        ),
+    )
+    return slots or []
+
+
+def _slots_text(slots: Sequence[tuple[datetime, datetime]]) -> str:
+    if not slots:
+        return "Свободных слотов на ближайшие сутки нет."
+    return (
+        f"🟢 *Свободные слоты на ближайшие сутки* (по {SLOT_SECONDS // 60} мин.): "
+        "выберите слот, чтобы удержать его за собой."
+    )
+
+
+def _created_response(result: BookingResult) -> dict:
+    """Stored result of a confirmed hold (times in ISO format)."""
+    return {
+        "resource_id": result.booking.resource_id,
+        "start_time": result.booking.start_time.isoformat(),
+        "end_time": result.booking.end_time.isoformat(),
+    }
+
+
+async def answer_booking_created(
+    message: types.Message,
+    resource_id: int,
+    start_time: str,
+    end_time: str,
+) -> None:
+    """Send booking success message (times in ISO format)."""
+    status_emoji = get_status_emoji(True)
+    await message.answer(
+        f"{status_emoji} *Бронирование успешно создано!*\n\n"
+        f"- Ресурс: `{resource_id}`\n"
+        f"- С: {format_dt(datetime.fromisoformat(start_time))}\n"
+        f"- По: {format_dt(datetime.fromisoformat(end_time))}",
+        parse_mode="Markdown",
+        reply_markup=get_main_menu(),
+    )
@@ -1,6 +1,7 @@
 # ruff: noqa: RUF001
 """Helper functions for booking routes."""
 
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from uuid import UUID
 
@@ -14,6 +15,10 @@ TIME_RANGE_PARTS = 2
 DATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y")
 TIME_FORMAT = "%H:%M"
 MAX_BOOKINGS_LIST = 10
+BOOKINGS_PAGE_SIZE = 10
+# Free slots offered as buttons: size and how many
+SLOT_SECONDS = 3600
+MAX_SLOT_BUTTONS = 8
 
 
 async def get_customer_id(bot_id: int) -> UUID:
@@ -54,6 +59,50 @@ def resources_inline(resources: list[Resource]) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
+def slots_inline(
+    resource_id: int,
+    slots: Sequence[tuple[datetime, datetime]],
+) -> InlineKeyboardMarkup:
+    """Create inline keyboard with free slots (first MAX_SLOT_BUTTONS)."""
+    rows: list[list[InlineKeyboardButton]] = []
+    for start, end in slots[:MAX_SLOT_BUTTONS]:
+        rows.append(
+            [
+                InlineKeyboardButton(
+                    text=f"🟢 {format_short_dt(start)} - {format_short_dt(end)}",
+                    callback_data=(
+                        f"slot:hold:{resource_id}:"
+                        f"{int(start.timestamp())}:{int(end.timestamp())}"
+                    ),
+                ),
+            ],
+        )
+    rows.append(
+        [InlineKeyboardButton(text="⬅️ В главное меню", callback_data="nav:main")],
+    )
+    return InlineKeyboardMarkup(inline_keyboard=rows)
+
+
+def hold_inline(hold_id: str) -> InlineKeyboardMarkup:
+    """Create inline keyboard to confirm or release a hold."""
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text="✅ Подтвердить",
+                    callback_data=f"hold:confirm:{hold_id}",
+                ),
+            ],
+            [
+                InlineKeyboardButton(
+                    text="❌ Отменить",
+                    callback_data=f"hold:release:{hold_id}",
+                ),
+            ],
+        ],
+    )
+
+
 def format_dt(dt: datetime) -> str:
     """Format datetime to string."""
     if dt.tzinfo is None:
@@ -68,19 +117,19 @@ def format_short_dt(dt: datetime) -> str:
     return dt.astimezone(timezone.utc).strftime("%d.%m %H:%M")
 
 
-def format_bookings_list(bookings: list) -> str:
+def format_bookings_list(bookings: list, has_more: bool = False) -> str:
     """Format list of bookings for display."""
     if not bookings:
         return "Нет забронированных слотов."
 
     lines = ["📅 *Занятые слоты:*\n"]
-    for booking in bookings[:MAX_BOOKINGS_LIST]:  # Limit to 10 most recent
+    for booking in bookings[:MAX_BOOKINGS_LIST]:  # Limit to 10 nearest
         start = format_short_dt(booking.start_time)
         end = format_short_dt(booking.end_time)
         lines.append(f"🔴 {start} - {end}")
 
-    if len(bookings) > MAX_BOOKINGS_LIST:
-        lines.append(f"\n... и еще {len(bookings) - 10} бронирований")
+    if has_more or len(bookings) > MAX_BOOKINGS_LIST:
+        lines.append("\n... и другие бронирования")
 
     return "\n".join(lines)
 
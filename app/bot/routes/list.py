@@ -1,6 +1,9 @@
 # ruff: noqa: RUF001, PLR0915
 """Handlers for viewing and managing bookings."""
 
+from datetime import datetime, timezone
+from uuid import UUID
+
 from aiogram import Router, types
 from aiogram.fsm.context import FSMContext
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
@@ -8,10 +11,70 @@ from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from app.bot.handler import handler
 from app.bot.keyboards.main_menu import get_main_menu
 from app.domain.services.bookings import booking_service
-from app.infrastructure.database import Resource
+from app.infrastructure.database import Booking, Resource
 from app.infrastructure.database.models.users import User
 
-from .helpers import format_dt, get_customer_id, get_status_emoji, main_back_inline
+from .helpers import (
+    BOOKINGS_PAGE_SIZE,
+    format_dt,
+    get_customer_id,
+    get_status_emoji,
+    main_back_inline,
+)
+
+
+async def bookings_page_inline(
+    user_id: UUID,
+    customer_id: UUID,
+    cursor: str | None = None,
+) -> InlineKeyboardMarkup | None:
+    """Create inline keyboard with a page of current and upcoming bookings.
+
+    Returns None if the page is empty.
+    """
+    page = await booking_service.get_user_bookings(
+        user_id=user_id,
+        customer_id=customer_id,
+        limit=BOOKINGS_PAGE_SIZE,
+        cursor=cursor,
+        since=datetime.now(timezone.utc),
+    )
+    if not page.items:
+        return None
+
+    resource_ids = sorted({b.resource_id for b in page.items})
+    resources = await Resource.get_by_id_list(id_list=resource_ids)
+    resource_name_by_id = {r.id: r.name for r in resources}
+
+    rows: list[list[InlineKeyboardButton]] = []
+    for b in page.items:
+        resource_name = resource_name_by_id.get(
+            b.resource_id,
+            f"ресурс {b.resource_id}",
+        )
+        status_emoji = get_status_emoji(True)
+        title = f"{status_emoji} #{b.id} · {resource_name} · {format_dt(b.start_time)}"
+        rows.append(
+            [
+                InlineKeyboardButton(
+                    text=title,
+                    callback_data=f"booking:show:{b.id}",
+                ),
+            ],
+        )
+    if page.next_cursor:
+        rows.append(
+            [
+                InlineKeyboardButton(
+                    text="➡️ Далее",
+                    callback_data=f"booking:page:{page.next_cursor}",
+                ),
+            ],
+        )
+    rows.append(
+        [InlineKeyboardButton(text="⬅️ В главное меню", callback_data="nav:main")],
+    )
+    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
 def get_list_router() -> Router:
@@ -24,46 +87,17 @@ def get_list_router() -> Router:
         """Show list of user bookings."""
         await state.clear()
         customer_id = await get_customer_id(message.bot.id)
-        bookings = await booking_service.get_user_bookings(
-            user_id=user.id,
-            customer_id=customer_id,
-        )
-        if not bookings:
+        markup = await bookings_page_inline(user.id, customer_id)
+        if markup is None:
             await message.answer(
-                "У вас пока нет бронирований.",
+                "У вас нет предстоящих бронирований.",
                 reply_markup=get_main_menu(),
             )
             return
 
-        resource_ids = sorted({b.resource_id for b in bookings})
-        resources = await Resource.get_by_id_list(id_list=resource_ids)
-        resource_name_by_id = {r.id: r.name for r in resources}
-
-        rows: list[list[InlineKeyboardButton]] = []
-        for b in bookings:
-            resource_name = resource_name_by_id.get(
-                b.resource_id,
-                f"ресурс {b.resource_id}",
-            )
-            status_emoji = get_status_emoji(True)
-            title = (
-                f"{status_emoji} #{b.id} · {resource_name} · {format_dt(b.start_time)}"
-            )
-            rows.append(
-                [
-                    InlineKeyboardButton(
-                        text=title,
-                        callback_data=f"booking:show:{b.id}",
-                    ),
-                ],
-            )
-        rows.append(
-            [InlineKeyboardButton(text="⬅️ В главное меню", callback_data="nav:main")],
-        )
-
         await message.answer(
             "Ваши бронирования:",
-            reply_markup=InlineKeyboardMarkup(inline_keyboard=rows),
+            reply_markup=markup,
         )
 
     @router.callback_query(lambda c: c.data and c.data.startswith("booking:show:"))
@@ -78,16 +112,17 @@ def get_list_router() -> Router:
             return
 
         customer_id = await get_customer_id(callback.bot.id)
-        bookings = await booking_service.get_user_bookings(
-            user_id=user.id,
-            customer_id=customer_id,
-        )
-        booking = next((b for b in bookings if b.id == booking_id), None)
-        if not booking:
+        booking = await Booking.get(id=booking_id)
+        if (
+            not booking
+            or booking.user_id != user.id
+            or booking.customer_id != customer_id
+        ):
             await callback.answer("Бронирование не найдено")
             return
 
         resource = await Resource.get(id=booking.resource_id)
+
         status_emoji = get_status_emoji(True)
         kb = InlineKeyboardMarkup(
             inline_keyboard=[
@@ -127,49 +162,38 @@ def get_list_router() -> Router:
     async def back_to_list(callback: types.CallbackQuery, user: User):
         """Return to bookings list."""
         customer_id = await get_customer_id(callback.bot.id)
-        bookings = await booking_service.get_user_bookings(
-            user_id=user.id,
-            customer_id=customer_id,
-        )
-        if not bookings:
+        markup = await bookings_page_inline(user.id, customer_id)
+        if markup is None:
             await callback.message.edit_text(
-                "У вас пока нет бронирований.",
+                "У вас нет предстоящих бронирований.",
                 reply_markup=main_back_inline(),
             )
             await callback.answer()
             return
 
-        resource_ids = sorted({b.resource_id for b in bookings})
-        resources = await Resource.get_by_id_list(id_list=resource_ids)
-        resource_name_by_id = {r.id: r.name for r in resources}
-
-        rows: list[list[InlineKeyboardButton]] = []
-        for b in bookings:
-            resource_name = resource_name_by_id.get(
-                b.resource_id,
-                f"ресурс {b.resource_id}",
-            )
-            status_emoji = get_status_emoji(True)
-            title = (
-                f"{status_emoji} #{b.id} · {resource_name} · {format_dt(b.start_time)}"
-            )
-            rows.append(
-                [
-                    InlineKeyboardButton(
-                        text=title,
-                        callback_data=f"booking:show:{b.id}",
-                    ),
-                ],
-            )
-        rows.append(
-            [InlineKeyboardButton(text="⬅️ В главное меню", callback_data="nav:main")],
-        )
         await callback.message.edit_text(
             "Ваши бронирования:",
-            reply_markup=InlineKeyboardMarkup(inline_keyboard=rows),
+            reply_markup=markup,
         )
         await callback.answer()
 
+    @router.callback_query(lambda c: c.data and c.data.startswith("booking:page:"))
+    @handler
+    async def next_page(callback: types.CallbackQuery, user: User):
+        """Show the next page of bookings."""
+        _, _, cursor = callback.data.split(":", 2)
+        customer_id = await get_customer_id(callback.bot.id)
+        try:
+            markup = await bookings_page_inline(user.id, customer_id, cursor)
+        except ValueError:
+            await callback.answer("Некорректная страница")
+            return
+        if markup is None:
+            await callback.answer("Больше бронирований нет")
+            return
+        await callback.message.edit_reply_markup(reply_markup=markup)
+        await callback.answer()
+
     @router.callback_query(lambda c: c.data and c.data.startswith("booking:cancel:"))
     @handler
     async def cancel_booking(callback: types.CallbackQuery, user: User):
@@ -10,6 +10,12 @@ class BotConfig(BaseModel):
     TEST_BOT_TOKEN: str | None = None
     TEST_USER_TLG_ID: int | None = None
     CREATE_TEST_USER: bool = False
+    # Notifications sent concurrently by the scheduler
+    NOTIFICATION_CONCURRENCY: int = 8
+    # Messages per second: to one chat, from one bot, from all bots
+    NOTIFICATION_CHAT_RATE: float = 1.0
+    NOTIFICATION_BOT_RATE: float = 30.0
+    NOTIFICATION_GLOBAL_RATE: float = 30.0
 
     ADMINBOT_TOKEN: str
     ADMINBOT_ID: int
@@ -1,8 +1,18 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
 
 class DbConfig(BaseModel):
     DB_ECHO: bool = False
+    # "constraint": rely on the bookings exclusion constraint only;
+    # "advisory": serialize writers per resource with pg_advisory_xact_lock
+    BOOKING_LOCK_STRATEGY: Literal["constraint", "advisory"] = "constraint"
+    # Bookings ended this many days ago move to the partitioned archive
+    BOOKING_ARCHIVE_AFTER_DAYS: int = 30
+    # Archive partitions older than this many months are detached;
+    # None keeps them attached
+    BOOKING_ARCHIVE_KEEP_MONTHS: int | None = None
 
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
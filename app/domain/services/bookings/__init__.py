@@ -1,9 +1,40 @@
-from .booking import BookingParams, BookingService
+from .archive import ArchiveStats, BookingArchiveService
+from .booking import (
+    MAX_BULK_BOOKINGS,
+    BookingFailureReason,
+    BookingParams,
+    BookingResult,
+    BookingService,
+    HoldResult,
+    SeriesParams,
+    SeriesResult,
+    SeriesUpdate,
+)
+from .idempotency import IdempotencyScope, IdempotencyService
+from .pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, BookingPage
 
 booking_service = BookingService()
+idempotency_service = IdempotencyService()
+booking_archive_service = BookingArchiveService()
 
 __all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "MAX_BULK_BOOKINGS",
+    "MAX_PAGE_SIZE",
+    "ArchiveStats",
+    "BookingArchiveService",
+    "BookingFailureReason",
+    "BookingPage",
     "BookingParams",
+    "BookingResult",
     "BookingService",
+    "HoldResult",
+    "IdempotencyScope",
+    "IdempotencyService",
+    "SeriesParams",
+    "SeriesResult",
+    "SeriesUpdate",
+    "booking_archive_service",
     "booking_service",
+    "idempotency_service",
 ]
@@ -0,0 +1,217 @@
+"""Archiving of ended bookings into the monthly partitioned bookings_archive.
+
+bookings itself stays unpartitioned: the no-overlap exclusion constraint and
+the foreign keys from notifications can't span range partitions of
+start_time. Instead bookings ended BOOKING_ARCHIVE_AFTER_DAYS ago are moved
+to bookings_archive, so overlap lookups, free slots and the evaluation job
+only touch recent rows, and old months can be detached from the archive.
+User listings read the archive for past pages (see get_user_bookings);
+feedbacks of deleted bookings are removed by delete triggers.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+import sqlalchemy as sa
+
+from app.config import config
+from app.depends import AsyncSession, provider
+from app.infrastructure.database import Booking, BookingArchive
+
+ARCHIVE_BATCH_SIZE = 5000
+PARTITIONS_AHEAD = 1  # Months created in advance after the current one
+# Catches rows of months older than the kept ones (see run)
+DEFAULT_PARTITION = f"{BookingArchive.__tablename__}_default"
+
+_ARCHIVED_COLUMNS = (
+    "id",
+    "start_time",
+    "end_time",
+    "resource_id",
+    "user_id",
+    "customer_id",
+    "series_id",
+    "created_at",
+    "updated_at",
+)
+
+
+def month_start(dt: datetime) -> datetime:
+    """First moment (UTC) of the month of dt."""
+    dt = dt.astimezone(timezone.utc)
+    return dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """Shift a month start by a number of months."""
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{BookingArchive.__tablename__}_p{month:%Y_%m}"
+
+
+@dataclass
+class ArchiveStats:
+    """Result of one maintenance run."""
+
+    created: list[str] = field(default_factory=list)
+    archived: int = 0
+    detached: list[str] = field(default_factory=list)
+
+
+class BookingArchiveService:
+    """Move ended bookings to the archive and manage its partitions."""
+
+    def __init__(
+        self,
+        archive_after_days: int | None = None,
+        keep_months: int | None = None,
+    ):
+        self.archive_after = timedelta(
+            days=archive_after_days
+            if archive_after_days is not None
+            else config.database.BOOKING_ARCHIVE_AFTER_DAYS,
+        )
+        self.keep_months = (
+            keep_months
+            if keep_months is not None
+            else config.database.BOOKING_ARCHIVE_KEEP_MONTHS
+        )
+
+    async def run(self) -> ArchiveStats:
+        """Create missing partitions, archive ended bookings, detach old months."""
+        now = datetime.now(timezone.utc)
+        cutoff = now - self.archive_after
+        start = await self._oldest_to_archive(cutoff) or cutoff
+        first_kept = None
+        if self.keep_months is not None:
+            first_kept = add_months(month_start(now), -self.keep_months)
+            # Older months go to the default partition instead of
+            # recreating partitions that were already detached
+            start = max(start, first_kept)
+
+        stats = ArchiveStats()
+        stats.created = await self.ensure_partitions(
+            start=start,
+            end=add_months(month_start(now), PARTITIONS_AHEAD),
+        )
+        stats.archived = await self.archive_ended(before=cutoff)
+        if first_kept is not None:
+            stats.detached = await self.detach_older_than(first_kept)
+        return stats
+
+    @provider.inject_session
+    async def ensure_partitions(
+        self,
+        start: datetime,
+        end: datetime,
+        session: AsyncSession = None,
+    ) -> list[str]:
+        """Create archive partitions for months from start to end inclusive."""
+        existing = set(await self._partitions(session))
+        created = []
+        month = month_start(start)
+        while month <= end:
+            name = partition_name(month)
+            if name not in existing:
+                # Identifiers and bounds are generated, not user input
+                await session.execute(
+                    sa.text(
+                        f"CREATE TABLE {name} PARTITION OF "
+                        f"{BookingArchive.__tablename__} FOR VALUES "
+                        f"FROM ('{month.isoformat()}') "
+                        f"TO ('{add_months(month, 1).isoformat()}')",
+                    ),
+                )
+                created.append(name)
+            month = add_months(month, 1)
+        await session.commit()
+        return created
+
+    @provider.inject_session
+    async def archive_ended(
+        self,
+        before: datetime,
+        batch_size: int = ARCHIVE_BATCH_SIZE,
+        session: AsyncSession = None,
+    ) -> int:
+        """Move bookings ended before the moment to the archive in batches.
+
+        Each batch is one DELETE ... RETURNING feeding an INSERT, committed
+        separately to keep transactions short; notifications of moved
+        bookings are removed by their foreign key cascade.
+        """
+        columns = ", ".join(_ARCHIVED_COLUMNS)
+        stmt = sa.text(
+            f"WITH moved AS ("  # noqa: S608
+            f" DELETE FROM {Booking.__tablename__} WHERE id IN ("
+            f"  SELECT id FROM {Booking.__tablename__}"
+            f"  WHERE end_time < :before ORDER BY id LIMIT :batch_size"
+            f"  FOR UPDATE SKIP LOCKED"
+            f" ) RETURNING {columns}"
+            f") INSERT INTO {BookingArchive.__tablename__} ({columns}) "
+            f"SELECT {columns} FROM moved",
+        )
+        total = 0
+        while True:
+            result = await session.execute(
+                stmt,
+                {"before": before, "batch_size": batch_size},
+            )
+            await session.commit()
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                return total
+
+    @provider.inject_session
+    async def detach_older_than(
+        self,
+        month: datetime,
+        session: AsyncSession = None,
+    ) -> list[str]:
+        """Detach archive partitions of months before the given one.
+
+        Detached partitions stay as standalone tables to be dumped or dropped.
+        """
+        first_kept = partition_name(month_start(month))
+        detached = []
+        for name in sorted(await self._partitions(session)):
+            if name == DEFAULT_PARTITION:
+                continue
+            if name >= first_kept:
+                break
+            await session.execute(
+                sa.text(
+                    f"ALTER TABLE {BookingArchive.__tablename__} "
+                    f"DETACH PARTITION {name}",
+                ),
+            )
+            detached.append(name)
+        await session.commit()
+        return detached
+
+    @provider.inject_session
+    async def _oldest_to_archive(
+        self,
+        cutoff: datetime,
+        session: AsyncSession = None,
+    ) -> datetime | None:
+        stmt = sa.select(sa.func.min(Booking.start_time)).where(
+            Booking.end_time < cutoff,
+        )
+        return await session.scalar(stmt)
+
+    @staticmethod
+    async def _partitions(session: AsyncSession) -> list[str]:
+        stmt = sa.text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:parent AS regclass)",
+        )
+        result = await session.scalars(
+            stmt,
+            {"parent": BookingArchive.__tablename__},
+        )
+        return list(result.all())
@@ -1,14 +1,37 @@
-from dataclasses import dataclass
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    insert as pg_insert,
+)
+import sqlalchemy.orm as so
 
+from app.config import config
 from app.depends import AsyncSession, provider
-from app.infrastructure.database import Booking, Resource
+from app.domain.services.resource.buffers import NO_BUFFERS, Buffers
+from app.domain.services.resource.cache import free_slots_cache
+from app.domain.services.resource.capacity import lock_resource
+from app.domain.services.resource.holds import Hold, hold_storage, new_hold
+from app.domain.services.resource.interval_index import (
+    ResourceIntervalIndex,
+    interval_index,
+)
+from app.domain.services.resource.schedule import ResourceSchedule, schedule_registry
+from app.infrastructure.database import (
+    Booking,
+    BookingArchive,
+    BookingSeries,
+    Resource,
+)
 from app.infrastructure.database.models.notification import (
     Notification,
     NotificationStatus,
+    NotificationType,
 )
 from app.metrics.business import (
     booking_cancelled_total,
@@ -18,8 +41,22 @@ from app.metrics.business import (
     booking_status_changed_total,
 )
 
+from .pagination import BookingPage, paginate
+from .recurrence import RecurrenceRule, get_zone
+
 # Maximum booking duration: 3 years in the future
 MAX_BOOKING_DURATION_DAYS = 365 * 3
+# Maximum number of bookings in one create_bookings call
+MAX_BULK_BOOKINGS = 500
+# Maximum number of future occurrences materialized for one series
+MAX_SERIES_OCCURRENCES = MAX_BULK_BOOKINGS
+
+
+class BookingLockStrategy:
+    """How concurrent creates on one resource are serialized."""
+
+    CONSTRAINT = "constraint"  # Exclusion constraint + ON CONFLICT DO NOTHING
+    ADVISORY = "advisory"  # pg_advisory_xact_lock + EXISTS probe, then insert
 
 
 @dataclass
@@ -34,37 +71,752 @@ class BookingParams:
     source: str = "api"
 
 
+@dataclass
+class SeriesParams:
+    """Parameters for creating a recurring booking series.
+
+    start_time/end_time are the first occurrence; rrule repeats it keeping
+    the local time of day in timezone.
+    """
+
+    user_id: UUID
+    customer_id: UUID
+    resource_id: int
+    start_time: datetime
+    end_time: datetime
+    rrule: str
+    timezone: str = "UTC"
+    source: str = "api"
+
+
+@dataclass
+class SeriesUpdate:
+    """Changes to a series; None keeps the current value."""
+
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    rrule: str | None = None
+    timezone: str | None = None
+
+
+class BookingFailureReason:
+    """Reason codes for a booking that was not created."""
+
+    INVALID_TIME = "invalid_time"  # Empty range, in the past or too far ahead
+    RESOURCE_NOT_FOUND = "resource_not_found"
+    WRONG_CUSTOMER = "wrong_customer"  # Resource belongs to another customer
+    NOT_AVAILABLE = "not_available"  # Overlaps a booking, or no free units
+    CLOSED = "closed"  # Outside opening hours or in a blackout
+    BATCH_CONFLICT = "batch_conflict"  # Overlaps an earlier item of the batch
+    HOLD_EXPIRED = "hold_expired"  # Hold not found, expired or not yours
+
+
+@dataclass
+class BookingResult:
+    """Outcome of a booking attempt: the booking or a failure reason."""
+
+    booking: Booking | None = None
+    reason: str | None = None
+    resource_name: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.booking is not None
+
+
+# Awaited with the result of a created booking before its transaction commits
+BeforeCommit = Callable[[BookingResult], Awaitable[None]]
+
+
+@dataclass
+class HoldResult:
+    """Outcome of placing a hold: the hold or a failure reason."""
+
+    hold: Hold | None = None
+    reason: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.hold is not None
+
+
+@dataclass
+class SeriesResult:
+    """Outcome of a series create/update.
+
+    On failure nothing is written; conflicts lists the starts of occurrences
+    that could not be booked.
+    """
+
+    series: BookingSeries | None = None
+    bookings: list[Booking] = field(default_factory=list)
+    reason: str | None = None
+    conflicts: list[datetime] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.reason is None
+
+
+def _is_valid_time(start_time: datetime, end_time: datetime, now: datetime) -> bool:
+    """Check range is not empty, not in the past and ends within 3 years."""
+    max_end_time = now + timedelta(days=MAX_BOOKING_DURATION_DAYS)
+    return now <= start_time < end_time <= max_end_time
+
+
+def _reminders(start_time: datetime) -> list[tuple[str, datetime]]:
+    """Reminder notifications (type, scheduled_at) created with a booking."""
+    return [
+        (NotificationType.BOOKING_24H, start_time - timedelta(hours=24)),
+        (NotificationType.BOOKING_1H, start_time - timedelta(hours=1)),
+    ]
+
+
+def _overlap_exists(
+    resource_id: int,
+    start_time: datetime,
+    end_time: datetime,
+) -> sa.Exists:
+    """EXISTS over the GiST-indexed `during` range of a resource."""
+    return sa.exists().where(
+        sa.and_(
+            Booking.resource_id == resource_id,
+            Booking.during.overlaps(sa.func.tstzrange(start_time, end_time)),
+        ),
+    )
+
+
+def _peak_concurrency(
+    resource_id: int,
+    start_time: datetime,
+    end_time: datetime,
+    buffers: Buffers = NO_BUFFERS,
+) -> sa.ScalarSelect:
+    """Max number of bookings of a resource active at one moment of an interval.
+
+    Sweep line in SQL: every booking overlapping the interval, clipped to
+    it, gives a +1 event at its start and a -1 event at its end; the running
+    sum over events ordered by time (ends first on ties) peaks at the answer.
+    With buffers the occupied intervals are swept; bookings are still found
+    by the `during` range, overlapping the interval widened by both buffers.
+    """
+    probe_start, probe_end = buffers.probe(start_time, end_time)
+    occupied_start, occupied_end = buffers.occupied(start_time, end_time)
+    start = sa.literal(occupied_start, Booking.start_time.type)
+    end = sa.literal(occupied_end, Booking.end_time.type)
+    booking_start, booking_end = Booking.start_time, Booking.end_time
+    if buffers:
+        booking_start = booking_start - sa.literal(buffers.before, sa.Interval)
+        booking_end = booking_end + sa.literal(buffers.after, sa.Interval)
+    overlapping = sa.and_(
+        Booking.resource_id == resource_id,
+        Booking.during.overlaps(
+            sa.func.tstzrange(
+                sa.literal(probe_start, Booking.start_time.type),
+                sa.literal(probe_end, Booking.end_time.type),
+            ),
+        ),
+    )
+    events = sa.union_all(
+        sa.select(
+            sa.func.greatest(booking_start, start).label("at"),
+            sa.literal(1).label("delta"),
+        ).where(overlapping),
+        sa.select(
+            sa.func.least(booking_end, end).label("at"),
+            sa.literal(-1).label("delta"),
+        ).where(overlapping),
+    ).subquery("events")
+    running = sa.select(
+        sa.func.sum(events.c.delta)
+        .over(order_by=(events.c.at, events.c.delta))
+        .label("active"),
+    ).subquery("running")
+    return sa.select(
+        sa.func.coalesce(sa.func.max(running.c.active), 0),
+    ).scalar_subquery()
+
+
+def _create_booking_stmt(
+    params: BookingParams,
+    *,
+    probe: bool = False,
+    locked: bool = False,
+    buffers: Buffers = NO_BUFFERS,
+    held: int = 0,
+) -> sa.Select:
+    """Build one data-modifying CTE statement for a booking.
+
+    The statement checks the resource and its customer, inserts the booking
+    (ON CONFLICT DO NOTHING against the exclusion constraint), inserts both
+    reminders for the inserted row and returns the booking, resource name,
+    resource capacity and buffers and a BookingFailureReason code (NULL on
+    success) in a single row. With probe the insert is skipped by an EXISTS
+    overlap check first (advisory path).
+
+    Only resources of capacity 1 without buffers are booked this way. With
+    locked the statement books any resource instead: the insert is guarded
+    by the peak concurrency of occupied intervals of its bookings (widened
+    by buffers) plus held units, so it must run under the resource advisory
+    lock.
+    """
+    res = (
+        sa.select(
+            Resource.id,
+            Resource.name,
+            Resource.customer_id,
+            Resource.capacity,
+            Resource.buffer_before,
+            Resource.buffer_after,
+        )
+        .where(Resource.id == params.resource_id)
+        .cte("res")
+    )
+    if locked:
+        available = (
+            _peak_concurrency(
+                params.resource_id,
+                params.start_time,
+                params.end_time,
+                buffers,
+            )
+            + held
+            < res.c.capacity
+        )
+    else:
+        available = sa.and_(
+            res.c.capacity == 1,
+            res.c.buffer_before + res.c.buffer_after == 0,
+            sa.false() if held else sa.true(),
+            ~_overlap_exists(params.resource_id, params.start_time, params.end_time)
+            if probe
+            else sa.true(),
+        )
+    ins = (
+        pg_insert(Booking)
+        .from_select(
+            [
+                "user_id",
+                "resource_id",
+                "customer_id",
+                "start_time",
+                "end_time",
+                "exclusive",
+            ],
+            sa.select(
+                sa.literal(params.user_id, Booking.user_id.type),
+                res.c.id,
+                res.c.customer_id,
+                sa.literal(params.start_time, Booking.start_time.type),
+                sa.literal(params.end_time, Booking.end_time.type),
+                res.c.capacity == 1,
+            ).where(
+                sa.and_(res.c.customer_id == params.customer_id, available),
+            ),
+        )
+        .on_conflict_do_nothing()
+        .returning(*Booking.__table__.c)
+        .cte("ins")
+    )
+    reminders = sa.values(
+        sa.column("type", sa.String),
+        sa.column("scheduled_at", sa.DateTime(timezone=True)),
+        name="reminders",
+    ).data(_reminders(params.start_time))
+    notif = (
+        pg_insert(Notification)
+        .from_select(
+            ["booking_id", "user_id", "type", "status", "scheduled_at"],
+            sa.select(
+                ins.c.id,
+                ins.c.user_id,
+                reminders.c.type,
+                sa.literal(NotificationStatus.PENDING, Notification.status.type),
+                reminders.c.scheduled_at,
+            ).select_from(ins.join(reminders, sa.true())),
+        )
+        .cte("notif")
+    )
+    # One-row anchor so a reason is returned even when res and ins are empty
+    anchor = sa.values(sa.column("one", sa.Integer), name="anchor").data([(1,)])
+    reason = sa.case(
+        (res.c.id.is_(None), BookingFailureReason.RESOURCE_NOT_FOUND),
+        (
+            res.c.customer_id != params.customer_id,
+            BookingFailureReason.WRONG_CUSTOMER,
+        ),
+        (ins.c.id.is_(None), BookingFailureReason.NOT_AVAILABLE),
+        else_=sa.null(),
+    )
+    return (
+        sa.select(
+            so.aliased(Booking, ins),
+            res.c.name,
+            res.c.capacity,
+            res.c.buffer_before,
+            res.c.buffer_after,
+            reason,
+        )
+        .select_from(anchor)
+        .outerjoin(res, sa.true())
+        .outerjoin(ins, sa.true())
+        # Not referenced by the result: add explicitly so it is executed
+        .add_cte(notif)
+    )
+
+
+def _held_intervals(
+    holds: Iterable[Hold],
+    start_time: datetime,
+    end_time: datetime,
+    user_id: UUID | None,
+) -> list[tuple[datetime, datetime]]:
+    """Intervals of other users' holds overlapping [start_time, end_time)."""
+    return [
+        (hold.start_time, hold.end_time)
+        for hold in holds
+        if hold.user_id != user_id and hold.overlaps(start_time, end_time)
+    ]
+
+
+async def _held_by_others(
+    resource_id: int,
+    start_time: datetime,
+    end_time: datetime,
+    user_id: UUID | None,
+) -> list[tuple[datetime, datetime]]:
+    """Other users' active holds overlapping [start_time, end_time)."""
+    holds = (await hold_storage.active([resource_id]))[resource_id]
+    return _held_intervals(holds, start_time, end_time, user_id)
+
+
+async def _reject_unavailable(
+    pending: dict[int, BookingParams],
+    resources: dict[int, Resource],
+    results: list[BookingResult],
+    session: AsyncSession,
+) -> None:
+    """Reject pending items that are held by others or already booked.
+
+    Items of capacity 1 resources without buffers are rejected on any
+    overlapping hold and checked against bookings with one unnest join.
+    Items of shared or buffered resources are checked under their resource
+    locks: their bookings in the batch span are read with one query and
+    items are accepted in input order while the peak of occupied intervals
+    of bookings, other users' holds and earlier accepted items stays below
+    capacity.
+    """
+    if not pending:
+        return
+    holds = await hold_storage.active({p.resource_id for p in pending.values()})
+    exclusive: dict[int, BookingParams] = {}
+    locked: dict[int, BookingParams] = {}
+    for pos, params in pending.items():
+        resource = resources[params.resource_id]
+        if resource.capacity > 1 or Buffers.of(resource):
+            locked[pos] = params
+        elif _held_intervals(
+            holds[params.resource_id],
+            params.start_time,
+            params.end_time,
+            params.user_id,
+        ):
+            results[pos].reason = BookingFailureReason.NOT_AVAILABLE
+        else:
+            exclusive[pos] = params
+    if exclusive:
+        for pos in await session.scalars(_existing_conflicts_stmt(exclusive)):
+            results[pos].reason = BookingFailureReason.NOT_AVAILABLE
+    if locked:
+        await _reject_over_capacity(locked, resources, holds, results, session)
+    for pos in list(pending):
+        if results[pos].reason:
+            del pending[pos]
+
+
+async def _reject_over_capacity(
+    items: dict[int, BookingParams],
+    resources: dict[int, Resource],
+    holds: dict[int, list[Hold]],
+    results: list[BookingResult],
+    session: AsyncSession,
+) -> None:
+    """Fill reasons of locked resource items that find no free unit."""
+    indexes = await _load_locked(items, resources, session)
+    for pos, params in items.items():
+        index = indexes[params.resource_id]
+        buffers = Buffers.of(resources[params.resource_id])
+        held = _held_intervals(
+            holds[params.resource_id],
+            *buffers.probe(params.start_time, params.end_time),
+            params.user_id,
+        )
+        if index.is_free(
+            params.start_time,
+            params.end_time,
+            extra=held,
+            buffers=buffers,
+        ):
+            # Negative ids keep batch items apart from booking ids
+            index.add(-pos - 1, params.start_time, params.end_time)
+        else:
+            results[pos].reason = BookingFailureReason.NOT_AVAILABLE
+
+
+async def _load_locked(
+    items: dict[int, BookingParams],
+    resources: dict[int, Resource],
+    session: AsyncSession,
+) -> dict[int, ResourceIntervalIndex]:
+    """Lock resources of items and index their bookings in the span.
+
+    Locks are taken in resource id order, so concurrent batches don't
+    deadlock. The span is widened by the largest buffers, so bookings
+    competing with items through buffers are indexed too.
+    """
+    resource_ids = sorted({params.resource_id for params in items.values()})
+    for resource_id in resource_ids:
+        await lock_resource(resource_id, session)
+    spans = [
+        Buffers.of(resources[params.resource_id]).probe(
+            params.start_time,
+            params.end_time,
+        )
+        for params in items.values()
+    ]
+    span_start = min(start for start, _ in spans)
+    span_end = max(end for _, end in spans)
+    stmt = (
+        sa.select(
+            Booking.resource_id,
+            Booking.id,
+            Booking.start_time,
+            Booking.end_time,
+        )
+        .where(
+            sa.and_(
+                Booking.resource_id
+                == sa.any_(sa.bindparam(None, resource_ids, type_=ARRAY(sa.Integer))),
+                Booking.start_time < span_end,
+                Booking.end_time > span_start,
+            ),
+        )
+        .order_by(Booking.resource_id, Booking.start_time, Booking.end_time)
+    )
+    indexes = {
+        resource_id: ResourceIntervalIndex(
+            loaded_from=span_start,
+            capacity=resources[resource_id].capacity,
+        )
+        for resource_id in resource_ids
+    }
+    for resource_id, booking_id, start, end in await session.execute(stmt):
+        index = indexes[resource_id]
+        # Rows arrive in index order: append keeps the list sorted
+        index.items.append((start, end, booking_id))
+        index.max_duration = max(index.max_duration, end - start)
+    return indexes
+
+
+def _validate_batch(
+    items: list[BookingParams],
+    resources: dict[int, Resource],
+    schedules: dict[int, ResourceSchedule],
+    results: list[BookingResult],
+    now: datetime,
+) -> dict[int, BookingParams]:
+    """Validate a batch in memory, filling reasons of rejected items.
+
+    Items are accepted in input order, so of two overlapping items of one
+    resource the earlier one wins (on a shared resource, of the items above
+    its capacity); with buffers their occupied intervals are compared.
+    Returns accepted items by position.
+    """
+    # Accepted intervals per resource, to find conflicts inside the batch
+    accepted: dict[int, ResourceIntervalIndex] = {}
+    pending: dict[int, BookingParams] = {}
+    for pos, params in enumerate(items):
+        resource = resources.get(params.resource_id)
+        if not _is_valid_time(params.start_time, params.end_time, now):
+            results[pos].reason = BookingFailureReason.INVALID_TIME
+        elif resource is None:
+            results[pos].reason = BookingFailureReason.RESOURCE_NOT_FOUND
+        elif resource.customer_id != params.customer_id:
+            results[pos].reason = BookingFailureReason.WRONG_CUSTOMER
+        elif not schedules[params.resource_id].is_open(
+            *Buffers.of(resource).occupied(params.start_time, params.end_time),
+        ):
+            results[pos].reason = BookingFailureReason.CLOSED
+        else:
+            index = accepted.setdefault(
+                params.resource_id,
+                ResourceIntervalIndex(loaded_from=now, capacity=resource.capacity),
+            )
+            if index.is_free(
+                params.start_time,
+                params.end_time,
+                buffers=Buffers.of(resource),
+            ):
+                index.add(pos, params.start_time, params.end_time)
+                pending[pos] = params
+            else:
+                results[pos].reason = BookingFailureReason.BATCH_CONFLICT
+    return pending
+
+
+def _parse_series_rule(rrule: str, tz: str) -> RecurrenceRule:
+    """Parse a series rule; raise ValueError if invalid or unbounded."""
+    rule = RecurrenceRule.parse(rrule)
+    if not rule.is_bounded:
+        msg = "Series rule must have COUNT or UNTIL"
+        raise ValueError(msg)
+    get_zone(tz)
+    return rule
+
+
+def _expand_series(
+    params: SeriesParams,
+    rule: RecurrenceRule,
+    now: datetime,
+) -> list[BookingParams]:
+    """Expand the occurrences of a series starting at or after now.
+
+    Past occurrences are skipped, not materialized. Raises ValueError if the
+    series runs past the booking horizon or has too many occurrences.
+    """
+    duration = params.end_time - params.start_time
+    max_end_time = now + timedelta(days=MAX_BOOKING_DURATION_DAYS)
+    items: list[BookingParams] = []
+    for start in rule.occurrences(params.start_time, params.timezone):
+        if start < now:
+            continue
+        if start + duration > max_end_time:
+            msg = f"Series must end within {MAX_BOOKING_DURATION_DAYS} days"
+            raise ValueError(msg)
+        if len(items) == MAX_SERIES_OCCURRENCES:
+            msg = f"Series must have at most {MAX_SERIES_OCCURRENCES} occurrences"
+            raise ValueError(msg)
+        items.append(
+            BookingParams(
+                user_id=params.user_id,
+                customer_id=params.customer_id,
+                resource_id=params.resource_id,
+                start_time=start,
+                end_time=start + duration,
+                source=params.source,
+            ),
+        )
+    return items
+
+
+def _existing_conflicts_stmt(items: dict[int, BookingParams]) -> sa.Select:
+    """Select batch positions overlapping existing bookings.
+
+    The batch is passed as parallel arrays and joined against bookings via
+    unnest, so the whole batch is checked in one statement.
+    """
+    batch = (
+        sa.func.unnest(
+            sa.bindparam(None, list(items), type_=ARRAY(sa.Integer)),
+            sa.bindparam(
+                None,
+                [p.resource_id for p in items.values()],
+                type_=ARRAY(sa.Integer),
+            ),
+            sa.bindparam(
+                None,
+                [p.start_time for p in items.values()],
+                type_=ARRAY(sa.DateTime(timezone=True)),
+            ),
+            sa.bindparam(
+                None,
+                [p.end_time for p in items.values()],
+                type_=ARRAY(sa.DateTime(timezone=True)),
+            ),
+        )
+        .table_valued(
+            sa.column("pos", sa.Integer),
+            sa.column("resource_id", sa.Integer),
+            sa.column("start_time", sa.DateTime(timezone=True)),
+            sa.column("end_time", sa.DateTime(timezone=True)),
+        )
+        .render_derived(name="batch")
+    )
+    return (
+        sa.select(batch.c.pos)
+        .distinct()
+        .select_from(batch)
+        .join(
+            Booking,
+            sa.and_(
+                Booking.resource_id == batch.c.resource_id,
+                Booking.during.overlaps(
+                    sa.func.tstzrange(batch.c.start_time, batch.c.end_time),
+                ),
+            ),
+        )
+    )
+
+
+async def _insert_bookings(
+    items: dict[int, BookingParams],
+    resources: dict[int, Resource],
+    session: AsyncSession,
+    series_id: int | None = None,
+) -> dict[int, Booking]:
+    """Insert bookings with one multi-row INSERT; return created by position.
+
+    Returned rows are mapped back to positions by (resource, user, start,
+    end); equal items of a shared resource are interchangeable. Items
+    missing from the result were skipped by ON CONFLICT: they lost a race
+    with a concurrent booking.
+    """
+    if not items:
+        return {}
+    stmt = (
+        pg_insert(Booking)
+        .values(
+            [
+                {
+                    "user_id": params.user_id,
+                    "resource_id": params.resource_id,
+                    # Checked against the resource by _validate_batch
+                    "customer_id": params.customer_id,
+                    "start_time": params.start_time,
+                    "end_time": params.end_time,
+                    "series_id": series_id,
+                    "exclusive": resources[params.resource_id].capacity == 1,
+                }
+                for params in items.values()
+            ],
+        )
+        .on_conflict_do_nothing()
+        .returning(Booking)
+    )
+    inserted: dict[tuple, list[Booking]] = defaultdict(list)
+    for booking in await session.scalars(stmt):
+        key = (
+            booking.resource_id,
+            booking.user_id,
+            booking.start_time,
+            booking.end_time,
+        )
+        inserted[key].append(booking)
+    created: dict[int, Booking] = {}
+    for pos, params in items.items():
+        same = inserted.get(
+            (params.resource_id, params.user_id, params.start_time, params.end_time),
+        )
+        if same:
+            created[pos] = same.pop(0)
+    return created
+
+
+def _invalidate_free_slots(
+    resource_id: int,
+    start_time: datetime,
+    end_time: datetime,
+) -> None:
+    """Drop cached free slots depending on a booking of [start_time, end_time).
+
+    A cached day of a buffered resource is built from bookings within the
+    buffers around the day, so a booking near midnight changes the
+    neighbouring day as well.
+    """
+    buffers = schedule_registry.buffers(resource_id)
+    free_slots_cache.invalidate(resource_id, *buffers.probe(start_time, end_time))
+
+
+async def _insert_reminders(
+    bookings: Iterable[Booking],
+    session: AsyncSession,
+) -> None:
+    """Insert reminder notifications of bookings with one multi-row INSERT."""
+    rows = [
+        {
+            "booking_id": booking.id,
+            "user_id": booking.user_id,
+            "type": notification_type,
+            "status": NotificationStatus.PENDING,
+            "scheduled_at": scheduled_at,
+        }
+        for booking in bookings
+        for notification_type, scheduled_at in _reminders(booking.start_time)
+    ]
+    if rows:
+        await session.execute(pg_insert(Notification).values(rows))
+
+
 class BookingService:
     """Service for managing bookings with conflict detection."""
 
+    def __init__(self, lock_strategy: str | None = None):
+        self.lock_strategy = lock_strategy or config.database.BOOKING_LOCK_STRATEGY
+
+    @property
+    def uses_advisory_lock(self) -> bool:
+        return self.lock_strategy == BookingLockStrategy.ADVISORY
+
     @provider.inject_session
-    async def check_availability(
+    async def check_availability(  # noqa: PLR0913
         self,
         resource_id: int,
         start_time: datetime,
         end_time: datetime,
+        *,
+        use_index: bool = False,
+        user_id: UUID | None = None,
         session: AsyncSession = None,
     ) -> bool:
         """
         Check if resource is available for the given time range.
 
-        Uses SELECT FOR UPDATE to prevent race conditions during booking creation.
-        Returns True if available (no conflicts), False otherwise.
+        By default probes Postgres with EXISTS over the GiST-indexed `during`
+        range, or with a sweep-line peak count for resources of capacity
+        above 1. With use_index=True answers from the in-memory interval
+        index (falls back to Postgres for intervals the index does not
+        cover). Hours when the resource is closed (opening hours, blackouts)
+        are never available. Active holds of users other than user_id count
+        as busy, each taking one unit of a shared resource. With buffers the
+        occupied intervals are compared, and must stay within opening hours.
+        This is a pre-check only: create_booking relies on the exclusion
+        constraint and the resource lock, not on this method.
+        Returns True if available (a unit is free), False otherwise.
         """
-        stmt = (
-            sa.select(Booking)
-            .where(
-                sa.and_(
-                    Booking.resource_id == resource_id,
-                    Booking.start_time < end_time,
-                    Booking.end_time > start_time,
+        schedule = await schedule_registry.get(resource_id=resource_id, session=session)
+        buffers = schedule.buffers
+        if not schedule.is_open(*buffers.occupied(start_time, end_time)):
+            return False
+        probe_start, probe_end = buffers.probe(start_time, end_time)
+        held = await _held_by_others(resource_id, probe_start, probe_end, user_id)
+        if use_index:
+            index = await interval_index.get(resource_id=resource_id, session=session)
+            if index.covers(start_time):
+                return index.is_free(
+                    start_time,
+                    end_time,
+                    extra=held,
+                    buffers=buffers,
+                )
+
+        # CASE evaluates the peak subquery for shared resources only
+        busy = sa.case(
+            (
+                Resource.capacity == 1,
+                sa.cast(
+                    _overlap_exists(resource_id, probe_start, probe_end),
+                    sa.Integer,
                 ),
-            )
-            .with_for_update()
+            ),
+            else_=_peak_concurrency(resource_id, start_time, end_time, buffers),
         )
-        result = await session.scalars(stmt)
-        conflicting_bookings = result.all()
-        return len(conflicting_bookings) == 0
+        stmt = sa.select(Resource.capacity, busy).where(Resource.id == resource_id)
+        row = (await session.execute(stmt)).one_or_none()
+        capacity, booked = row if row is not None else (1, 0)
+        if capacity == 1:
+            return not booked and not held
+        # Holds are counted as if they all overlapped each other
+        return booked + len(held) < capacity
 
     @provider.inject_session
     async def create_booking(
@@ -75,74 +827,492 @@ class BookingService:
         """
         Create a new booking with availability check and time validation.
 
-        Returns the created Booking or None if validation fails.
+        Returns the created Booking or None if validation fails or the
+        resource is already booked. See try_create_booking for the reason.
+        """
+        result = await self.try_create_booking(params=params, session=session)
+        return result.booking
+
+    @provider.inject_session
+    async def try_create_booking(
+        self,
+        params: BookingParams,
+        *,
+        before_commit: BeforeCommit | None = None,
+        session: AsyncSession = None,
+    ) -> BookingResult:
+        """
+        Create a booking with a single CTE statement and report why it failed.
+
+        The resource/customer check, the booking insert (guarded by the
+        exclusion constraint) and both reminder inserts run as one CTE
+        statement, followed by commit. Before it, the resource schedule is
+        read from schedule_registry (up to three queries when it is not
+        cached or older than SCHEDULE_TTL_SECONDS) and other users' holds
+        are looked up in the hold storage (Redis or process memory). With
+        the advisory lock strategy the resource lock is taken by a separate
+        statement and the insert is guarded by an EXISTS overlap probe as
+        well. A resource of capacity above 1 or with buffers is never
+        inserted by the first statement: it answers not_available and a
+        second statement books it under the resource lock, guarded by the
+        peak count of occupied intervals of its bookings.
+
+        before_commit is awaited with the result of a created booking right
+        before the commit, so the caller can write to the same transaction
+        (e.g. the idempotency key response).
 
         Validations:
         - End time must be after start time
         - Start time must not be in the past
         - End time must not exceed 3 years from now
+        - The resource must be open for the whole interval and its buffers
         """
         now = datetime.now(timezone.utc)
+        if not _is_valid_time(params.start_time, params.end_time, now):
+            return BookingResult(reason=BookingFailureReason.INVALID_TIME)
+        schedule = await schedule_registry.get(
+            resource_id=params.resource_id,
+            session=session,
+        )
+        if not schedule.is_open(
+            *schedule.buffers.occupied(params.start_time, params.end_time),
+        ):
+            return BookingResult(reason=BookingFailureReason.CLOSED)
+        held = await _held_by_others(
+            params.resource_id,
+            *schedule.buffers.probe(params.start_time, params.end_time),
+            params.user_id,
+        )
 
-        # Validate time range
-        if params.end_time <= params.start_time:
-            return None
+        if self.uses_advisory_lock:
+            await lock_resource(params.resource_id, session)
+        stmt = _create_booking_stmt(
+            params,
+            probe=self.uses_advisory_lock,
+            held=len(held),
+        )
+        booking, resource_name, capacity, before, after, reason = (
+            await session.execute(stmt)
+        ).one()
+        buffers = Buffers(
+            before=timedelta(seconds=before or 0),
+            after=timedelta(seconds=after or 0),
+        )
+        if reason == BookingFailureReason.NOT_AVAILABLE and (capacity > 1 or buffers):
+            # Shared or buffered resource: the first statement never
+            # inserts, count occupied intervals under the resource lock
+            if not self.uses_advisory_lock:
+                await lock_resource(params.resource_id, session)
+            stmt = _create_booking_stmt(
+                params,
+                locked=True,
+                buffers=buffers,
+                held=len(held),
+            )
+            booking, resource_name, *_, reason = (await session.execute(stmt)).one()
+        if booking is None:
+            return BookingResult(reason=reason, resource_name=resource_name)
 
-        # Validate start time is not in the past
-        if params.start_time < now:
-            return None
+        result = BookingResult(booking=booking, resource_name=resource_name)
+        if before_commit is not None:
+            await before_commit(result)
+        await session.commit()
+        self._on_created(params, booking.id, now)
+        return result
 
-        # Validate end time does not exceed 3 years in future
-        max_end_time = now + timedelta(days=MAX_BOOKING_DURATION_DAYS)
-        if params.end_time > max_end_time:
-            return None
+    @provider.inject_session
+    async def create_bookings(
+        self,
+        items: list[BookingParams],
+        session: AsyncSession = None,
+    ) -> list[BookingResult]:
+        """
+        Create many bookings in one transaction and report each item.
+
+        Items are validated in memory (time range, resource and customer,
+        opening hours, overlaps with earlier items of the batch), checked
+        against existing bookings with one unnest join (one sweep per shared
+        resource), then bookings and their reminders are inserted with
+        multi-row INSERTs. Results follow the input order.
+        """
+        if len(items) > MAX_BULK_BOOKINGS:
+            msg = f"At most {MAX_BULK_BOOKINGS} bookings per batch"
+            raise ValueError(msg)
+
+        now = datetime.now(timezone.utc)
+        results = [BookingResult() for _ in items]
+        resources = {
+            resource.id: resource
+            for resource in await Resource.get_by_id_list(
+                id_list=list({params.resource_id for params in items}),
+                session=session,
+            )
+        }
+
+        schedules = await schedule_registry.get_many(
+            resource_ids=list(resources),
+            session=session,
+        )
+
+        pending = _validate_batch(items, resources, schedules, results, now)
+        await _reject_unavailable(pending, resources, results, session)
+        if not pending:
+            return results
+
+        created = await _insert_bookings(pending, resources, session=session)
+        for pos in pending.keys() - created.keys():
+            results[pos].reason = BookingFailureReason.NOT_AVAILABLE
+        await _insert_reminders(created.values(), session=session)
+        await session.commit()
+
+        for pos, booking in created.items():
+            params = pending[pos]
+            self._on_created(params, booking.id, now)
+            results[pos].booking = booking
+            results[pos].resource_name = resources[params.resource_id].name
+        return results
+
+    @provider.inject_session
+    async def place_hold(
+        self,
+        params: BookingParams,
+        session: AsyncSession = None,
+    ) -> HoldResult:
+        """
+        Hold an interval for the user for HOLD_TTL_SECONDS.
+
+        The interval must pass the same time, resource and availability
+        checks as a booking; on a shared resource the hold takes one of the
+        units left by bookings. Holds of other users closer than the
+        resource buffers count as overlapping. A previous hold of the user on
+        the resource is replaced. Confirm with confirm_hold before it expires.
+        """
+        now = datetime.now(timezone.utc)
+        if not _is_valid_time(params.start_time, params.end_time, now):
+            return HoldResult(reason=BookingFailureReason.INVALID_TIME)
 
-        # Check if resource exists and belongs to customer
         resource = await Resource.get(id=params.resource_id, session=session)
-        if not resource or resource.customer_id != params.customer_id:
-            return None
+        if not resource:
+            return HoldResult(reason=BookingFailureReason.RESOURCE_NOT_FOUND)
+        if resource.customer_id != params.customer_id:
+            return HoldResult(reason=BookingFailureReason.WRONG_CUSTOMER)
+        buffers = Buffers.of(resource)
+        schedule = await schedule_registry.get(resource_id=resource.id, session=session)
+        if not schedule.is_open(*buffers.occupied(params.start_time, params.end_time)):
+            return HoldResult(reason=BookingFailureReason.CLOSED)
+
+        if resource.capacity == 1:
+            stmt = sa.select(
+                _overlap_exists(
+                    params.resource_id,
+                    *buffers.probe(params.start_time, params.end_time),
+                ),
+            )
+            free_units = 0 if await session.scalar(stmt) else 1
+        else:
+            stmt = sa.select(
+                _peak_concurrency(
+                    params.resource_id,
+                    params.start_time,
+                    params.end_time,
+                    buffers,
+                ),
+            )
+            free_units = resource.capacity - await session.scalar(stmt)
 
-        # Check availability (includes SELECT FOR UPDATE to prevent race condition)
-        is_available = await self.check_availability(
+        hold = new_hold(
             resource_id=params.resource_id,
+            user_id=params.user_id,
             start_time=params.start_time,
             end_time=params.end_time,
+        )
+        # place fails if other users' holds take the free units, checked
+        # atomically
+        if free_units < 1 or not await hold_storage.place(
+            hold,
+            limit=free_units,
+            gap=buffers.gap,
+        ):
+            return HoldResult(reason=BookingFailureReason.NOT_AVAILABLE)
+        return HoldResult(hold=hold)
+
+    @provider.inject_session
+    async def confirm_hold(  # noqa: PLR0913
+        self,
+        hold_id: str,
+        user_id: UUID,
+        customer_id: UUID,
+        source: str = "bot",
+        *,
+        before_commit: BeforeCommit | None = None,
+        session: AsyncSession = None,
+    ) -> BookingResult:
+        """
+        Turn the user's hold into a booking and release it.
+
+        Other users could not book the held interval meanwhile, so this only
+        fails if the hold expired or someone booked it before it was placed.
+        """
+        hold = await hold_storage.get(hold_id)
+        if hold is None or hold.user_id != user_id:
+            return BookingResult(reason=BookingFailureReason.HOLD_EXPIRED)
+
+        result = await self.try_create_booking(
+            params=BookingParams(
+                user_id=user_id,
+                customer_id=customer_id,
+                resource_id=hold.resource_id,
+                start_time=hold.start_time,
+                end_time=hold.end_time,
+                source=source,
+            ),
+            before_commit=before_commit,
             session=session,
         )
+        await hold_storage.release(hold_id)
+        return result
 
-        if not is_available:
-            return None
+    async def release_hold(self, hold_id: str, user_id: UUID) -> bool:
+        """Release the user's hold; False if not found or not owned by user."""
+        hold = await hold_storage.get(hold_id)
+        if hold is None or hold.user_id != user_id:
+            return False
+        await hold_storage.release(hold_id)
+        return True
 
-        # Create booking
-        booking = await Booking.create(
+    @provider.inject_session
+    async def create_series(
+        self,
+        params: SeriesParams,
+        session: AsyncSession = None,
+    ) -> SeriesResult:
+        """
+        Create a recurring series and all its occurrences, or nothing.
+
+        The rule is expanded lazily up to its COUNT/UNTIL bound, all
+        occurrences are checked with one set-based query against bookings,
+        then bookings and reminders are inserted with multi-row INSERTs.
+        Raises ValueError for an invalid or too long rule.
+        """
+        rule = _parse_series_rule(params.rrule, params.timezone)
+        now = datetime.now(timezone.utc)
+        if not _is_valid_time(params.start_time, params.end_time, now):
+            return SeriesResult(reason=BookingFailureReason.INVALID_TIME)
+
+        resource = await Resource.get(id=params.resource_id, session=session)
+        if not resource:
+            return SeriesResult(reason=BookingFailureReason.RESOURCE_NOT_FOUND)
+        if resource.customer_id != params.customer_id:
+            return SeriesResult(reason=BookingFailureReason.WRONG_CUSTOMER)
+
+        items = _expand_series(params, rule, now)
+        series = await BookingSeries.create(
             user_id=params.user_id,
             resource_id=params.resource_id,
             start_time=params.start_time,
             end_time=params.end_time,
+            rrule=str(rule),
+            timezone=params.timezone,
             session=session,
         )
-        await session.flush()
+        return await self._materialize_series(series, items, resource, now, session)
 
-        notification_24h_time = params.start_time - timedelta(hours=24)
-        await Notification.create(
-            booking_id=booking.id,
-            user_id=params.user_id,
-            type="booking_24h",
-            status=NotificationStatus.PENDING,
-            scheduled_at=notification_24h_time,
-            session=session,
+    @provider.inject_session
+    async def update_series(
+        self,
+        series_id: int,
+        user_id: UUID,
+        changes: SeriesUpdate,
+        source: str = "api",
+        session: AsyncSession = None,
+    ) -> SeriesResult | None:
+        """
+        Change a series; only future occurrences are touched.
+
+        Occurrences that started before now are kept as they are. Future
+        ones are deleted and re-expanded from the updated rule in the same
+        transaction, so a conflicting update leaves the series unchanged.
+        Returns None if the series is not found or not owned by user.
+        Raises ValueError for an invalid or too long rule.
+        """
+        series = await BookingSeries.get(id=series_id, session=session)
+        if not series or series.user_id != user_id:
+            return None
+        resource = await Resource.get(id=series.resource_id, session=session)
+
+        params = SeriesParams(
+            user_id=user_id,
+            customer_id=resource.customer_id,
+            resource_id=series.resource_id,
+            start_time=changes.start_time or series.start_time,
+            end_time=changes.end_time or series.end_time,
+            rrule=changes.rrule or series.rrule,
+            timezone=changes.timezone or series.timezone,
+            source=source,
         )
+        rule = _parse_series_rule(params.rrule, params.timezone)
+        if params.end_time <= params.start_time:
+            return SeriesResult(reason=BookingFailureReason.INVALID_TIME)
 
-        notification_1h_time = params.start_time - timedelta(hours=1)
-        await Notification.create(
-            booking_id=booking.id,
-            user_id=params.user_id,
-            type="booking_1h",
-            status=NotificationStatus.PENDING,
-            scheduled_at=notification_1h_time,
+        now = datetime.now(timezone.utc)
+        items = _expand_series(params, rule, now)
+        removed = await self._delete_future_occurrences(series.id, now, session)
+        series.start_time = params.start_time
+        series.end_time = params.end_time
+        series.rrule = str(rule)
+        series.timezone = params.timezone
+
+        result = await self._materialize_series(
+            series,
+            items,
+            resource,
+            now,
+            session,
+            record_metrics=False,
+        )
+        if result.ok:
+            for booking_id, start_time, end_time in removed:
+                self._on_removed(series.resource_id, booking_id, start_time, end_time)
+        return result
+
+    @provider.inject_session
+    async def cancel_series(
+        self,
+        series_id: int,
+        user_id: UUID,
+        source: str = "api",
+        session: AsyncSession = None,
+    ) -> bool:
+        """
+        End a series now: delete future occurrences, keep past ones.
+
+        The rule is cut with UNTIL so the series describes what remains.
+        Returns False if the series is not found or not owned by user.
+        """
+        series = await BookingSeries.get(id=series_id, session=session)
+        if not series or series.user_id != user_id:
+            return False
+        resource = await Resource.get(id=series.resource_id, session=session)
+
+        now = datetime.now(timezone.utc)
+        removed = await self._delete_future_occurrences(series.id, now, session)
+        rule = RecurrenceRule.parse(series.rrule)
+        if rule.until is None or rule.until > now:
+            rule = replace(rule, count=None, until=now.replace(microsecond=0))
+            series.rrule = str(rule)
+        await session.commit()
+
+        for booking_id, start_time, end_time in removed:
+            self._on_removed(series.resource_id, booking_id, start_time, end_time)
+        booking_cancelled_total.labels(
+            source=source,
+            customer_id=str(resource.customer_id),
+            resource_id=str(series.resource_id),
+        ).inc(len(removed))
+        return True
+
+    async def _materialize_series(  # noqa: PLR0913
+        self,
+        series: BookingSeries,
+        items: list[BookingParams],
+        resource: Resource,
+        now: datetime,
+        session: AsyncSession,
+        *,
+        record_metrics: bool = True,
+    ) -> SeriesResult:
+        """Check and insert series occurrences; commit or roll back all."""
+        if self.uses_advisory_lock:
+            await lock_resource(resource.id, session)
+        resources = {resource.id: resource}
+        schedules = await schedule_registry.get_many(
+            resource_ids=[resource.id],
             session=session,
         )
+        results = [BookingResult() for _ in items]
+        pending = _validate_batch(items, resources, schedules, results, now)
+        await _reject_unavailable(pending, resources, results, session)
+
+        conflicts = [pos for pos, result in enumerate(results) if result.reason]
+        if not conflicts:
+            created = await _insert_bookings(
+                pending,
+                resources,
+                session=session,
+                series_id=series.id,
+            )
+            # Occurrences skipped by ON CONFLICT lost a race
+            conflicts = sorted(pending.keys() - created.keys())
+        if conflicts:
+            await session.rollback()
+            return SeriesResult(
+                reason=BookingFailureReason.NOT_AVAILABLE,
+                conflicts=[items[pos].start_time for pos in conflicts],
+            )
+
+        await _insert_reminders(created.values(), session=session)
         await session.commit()
+        for pos, booking in created.items():
+            self._on_created(
+                items[pos],
+                booking.id,
+                now,
+                record_metrics=record_metrics,
+            )
+        return SeriesResult(series=series, bookings=list(created.values()))
+
+    async def _delete_future_occurrences(
+        self,
+        series_id: int,
+        now: datetime,
+        session: AsyncSession,
+    ) -> list[tuple[int, datetime, datetime]]:
+        """Delete occurrences starting at or after now (reminders cascade)."""
+        stmt = (
+            sa.delete(Booking)
+            .where(
+                sa.and_(
+                    Booking.series_id == series_id,
+                    Booking.start_time >= now,
+                ),
+            )
+            .returning(Booking.id, Booking.start_time, Booking.end_time)
+        )
+        return [tuple(row) for row in await session.execute(stmt)]
+
+    def _on_removed(
+        self,
+        resource_id: int,
+        booking_id: int,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> None:
+        """Sync in-memory indexes for a deleted booking."""
+        interval_index.remove(resource_id, booking_id)
+        _invalidate_free_slots(resource_id, start_time, end_time)
+
+    def _on_created(
+        self,
+        params: BookingParams,
+        booking_id: int,
+        now: datetime,
+        *,
+        record_metrics: bool = True,
+    ) -> None:
+        """Sync in-memory indexes and record metrics for a committed booking."""
+        interval_index.add(
+            params.resource_id,
+            booking_id,
+            params.start_time,
+            params.end_time,
+        )
+        _invalidate_free_slots(
+            params.resource_id,
+            params.start_time,
+            params.end_time,
+        )
+        if not record_metrics:
+            return
 
         # Record business metrics
         booking_created_total.labels(
@@ -165,48 +1335,107 @@ class BookingService:
             resource_id=str(params.resource_id),
         ).observe(lead_time_seconds)
 
-        return booking
-
     @provider.inject_session
-    async def get_user_bookings(
+    async def get_user_bookings(  # noqa: PLR0913
         self,
         user_id: UUID,
         customer_id: UUID,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+        since: datetime | None = None,
         session: AsyncSession = None,
-    ) -> list[Booking]:
-        """Get all bookings for a user within a customer."""
-        stmt = sa.select(Booking).where(
+    ) -> BookingPage:
+        """
+        Get bookings of a user within a customer ordered by (start_time, id).
+
+        With limit returns one page; pass its next_cursor to get the next.
+        With since only bookings not yet ended at that moment are listed.
+        Bookings moved to the archive are merged in when the listing can
+        reach them, i.e. without since or with since before the archive
+        cutoff; they come as BookingArchive rows.
+        Raise ValueError for a malformed cursor or a limit out of range.
+        """
+        rows = await self._user_bookings(
+            Booking,
+            user_id,
+            customer_id,
+            limit=limit,
+            cursor=cursor,
+            since=since,
+            session=session,
+        )
+        archive_cutoff = datetime.now(timezone.utc) - timedelta(
+            days=config.database.BOOKING_ARCHIVE_AFTER_DAYS,
+        )
+        if since is None or since < archive_cutoff:
+            archived = await self._user_bookings(
+                BookingArchive,
+                user_id,
+                customer_id,
+                limit=limit,
+                cursor=cursor,
+                since=since,
+                session=session,
+            )
+            # Both are in keyset order and ids are unique across the tables
+            rows = sorted([*rows, *archived], key=lambda b: (b.start_time, b.id))
+            if limit is not None:
+                rows = rows[: limit + 1]
+        return BookingPage.from_rows(rows, limit)
+
+    @staticmethod
+    async def _user_bookings(  # noqa: PLR0913
+        model: type[Booking | BookingArchive],
+        user_id: UUID,
+        customer_id: UUID,
+        *,
+        limit: int | None,
+        cursor: str | None,
+        since: datetime | None,
+        session: AsyncSession,
+    ) -> list[Booking | BookingArchive]:
+        """One keyset page of user bookings from bookings or the archive."""
+        stmt = sa.select(model).where(
             sa.and_(
-                Booking.user_id == user_id,
-                # Booking belongs to resources of this customer
-                Booking.resource_id.in_(
-                    sa.select(Resource.id).where(Resource.customer_id == customer_id),
-                ),
+                model.customer_id == customer_id,
+                model.user_id == user_id,
             ),
         )
+        if since is not None:
+            stmt = stmt.where(
+                model.end_time > since,
+                # Bound on start_time keeps the scan on the index
+                model.start_time > since - timedelta(days=MAX_BOOKING_DURATION_DAYS),
+            )
+        stmt = paginate(stmt, limit=limit, cursor=cursor, model=model)
         result = await session.scalars(stmt)
-        return result.all()
+        return list(result.all())
 
     @provider.inject_session
     async def get_resource_bookings(
         self,
         resource_id: int,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
         session: AsyncSession = None,
-    ) -> list[Booking]:
-        """Get all future bookings for a resource."""
+    ) -> BookingPage:
+        """
+        Get future bookings of a resource ordered by (start_time, id).
+
+        With limit returns one page; pass its next_cursor to get the next.
+        """
         now = datetime.now(timezone.utc)
-        stmt = (
-            sa.select(Booking)
-            .where(
-                sa.and_(
-                    Booking.resource_id == resource_id,
-                    Booking.start_time >= now,  # Only future bookings
-                ),
-            )
-            .order_by(Booking.start_time.asc())
+        stmt = sa.select(Booking).where(
+            sa.and_(
+                Booking.resource_id == resource_id,
+                Booking.start_time >= now,  # Only future bookings
+            ),
         )
+        stmt = paginate(stmt, limit=limit, cursor=cursor)
         result = await session.scalars(stmt)
-        return list(result.all())
+        return BookingPage.from_rows(list(result.all()), limit)
 
     @provider.inject_session
     async def cancel_booking(
@@ -214,6 +1443,8 @@ class BookingService:
         booking_id: int,
         user_id: UUID,
         source: str = "api",
+        *,
+        before_commit: Callable[[], Awaitable[None]] | None = None,
         session: AsyncSession = None,
     ) -> bool:
         """
@@ -221,6 +1452,7 @@ class BookingService:
 
         Security: Rights check is performed BEFORE deletion.
         Returns True if successful, False if booking not found or not owned by user.
+        before_commit is awaited after the delete, in the same transaction.
         """
         booking = await Booking.get(id=booking_id, session=session)
 
@@ -229,13 +1461,20 @@ class BookingService:
             return False
 
         # Delete using session ORM API to avoid duplication with Base.delete
-        # Get resource info before deletion for metrics
-        resource = await Resource.get(id=booking.resource_id, session=session)
-        customer_id = resource.customer_id if resource else "unknown"
+        customer_id = booking.customer_id
 
+        # Its feedbacks are removed by the bookings delete trigger
         await session.delete(booking)
         try:
+            if before_commit is not None:
+                await before_commit()
             await session.commit()
+            interval_index.remove(booking.resource_id, booking.id)
+            _invalidate_free_slots(
+                booking.resource_id,
+                booking.start_time,
+                booking.end_time,
+            )
 
             # Record business metrics for cancellation
             booking_cancelled_total.labels(
@@ -0,0 +1,174 @@
+"""Idempotency keys for booking create/cancel requests.
+
+A request with a key first reserves it (a row with no response yet) and
+stores its response in the same transaction as its own changes, so a
+booking never commits without its key. A retry with the same key is answered
+from that row without re-running validation or availability checks; a
+concurrent retry waits for the first request to finish. Keys expire after
+IDEMPOTENCY_TTL and are purged by the scheduler.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import hashlib
+import json
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.depends import AsyncSession, provider
+from app.infrastructure.database import IdempotencyKey
+
+IDEMPOTENCY_TTL = timedelta(hours=24)
+
+
+class IdempotencyScope:
+    """Operations that accept an idempotency key."""
+
+    BOOKING_CREATE = "booking_create"
+    BOOKING_CANCEL = "booking_cancel"
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """Response stored for a key and whether the request matches it."""
+
+    response: dict | None
+    same_request: bool
+
+    @property
+    def pending(self) -> bool:
+        """The request that reserved the key has not finished."""
+        return self.response is None
+
+
+def request_hash(payload: dict) -> str:
+    """SHA-256 of a JSON-serializable request payload in canonical form."""
+    data = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+class IdempotencyService:
+    """Store and replay responses of requests made with an idempotency key."""
+
+    @provider.inject_session
+    async def get(
+        self,
+        *,
+        user_id: UUID,
+        scope: str,
+        key: str,
+        payload: dict,
+        session: AsyncSession = None,
+    ) -> StoredResponse | None:
+        """Return the stored response for an unexpired key, or None."""
+        stmt = sa.select(IdempotencyKey.response, IdempotencyKey.request_hash).where(
+            sa.and_(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.scope == scope,
+                IdempotencyKey.key == key,
+                IdempotencyKey.expires_at > datetime.now(timezone.utc),
+            ),
+        )
+        row = (await session.execute(stmt)).first()
+        if row is None:
+            return None
+        return StoredResponse(
+            response=row.response,
+            same_request=row.request_hash == request_hash(payload),
+        )
+
+    async def reserve(
+        self,
+        *,
+        user_id: UUID,
+        scope: str,
+        key: str,
+        payload: dict,
+        session: AsyncSession,
+    ) -> StoredResponse | None:
+        """Reserve key for this request; return None if reserved.
+
+        Inserts a pending row without committing: the caller runs the request
+        and calls complete in the same transaction, so the key and the result
+        are committed together, or rolled back together on failure. A
+        concurrent request with the same key waits on the row and then gets
+        the stored response (None if that request failed and was rolled
+        back, so the retry runs it again).
+        """
+        now = datetime.now(timezone.utc)
+        stmt = (
+            pg_insert(IdempotencyKey)
+            .values(
+                user_id=user_id,
+                scope=scope,
+                key=key,
+                request_hash=request_hash(payload),
+                response=sa.null(),
+                expires_at=now + IDEMPOTENCY_TTL,
+            )
+            # An expired key that is not purged yet is reused
+            .on_conflict_do_update(
+                index_elements=["user_id", "scope", "key"],
+                set_={
+                    "request_hash": request_hash(payload),
+                    "response": sa.null(),
+                    "expires_at": now + IDEMPOTENCY_TTL,
+                },
+                where=IdempotencyKey.expires_at <= now,
+            )
+            .returning(IdempotencyKey.key)
+        )
+        if await session.scalar(stmt) is not None:
+            return None
+        stored = await self.get(
+            user_id=user_id,
+            scope=scope,
+            key=key,
+            payload=payload,
+            session=session,
+        )
+        if stored is None:
+            # The row expired between the insert and the lookup
+            return await self.reserve(
+                user_id=user_id,
+                scope=scope,
+                key=key,
+                payload=payload,
+                session=session,
+            )
+        return stored
+
+    async def complete(
+        self,
+        *,
+        user_id: UUID,
+        scope: str,
+        key: str,
+        response: dict,
+        session: AsyncSession,
+    ) -> None:
+        """Store response for a key reserved in this transaction."""
+        stmt = (
+            sa.update(IdempotencyKey)
+            .where(
+                sa.and_(
+                    IdempotencyKey.user_id == user_id,
+                    IdempotencyKey.scope == scope,
+                    IdempotencyKey.key == key,
+                ),
+            )
+            .values(response=response)
+        )
+        await session.execute(stmt)
+
+    @provider.inject_session
+    async def purge_expired(self, session: AsyncSession = None) -> int:
+        """Delete expired keys; return the number of deleted rows."""
+        stmt = sa.delete(IdempotencyKey).where(
+            IdempotencyKey.expires_at <= datetime.now(timezone.utc),
+        )
+        result = await session.execute(stmt)
+        await session.commit()
+        return result.rowcount
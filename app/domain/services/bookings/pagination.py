@@ -0,0 +1,105 @@
+"""Keyset pagination of booking listings.
+
+Listings are ordered by (start_time, id); a cursor is the position of the
+last booking of a page, so the next page is one index range scan on
+(..., start_time, id) whatever the page number.
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+import sqlalchemy as sa
+
+from app.infrastructure.database import Booking, BookingArchive
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True)
+class BookingCursor:
+    """Position after a booking in (start_time, id) order."""
+
+    start_time: datetime
+    id: int
+
+    @classmethod
+    def after(cls, booking: Booking | BookingArchive) -> "BookingCursor":
+        return cls(start_time=booking.start_time, id=booking.id)
+
+    def encode(self) -> str:
+        """Opaque URL-safe token (fits Telegram callback data)."""
+        us = (self.start_time - _EPOCH) // _MICROSECOND
+        raw = f"{us}:{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "BookingCursor":
+        """Parse token from encode(); raise ValueError if malformed."""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            us, booking_id = raw.decode().split(":")
+            return cls(
+                start_time=_EPOCH + int(us) * _MICROSECOND,
+                id=int(booking_id),
+            )
+        except (binascii.Error, UnicodeDecodeError, ValueError, OverflowError) as e:
+            msg = "Invalid cursor"
+            raise ValueError(msg) from e
+
+    def where(
+        self,
+        model: type[Booking | BookingArchive] = Booking,
+    ) -> sa.ColumnElement[bool]:
+        """Filter for bookings (of model) after the cursor."""
+        return sa.tuple_(model.start_time, model.id) > sa.tuple_(
+            self.start_time,
+            self.id,
+        )
+
+
+@dataclass
+class BookingPage:
+    """One page of bookings and the cursor of the next one (None if last)."""
+
+    items: list[Booking | BookingArchive] = field(default_factory=list)
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: list[Booking | BookingArchive],
+        limit: int | None,
+    ) -> "BookingPage":
+        """Build page from up to limit + 1 rows fetched in keyset order."""
+        if limit is None or len(rows) <= limit:
+            return cls(items=rows)
+        items = rows[:limit]
+        return cls(items=items, next_cursor=BookingCursor.after(items[-1]).encode())
+
+
+def paginate(
+    stmt: sa.Select,
+    *,
+    limit: int | None,
+    cursor: str | None,
+    model: type[Booking | BookingArchive] = Booking,
+) -> sa.Select:
+    """Apply keyset order, cursor and limit + 1 to a select of model rows.
+
+    Raise ValueError for a malformed cursor or a limit out of range.
+    """
+    if limit is not None and not 1 <= limit <= MAX_PAGE_SIZE:
+        msg = f"limit must be between 1 and {MAX_PAGE_SIZE}"
+        raise ValueError(msg)
+    if cursor is not None:
+        stmt = stmt.where(BookingCursor.decode(cursor).where(model))
+    stmt = stmt.order_by(model.start_time.asc(), model.id.asc())
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    return stmt
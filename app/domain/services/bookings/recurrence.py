@@ -0,0 +1,154 @@
+"""Minimal RRULE (RFC 5545) support for recurring bookings.
+
+Supported parts: FREQ=DAILY|WEEKLY, INTERVAL, BYDAY (weekly only, plain
+weekday codes), COUNT and UNTIL. Weeks start on Monday. Occurrences keep the
+local wall-clock time of the first one in the series timezone, so "every
+Tuesday 10:00" stays at 10:00 across DST changes.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+FREQUENCIES = ("DAILY", "WEEKLY")
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """Parsed recurrence rule."""
+
+    freq: str
+    interval: int = 1
+    byday: tuple[int, ...] = ()  # Weekday numbers, Monday = 0
+    count: int | None = None
+    until: datetime | None = None
+
+    @classmethod
+    def parse(cls, rule: str) -> "RecurrenceRule":
+        """Parse "FREQ=WEEKLY;BYDAY=TU;COUNT=26"; raise ValueError if invalid."""
+        parts: dict[str, str] = {}
+        for part in rule.removeprefix("RRULE:").split(";"):
+            key, sep, value = part.partition("=")
+            if not sep or not value:
+                msg = f"Invalid RRULE part: {part!r}"
+                raise ValueError(msg)
+            parts[key.upper()] = value.upper()
+
+        freq = parts.pop("FREQ", None)
+        if freq not in FREQUENCIES:
+            msg = f"FREQ must be one of {', '.join(FREQUENCIES)}"
+            raise ValueError(msg)
+        interval = _positive_int(parts.pop("INTERVAL", "1"), "INTERVAL")
+        count = parts.pop("COUNT", None)
+        until = parts.pop("UNTIL", None)
+        byday = parts.pop("BYDAY", None)
+        if parts:
+            msg = f"Unsupported RRULE parts: {', '.join(sorted(parts))}"
+            raise ValueError(msg)
+        if count is not None and until is not None:
+            msg = "COUNT and UNTIL must not be used together"
+            raise ValueError(msg)
+        if byday is not None and freq != "WEEKLY":
+            msg = "BYDAY is only supported with FREQ=WEEKLY"
+            raise ValueError(msg)
+
+        return cls(
+            freq=freq,
+            interval=interval,
+            byday=_parse_byday(byday) if byday is not None else (),
+            count=_positive_int(count, "COUNT") if count is not None else None,
+            until=_parse_until(until) if until is not None else None,
+        )
+
+    def __str__(self) -> str:
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.byday:
+            parts.append("BYDAY=" + ",".join(WEEKDAYS[day] for day in self.byday))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            parts.append(f"UNTIL={self.until:%Y%m%dT%H%M%SZ}")
+        return ";".join(parts)
+
+    @property
+    def is_bounded(self) -> bool:
+        return self.count is not None or self.until is not None
+
+    def occurrences(self, dtstart: datetime, tz: str = "UTC") -> Iterator[datetime]:
+        """Lazily yield occurrence starts (UTC) beginning with dtstart.
+
+        dtstart is always the first occurrence. The generator is infinite
+        for a rule without COUNT/UNTIL; callers bound it.
+        """
+        zone = get_zone(tz)
+        local_start = dtstart.astimezone(zone).replace(tzinfo=None)
+        for emitted, local in enumerate(self._local_occurrences(local_start), 1):
+            occurrence = local.replace(tzinfo=zone).astimezone(timezone.utc)
+            if self.until is not None and occurrence > self.until:
+                return
+            yield occurrence
+            if self.count is not None and emitted >= self.count:
+                return
+
+    def _local_occurrences(self, local_start: datetime) -> Iterator[datetime]:
+        """Yield naive local occurrence times in order, starting at local_start."""
+        if self.freq == "DAILY":
+            step = timedelta(days=self.interval)
+            current = local_start
+            while True:
+                yield current
+                current += step
+
+        weekdays = self.byday or (local_start.weekday(),)
+        week_start = local_start - timedelta(days=local_start.weekday())
+        yield local_start
+        while True:
+            for weekday in weekdays:
+                occurrence = week_start + timedelta(days=weekday)
+                if occurrence > local_start:
+                    yield occurrence
+            week_start += timedelta(weeks=self.interval)
+
+
+def get_zone(tz: str) -> ZoneInfo:
+    """Return ZoneInfo for an IANA name; raise ValueError if unknown."""
+    try:
+        return ZoneInfo(tz)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        msg = f"Unknown timezone: {tz}"
+        raise ValueError(msg) from e
+
+
+def _positive_int(value: str, name: str) -> int:
+    if not value.isdigit() or int(value) < 1:
+        msg = f"{name} must be a positive integer"
+        raise ValueError(msg)
+    return int(value)
+
+
+def _parse_byday(value: str) -> tuple[int, ...]:
+    days = set()
+    for code in value.split(","):
+        if code not in WEEKDAYS:
+            msg = f"Invalid BYDAY value: {code!r}"
+            raise ValueError(msg)
+        days.add(WEEKDAYS.index(code))
+    return tuple(sorted(days))
+
+
+def _parse_until(value: str) -> datetime:
+    for fmt in ("%Y%m%dT%H%M%SZ", "%Y%m%d"):
+        try:
+            until = datetime.strptime(value, fmt).replace(tzinfo=timezone.utc)
+        except ValueError:
+            continue
+        if fmt == "%Y%m%d":
+            # A date UNTIL includes the whole day
+            until += timedelta(days=1, microseconds=-1)
+        return until
+    msg = "UNTIL must be YYYYMMDD or YYYYMMDDTHHMMSSZ"
+    raise ValueError(msg)
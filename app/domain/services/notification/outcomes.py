@@ -0,0 +1,113 @@
+"""Bulk write-back of processed notification statuses.
+
+Workers record outcomes (SENT or FAILED with message/error) in a buffer
+that is written with one UPDATE ... FROM (VALUES ...) statement whenever it
+holds flush_size rows, every flush_interval seconds while the batch is
+sent, and once more at the end of the batch. A crash loses at most the
+last flush_interval of outcomes: those rows stay processing and the stale
+claims reaper returns them to pending, so they may be sent again.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+
+from app.infrastructure.database.models.notification import Notification
+from app.log import log
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+# Outcomes written by one statement at most
+FLUSH_SIZE = 50
+# Seconds an outcome may wait in the buffer
+FLUSH_INTERVAL_SECONDS = 1.0
+
+
+class NotificationOutcomes:
+    """Buffer of notification outcomes written in bulk.
+
+    Use as an async context manager around sending a batch: it flushes
+    periodically while open and writes the rest on exit.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        flush_size: int = FLUSH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._flusher: asyncio.Task | None = None
+        self._closed = asyncio.Event()
+        self._rows: list[tuple[int, str, datetime | None, str | None, str | None]] = []
+
+    async def __aenter__(self) -> "NotificationOutcomes":
+        self._flusher = asyncio.create_task(self._flush_periodically())
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # Not cancelled: a flush in progress must finish writing its rows
+        self._closed.set()
+        await self._flusher
+        await self.flush()
+
+    async def record(self, notification: Notification) -> None:
+        """Buffer outcome of a processed notification, flushing when full."""
+        self._rows.append(
+            (
+                notification.id,
+                notification.status,
+                notification.processed_at,
+                notification.message,
+                notification.error,
+            ),
+        )
+        if len(self._rows) >= self.flush_size:
+            await self.flush()
+
+    async def _flush_periodically(self) -> None:
+        while not self._closed.is_set():
+            try:
+                await asyncio.wait_for(self._closed.wait(), self.flush_interval)
+            except TimeoutError:
+                await self.flush()
+
+    async def flush(self) -> None:
+        """Write buffered outcomes; workers keep recording meanwhile."""
+        rows, self._rows = self._rows, []
+        if not rows:
+            return
+        outcome = sa.values(
+            sa.column("id", sa.Integer),
+            sa.column("status", sa.String),
+            sa.column("processed_at", sa.DateTime(timezone=True)),
+            sa.column("message", sa.Text),
+            sa.column("error", sa.Text),
+            name="outcome",
+        ).data(rows)
+        try:
+            async with self.session_factory() as session:
+                await session.execute(
+                    sa.update(Notification)
+                    .where(Notification.id == outcome.c.id)
+                    .values(
+                        status=outcome.c.status,
+                        processed_at=outcome.c.processed_at,
+                        message=outcome.c.message,
+                        error=outcome.c.error,
+                    )
+                    .execution_options(synchronize_session=False),
+                )
+                await session.commit()
+        except Exception as e:  # noqa: BLE001
+            log(
+                level="error",
+                method="flush",
+                path="NotificationOutcomes",
+                text_detail=f"Error writing {len(rows)} notification outcomes: {e}",
+                exception=e,
+            )
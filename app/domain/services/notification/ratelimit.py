@@ -0,0 +1,78 @@
+"""Token buckets keeping notification sends within Telegram limits.
+
+Telegram allows a bot about one message per second to one chat and about
+30 messages per second overall; the global bucket caps the whole instance
+across all bots. A send takes a token from the chat, bot and global
+buckets, most specific first, waiting while a bucket is empty.
+"""
+
+import asyncio
+from collections.abc import Hashable
+import time
+
+# Idle (full) per-chat buckets are dropped above this many buckets
+MAX_BUCKETS = 10_000
+
+
+class TokenBucket:
+    """Refills rate tokens per second up to capacity; acquire takes one."""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        # Waiters queue on the lock, so tokens go out in arrival order
+        self._lock = asyncio.Lock()
+
+    @property
+    def full(self) -> bool:
+        self._refill()
+        return self._tokens >= self.capacity
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate,
+        )
+        self._updated = now
+
+
+class SendRateLimiter:
+    """Per-chat, per-bot and global token buckets."""
+
+    def __init__(self, chat_rate: float, bot_rate: float, global_rate: float):
+        self.chat_rate = chat_rate
+        self.bot_rate = bot_rate
+        self._global = TokenBucket(global_rate)
+        self._bots: dict[Hashable, TokenBucket] = {}
+        self._chats: dict[Hashable, TokenBucket] = {}
+
+    async def acquire(self, bot_id: Hashable, chat_id: Hashable) -> None:
+        """Wait until a message from bot_id to chat_id may be sent."""
+        await self._bucket(self._chats, chat_id, self.chat_rate).acquire()
+        await self._bucket(self._bots, bot_id, self.bot_rate).acquire()
+        await self._global.acquire()
+
+    @staticmethod
+    def _bucket(
+        buckets: dict[Hashable, TokenBucket],
+        key: Hashable,
+        rate: float,
+    ) -> TokenBucket:
+        bucket = buckets.get(key)
+        if bucket is None:
+            if len(buckets) >= MAX_BUCKETS:
+                for idle in [k for k, b in buckets.items() if b.full]:
+                    del buckets[idle]
+            bucket = buckets[key] = TokenBucket(rate)
+        return bucket
@@ -1,4 +1,6 @@
-import contextlib
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 import uuid
@@ -8,14 +10,24 @@ import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.bot import bot_manager
+from app.config import config
 from app.infrastructure.database.models.notification import (
     Notification,
     NotificationStatus,
 )
-from app.infrastructure.database.models.users import BotConfig, User
+from app.infrastructure.database.models.users import BotConfig
 from app.log import log
 
 from .factory import NotificationFactory
+from .ratelimit import SendRateLimiter
+
+
+@dataclass
+class NotificationBatch:
+    """Bots and recipients of a batch, resolved before sending."""
+
+    bots: dict[uuid.UUID, Any] = field(default_factory=dict)  # customer_id -> Bot
+    chats: dict[uuid.UUID, int] = field(default_factory=dict)  # user_id -> tlg_id
 
 
 class NotificationService:
@@ -25,279 +37,219 @@ class NotificationService:
         """Initialize notification service with database session factory."""
         self.session_factory = session_factory
         self._bot_cache = {}  # Cache: customer_id -> Bot
-
-    async def send_booking_24h(self, notification: Notification) -> bool:
+        # Concurrent batches must not start a customer bot twice
+        self._bot_lock = asyncio.Lock()
+        self.rate_limiter = SendRateLimiter(
+            chat_rate=config.bot.NOTIFICATION_CHAT_RATE,
+            bot_rate=config.bot.NOTIFICATION_BOT_RATE,
+            global_rate=config.bot.NOTIFICATION_GLOBAL_RATE,
+        )
+
+    async def send_booking_24h(
+        self,
+        notification: Notification,
+        batch: NotificationBatch,
+    ) -> bool:
         """Send 24-hour booking reminder notification."""
-        return await self._send_notification(notification)
+        return await self._send_notification(notification, batch)
 
-    async def send_booking_1h(self, notification: Notification) -> bool:
+    async def send_booking_1h(
+        self,
+        notification: Notification,
+        batch: NotificationBatch,
+    ) -> bool:
         """Send 1-hour booking reminder notification."""
-        return await self._send_notification(notification)
+        return await self._send_notification(notification, batch)
 
-    async def send_booking_start(self, notification: Notification) -> bool:
+    async def send_booking_start(
+        self,
+        notification: Notification,
+        batch: NotificationBatch,
+    ) -> bool:
         """Send booking start notification."""
-        return await self._send_notification(notification)
+        return await self._send_notification(notification, batch)
 
-    async def send_booking_end(self, notification: Notification) -> bool:
+    async def send_booking_end(
+        self,
+        notification: Notification,
+        batch: NotificationBatch,
+    ) -> bool:
         """Send booking end notification."""
-        return await self._send_notification(notification)
+        return await self._send_notification(notification, batch)
 
-    async def send_booking_eval(self, notification: Notification) -> bool:
+    async def send_booking_eval(
+        self,
+        notification: Notification,
+        batch: NotificationBatch,
+    ) -> bool:
         """Send booking evaluation"""
-        return await self._send_notification(notification)
+        return await self._send_notification(notification, batch)
 
-    async def _send_notification(  # noqa: PLR0912
+    async def resolve_batch(
+        self,
+        notifications: Sequence[Notification],
+        session: AsyncSession,
+    ) -> NotificationBatch:
+        """Resolve bots and Telegram ids of a batch with set-based queries.
+
+        Notifications must have booking and user loaded. Bots missing from
+        the cache are read with one query and started; sends of the batch
+        then need no DB I/O.
+        """
+        batch = NotificationBatch(
+            chats={
+                notification.user_id: notification.user.tlg_id
+                for notification in notifications
+                if notification.user is not None and notification.user.tlg_id
+            },
+        )
+        customer_ids = {
+            notification.booking.customer_id
+            for notification in notifications
+            if notification.booking is not None
+        }
+        async with self._bot_lock:
+            missing = [c for c in customer_ids if c not in self._bot_cache]
+            if missing:
+                # One bot per customer, as before: the first configured one
+                rows = await session.execute(
+                    sa.select(BotConfig.owner_id, BotConfig.id, BotConfig.token)
+                    .where(BotConfig.owner_id.in_(missing))
+                    .distinct(BotConfig.owner_id)
+                    .order_by(BotConfig.owner_id, BotConfig.id),
+                )
+                for customer_id, bot_id, bot_token in rows:
+                    bot = await self._start_bot(customer_id, bot_id, bot_token)
+                    if bot is not None:
+                        self._bot_cache[customer_id] = bot
+        batch.bots = {
+            customer_id: self._bot_cache[customer_id]
+            for customer_id in customer_ids
+            if customer_id in self._bot_cache
+        }
+        return batch
+
+    async def _send_notification(
         self,
         notification: Notification,
-        session: AsyncSession = None,
+        batch: NotificationBatch,
     ) -> bool:
-        external_session = session is not None
-        if session is None:
-            session = self.session_factory()
-
-        try:
-            notification.status = NotificationStatus.PROCESSING
-            notification.processed_at = datetime.now(ZoneInfo("UTC"))
-            await session.flush()
+        """Send notification, setting its status; the caller writes it."""
+        notification.status = NotificationStatus.PROCESSING
+        notification.processed_at = datetime.now(ZoneInfo("UTC"))
 
-            # Get customer_id for notification
-            customer_id = await self._get_customer_for_notification(notification)
-            if not customer_id:
-                await self._mark_as_failed(
-                    notification,
-                    session,
-                    "Could not determine customer for notification",
-                )
-                if not external_session:
-                    await session.commit()
-                return False
+        booking = notification.booking
+        if not booking:
+            await self._mark_as_failed(notification, "Booking data not loaded")
+            return False
 
-            # Get bot for customer
-            bot = await self._get_bot_for_customer(customer_id, session)
-            if not bot:
-                await self._mark_as_failed(
-                    notification,
-                    session,
-                    f"Bot not found for customer {customer_id}",
-                )
-                if not external_session:
-                    await session.commit()
-                return False
+        bot = batch.bots.get(booking.customer_id)
+        if not bot:
+            await self._mark_as_failed(
+                notification,
+                f"Bot not found for customer {booking.customer_id}",
+            )
+            return False
 
-            # Get booking data
-            booking = notification.booking
-            if not booking:
-                await self._mark_as_failed(
-                    notification,
-                    session,
-                    "Booking data not loaded",
-                )
-                if not external_session:
-                    await session.commit()
-                return False
+        tlg_id = batch.chats.get(notification.user_id)
+        if not tlg_id:
+            await self._mark_as_failed(
+                notification,
+                f"Telegram ID not found for user {notification.user_id}",
+            )
+            return False
 
-            # Create message
+        try:
             message = NotificationFactory.create_message(notification.type, booking)
-
-            try:
-                # Send message
-                await self._send_telegram_message(
-                    bot=bot,
-                    user_id=notification.user_id,
-                    message=message,
-                )
-
-                # Update status
-                notification.status = NotificationStatus.SENT
-                notification.message = message
-                log(
-                    level="info",
-                    method="_send_notification",
-                    path="NotificationService",
-                    text_detail=f"Notification {notification.id} sent to user {notification.user_id}",  # noqa: E501
-                )
-
-                if not external_session:
-                    await session.commit()
-
-                return True
-
-            except Exception as e:  # noqa: BLE001
-                log(
-                    level="error",
-                    method="_send_notification",
-                    path="NotificationService",
-                    text_detail=f"Error sending notification {notification.id}: {e}",
-                    exception=e,
-                )
-                await self._mark_as_failed(notification, session, str(e))
-                if not external_session:
-                    await session.commit()
-                return False
-
+            await self._send_telegram_message(
+                bot=bot,
+                tlg_id=tlg_id,
+                message=message,
+            )
         except Exception as e:  # noqa: BLE001
             log(
                 level="error",
                 method="_send_notification",
                 path="NotificationService",
-                text_detail=f"Unexpected error in send_notification: {e}",
+                text_detail=f"Error sending notification {notification.id}: {e}",
                 exception=e,
             )
-            if not external_session:
-                with contextlib.suppress(Exception):
-                    await session.rollback()
+            await self._mark_as_failed(notification, str(e))
             return False
-        finally:
-            if not external_session:
-                await session.close()
 
-    async def _get_customer_for_notification(
+        notification.status = NotificationStatus.SENT
+        notification.message = message
+        log(
+            level="info",
+            method="_send_notification",
+            path="NotificationService",
+            text_detail=f"Notification {notification.id} sent to user {notification.user_id}",  # noqa: E501
+        )
+        return True
+
+    async def _start_bot(
         self,
-        notification: Notification,
-    ) -> str | None:
-        """Get customer ID for notification's booking resource."""
-        try:
-            if not notification.booking or not notification.booking.resource_obj:
-                return None
-
-            resource = notification.booking.resource_obj
-            if not resource.customer_id:
-                return None
-
-            return str(resource.customer_id)
+        customer_id: uuid.UUID,
+        bot_id: int,
+        bot_token: str | None,
+    ) -> Any | None:
+        """Get bot from BotManager, starting it if needed."""
+        bot = bot_manager.bots.get(bot_id)
+        if bot:
+            log(
+                level="debug",
+                method="_start_bot",
+                path="NotificationService",
+                text_detail=f"Bot for customer {customer_id} obtained from BotManager",
+            )
+            return bot
 
-        except Exception as e:  # noqa: BLE001
+        if not bot_token:
             log(
                 level="error",
-                method="_get_customer_for_notification",
+                method="_start_bot",
                 path="NotificationService",
-                text_detail=f"Error getting customer for notification: {e}",
-                exception=e,
+                text_detail=f"Bot token not found for customer {customer_id}",
             )
             return None
 
-    async def _get_bot_for_customer(  # noqa: PLR0911
-        self,
-        customer_id_str: str,
-        session: AsyncSession,
-    ) -> Any | None:
-        """Get bot for customer from DB with caching."""
-        # Check cache
-        if customer_id_str in self._bot_cache:
-            return self._bot_cache[customer_id_str]
-
         try:
-            # Convert string to UUID
-            try:
-                customer_id_uuid = uuid.UUID(customer_id_str)
-            except ValueError:
-                log(
-                    level="error",
-                    method="_get_bot_for_customer",
-                    path="NotificationService",
-                    text_detail=f"Invalid UUID format for: {customer_id_str}",
-                )
-                return None
-
-            # Find bot for this customer: get id and token
-            stmt = (
-                sa.select(BotConfig.id, BotConfig.token)
-                .where(
-                    BotConfig.owner_id == customer_id_uuid,
-                )
-                .limit(1)
-            )
-
-            row = await session.execute(stmt)
-            res = row.first()
-            if not res:
-                log(
-                    level="error",
-                    method="_get_bot_for_customer",
-                    path="NotificationService",
-                    text_detail=f"BotConfig not found for customer {customer_id_str}",
-                )
-                return None
-
-            bot_id, bot_token = res[0], res[1]
-
-            # Try to get bot from BotManager
-            bot = bot_manager.bots.get(bot_id)
-            if bot:
-                self._bot_cache[customer_id_str] = bot
-                log(
-                    level="debug",
-                    method="_get_bot_for_customer",
-                    path="NotificationService",
-                    text_detail=f"Bot for customer {customer_id_str} obtained from BotManager",  # noqa: E501
-                )
-                return bot
-
-            if not bot_token:
-                log(
-                    level="error",
-                    method="_get_bot_for_customer",
-                    path="NotificationService",
-                    text_detail=f"Bot token not found for customer {customer_id_str}",
-                )
-                return None
-
-            try:
-                await bot_manager.start_bot(bot_id, bot_token)
-                bot = bot_manager.bots.get(bot_id)
-                if bot:
-                    self._bot_cache[customer_id_str] = bot
-                    log(
-                        level="debug",
-                        method="_get_bot_for_customer",
-                        path="NotificationService",
-                        text_detail=f"Customer Bot {customer_id_str} registered",
-                    )
-                    return bot
-                log(
-                    level="error",
-                    method="_get_bot_for_customer",
-                    path="NotificationService",
-                    text_detail=f"Failed to get bot {customer_id_str}",
-                )
-                return None
-            except Exception as e:  # noqa: BLE001
-                log(
-                    level="error",
-                    method="_get_bot_for_customer",
-                    path="NotificationService",
-                    text_detail=f"Error starting bot BotManager{customer_id_str}: {e}",
-                    exception=e,
-                )
-                return None
-
+            await bot_manager.start_bot(bot_id, bot_token)
         except Exception as e:  # noqa: BLE001
             log(
                 level="error",
-                method="_get_bot_for_customer",
+                method="_start_bot",
                 path="NotificationService",
-                text_detail=f"Error getting bot for customer {customer_id_str}: {e}",
+                text_detail=f"Error starting bot BotManager{customer_id}: {e}",
                 exception=e,
             )
             return None
-
-    async def _send_telegram_message(self, bot: Any, user_id: str, message: str):
+        bot = bot_manager.bots.get(bot_id)
+        if bot:
+            log(
+                level="debug",
+                method="_start_bot",
+                path="NotificationService",
+                text_detail=f"Customer Bot {customer_id} registered",
+            )
+            return bot
+        log(
+            level="error",
+            method="_start_bot",
+            path="NotificationService",
+            text_detail=f"Failed to get bot {customer_id}",
+        )
+        return None
+
+    async def _send_telegram_message(self, bot: Any, tlg_id: int, message: str):
         """Send message via Telegram."""
         try:
-            # user_id is UUID, need to find User by this UUID
-            async with self.session_factory() as session:
-                stmt = sa.select(User.tlg_id).where(User.id == user_id)
-                tlg_id = await session.scalar(stmt)
-                if not tlg_id:
-                    msg = f"Telegram ID not found for user {user_id}"
-                    raise ValueError(
-                        msg,
-                    )
-                await bot.send_message(
-                    chat_id=tlg_id,
-                    text=message,
-                    parse_mode="HTML",
-                )
+            await self.rate_limiter.acquire(bot.id, tlg_id)
+            await bot.send_message(
+                chat_id=tlg_id,
+                text=message,
+                parse_mode="HTML",
+            )
         except Exception as e:
             log(
                 level="error",
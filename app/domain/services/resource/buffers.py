@@ -0,0 +1,57 @@
+"""Setup and turnaround buffers around bookings of a resource.
+
+A booking of a resource with buffers occupies it from start - before to
+end + after; holds and closed hours are compared the same way, closed hours
+being occupied as they are. Bookings are stored as booked: buffers only
+widen intervals while overlaps are computed. Occupied intervals of two
+bookings overlap exactly when the stored interval of one overlaps the other
+widened by before + after on both sides, so lookups keep using the plain
+`during` range and its GiST index.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from app.infrastructure.database import Resource
+
+
+@dataclass(frozen=True)
+class Buffers:
+    """Time a booking occupies its resource before and after itself."""
+
+    before: timedelta = timedelta(0)
+    after: timedelta = timedelta(0)
+
+    @classmethod
+    def of(cls, resource: Resource) -> "Buffers":
+        return cls(
+            before=timedelta(seconds=resource.buffer_before),
+            after=timedelta(seconds=resource.buffer_after),
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.before or self.after)
+
+    @property
+    def gap(self) -> timedelta:
+        """Least distance between two bookings."""
+        return self.before + self.after
+
+    def occupied(self, start: datetime, end: datetime) -> tuple[datetime, datetime]:
+        """Interval a booking of [start, end) occupies."""
+        return start - self.before, end + self.after
+
+    def probe(self, start: datetime, end: datetime) -> tuple[datetime, datetime]:
+        """Stored bookings overlapping this window compete with [start, end)."""
+        return start - self.gap, end + self.gap
+
+    def blocking(
+        self,
+        spans: Iterable[tuple[datetime, datetime]],
+    ) -> list[tuple[datetime, datetime]]:
+        """Occupied spans as intervals a new booking itself must not overlap."""
+        return [(start - self.after, end + self.before) for start, end in spans]
+
+
+NO_BUFFERS = Buffers()
@@ -0,0 +1,176 @@
+"""Free slots result cache keyed by (resource_id, day bucket, slot).
+
+Only whole-day windows (UTC day buckets, as requested by the `date` mode of
+the free slots endpoint) are cached. Entries expire after a TTL, the least
+recently used entry is evicted when the cache is full, and BookingService
+invalidates the day buckets touched by a created or cancelled booking.
+"""
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import (
+    date,
+    datetime,
+    time as dt_time,
+    timedelta,
+    timezone,
+)
+import time
+
+from app.metrics.cache import (
+    free_slots_cache_evictions_total,
+    free_slots_cache_hits_total,
+    free_slots_cache_misses_total,
+)
+
+CACHE_TTL_SECONDS = 30
+CACHE_MAX_ENTRIES = 10_000
+
+_DAY = timedelta(days=1)
+_MICROSECOND = timedelta(microseconds=1)
+
+CacheKey = tuple[int, date, int]
+
+
+@dataclass
+class _Entry:
+    effective_start: datetime
+    end: datetime
+    slots: Sequence[tuple[datetime, datetime]]
+    expires_at: float
+
+
+def day_bucket(start: datetime, end: datetime) -> date | None:
+    """Return UTC day if [start, end] is exactly that day, otherwise None.
+
+    Both the exclusive (next midnight) and the inclusive (midnight - 1us) end
+    used by the free slots endpoint are accepted.
+    """
+    start_utc = start.astimezone(timezone.utc)
+    day = start_utc.date()
+    day_start = datetime.combine(day, dt_time.min, tzinfo=timezone.utc)
+    if start_utc != day_start:
+        return None
+    if end not in (day_start + _DAY, day_start + _DAY - _MICROSECOND):
+        return None
+    return day
+
+
+class FreeSlotsCache:
+    """TTL + LRU cache of free slots with per-(resource, day) invalidation."""
+
+    def __init__(
+        self,
+        ttl: float = CACHE_TTL_SECONDS,
+        max_entries: int = CACHE_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        # (resource_id, day) -> slot sizes cached for it, for invalidation
+        self._slots_by_bucket: dict[tuple[int, date], set[int]] = {}
+        # Bumped on every invalidation of a resource
+        self._versions: dict[int, int] = {}
+
+    def version(self, resource_id: int) -> int:
+        """Current invalidation version; pass it to set() after computing."""
+        return self._versions.get(resource_id, 0)
+
+    def get(
+        self,
+        resource_id: int,
+        day: date,
+        slot: int,
+        *,
+        effective_start: datetime,
+        end: datetime,
+    ) -> Sequence[tuple[datetime, datetime]] | None:
+        """Return cached slots or None.
+
+        An entry is only valid for the effective start it was computed for:
+        once now passes the next slot boundary the entry is recomputed. Slots
+        carry the offset of the request, so another offset is a miss too.
+        """
+        key = (resource_id, day, slot)
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            free_slots_cache_evictions_total.labels(reason="ttl").inc()
+            entry = None
+        if (
+            entry is None
+            or entry.effective_start != effective_start
+            or entry.effective_start.utcoffset() != effective_start.utcoffset()
+            or entry.end != end
+        ):
+            free_slots_cache_misses_total.inc()
+            return None
+
+        self._entries.move_to_end(key)
+        free_slots_cache_hits_total.inc()
+        return entry.slots
+
+    def set(  # noqa: PLR0913
+        self,
+        resource_id: int,
+        day: date,
+        slot: int,
+        *,
+        effective_start: datetime,
+        end: datetime,
+        slots: Sequence[tuple[datetime, datetime]],
+        version: int,
+    ) -> None:
+        """Store slots unless the resource was invalidated since version."""
+        if self.version(resource_id) != version:
+            return
+        key = (resource_id, day, slot)
+        self._entries[key] = _Entry(
+            effective_start=effective_start,
+            end=end,
+            slots=slots,
+            expires_at=time.monotonic() + self.ttl,
+        )
+        self._entries.move_to_end(key)
+        self._slots_by_bucket.setdefault((resource_id, day), set()).add(slot)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            free_slots_cache_evictions_total.labels(reason="lru").inc()
+
+    def invalidate(self, resource_id: int, start: datetime, end: datetime) -> None:
+        """Drop entries for every UTC day bucket touched by [start, end)."""
+        self._bump(resource_id)
+        day = start.astimezone(timezone.utc).date()
+        last_day = max(start, end - _MICROSECOND).astimezone(timezone.utc).date()
+        while day <= last_day:
+            for slot in self._slots_by_bucket.pop((resource_id, day), ()):
+                if self._entries.pop((resource_id, day, slot), None) is not None:
+                    free_slots_cache_evictions_total.labels(
+                        reason="invalidate",
+                    ).inc()
+            day += _DAY
+
+    def invalidate_resource(self, resource_id: int) -> None:
+        """Drop all entries of a resource."""
+        self._bump(resource_id)
+        for key in [k for k in self._entries if k[0] == resource_id]:
+            self._remove(key)
+            free_slots_cache_evictions_total.labels(reason="invalidate").inc()
+
+    def _bump(self, resource_id: int) -> None:
+        self._versions[resource_id] = self.version(resource_id) + 1
+
+    def _remove(self, key: CacheKey) -> None:
+        resource_id, day, slot = key
+        self._entries.pop(key, None)
+        slots = self._slots_by_bucket.get((resource_id, day))
+        if slots is not None:
+            slots.discard(slot)
+            if not slots:
+                del self._slots_by_bucket[(resource_id, day)]
+
+
+free_slots_cache = FreeSlotsCache()
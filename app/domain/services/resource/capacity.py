@@ -0,0 +1,121 @@
+"""Sweep-line helpers for resources with capacity above one.
+
+A resource of capacity N takes up to N concurrent bookings. An interval is
+available while fewer than N bookings (and holds) are active at every moment
+of it; a moment with N active ones is saturated. Both questions are answered
+by sweeping start/end events in time order, never by comparing pairs.
+
+Bookings of shared resources are not covered by the no-overlap constraint,
+so their writers are serialized by the resource advisory lock.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+import heapq
+
+import sqlalchemy as sa
+
+from app.depends import AsyncSession
+
+# First key of the two-key advisory lock, so resource ids don't collide with
+# other advisory locks
+BOOKING_LOCK_CLASS = 1
+
+
+async def lock_resource(resource_id: int, session: AsyncSession) -> None:
+    """Take the transaction-level advisory lock of a resource.
+
+    Must run as its own statement: a statement's snapshot is taken before it
+    waits for the lock, so only later statements see bookings committed by
+    the previous lock holder.
+    """
+    await session.execute(
+        sa.select(sa.func.pg_advisory_xact_lock(BOOKING_LOCK_CLASS, resource_id)),
+    )
+
+
+def peak_concurrency(
+    intervals: Iterable[tuple[datetime, datetime]],
+    start: datetime,
+    end: datetime,
+) -> int:
+    """Max number of intervals active at one moment of [start, end).
+
+    Intervals are half-open, so one ending when another starts does not
+    count as concurrent: ends sort before starts at equal times.
+    """
+    events: list[tuple[datetime, int]] = []
+    for i_start, i_end in intervals:
+        if i_start < end and start < i_end:
+            events.append((max(i_start, start), 1))
+            events.append((min(i_end, end), -1))
+    events.sort()
+    active = peak = 0
+    for _, delta in events:
+        active += delta
+        peak = max(peak, active)
+    return peak
+
+
+class SaturationSweep:
+    """Feed intervals in start order; collect spans with >= capacity active.
+
+    add() returns the saturated spans closed before the new interval starts;
+    finish() returns the rest. Emitted spans are sorted and disjoint.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._ends: list[datetime] = []  # Min-heap of active interval ends
+        self._busy_since: datetime | None = None
+
+    def add(
+        self,
+        start: datetime,
+        end: datetime,
+        units: int = 1,
+    ) -> list[tuple[datetime, datetime]]:
+        """Add an interval taking units (capacity for a closed period)."""
+        spans = self._close_until(start)
+        for _ in range(units):
+            heapq.heappush(self._ends, end)
+        if self._busy_since is None and len(self._ends) >= self.capacity:
+            self._busy_since = start
+        return spans
+
+    def finish(self) -> list[tuple[datetime, datetime]]:
+        return self._close_until(None)
+
+    def free_from(self) -> datetime | None:
+        """End of the open saturated span given the intervals added so far."""
+        excess = len(self._ends) - self.capacity
+        if excess < 0:
+            return None
+        return heapq.nsmallest(excess + 1, self._ends)[-1]
+
+    def _close_until(
+        self,
+        moment: datetime | None,
+    ) -> list[tuple[datetime, datetime]]:
+        """Drop intervals ended by moment (all if None), closing spans."""
+        spans = []
+        while self._ends and (moment is None or self._ends[0] <= moment):
+            ended = heapq.heappop(self._ends)
+            if self._busy_since is not None and len(self._ends) < self.capacity:
+                if self._busy_since < ended:
+                    spans.append((self._busy_since, ended))
+                self._busy_since = None
+        return spans
+
+
+def saturated_intervals(
+    intervals: Iterable[tuple[datetime, datetime]],
+    capacity: int,
+) -> list[tuple[datetime, datetime]]:
+    """Disjoint spans where at least capacity intervals are active."""
+    sweep = SaturationSweep(capacity)
+    spans = []
+    for start, end in sorted(intervals):
+        spans.extend(sweep.add(start, end))
+    spans.extend(sweep.finish())
+    return spans
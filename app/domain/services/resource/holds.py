@@ -0,0 +1,292 @@
+"""Short-lived holds on resource intervals.
+
+A hold reserves [start, end) of a resource for one user for HOLD_TTL_SECONDS,
+e.g. while the bot asks to confirm a booking. Active holds of other users
+count as busy in availability checks, free slots and booking creation; on a
+resource of capacity N each hold takes one of the N units. Each user has at
+most one hold per resource: placing a new one replaces it.
+
+Holds live in Redis when USE_REDIS_STORAGE is enabled (shared by all workers;
+placing is one Lua script, so check-and-set is atomic) and in process memory
+otherwise, like the bot FSM storage.
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import uuid
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from app.config import config
+
+HOLD_TTL_SECONDS = 300
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True)
+class Hold:
+    """Interval of a resource held for a user until expires_at."""
+
+    id: str
+    resource_id: int
+    user_id: UUID
+    start_time: datetime
+    end_time: datetime
+    expires_at: datetime
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        return self.start_time < end and start < self.end_time
+
+
+def new_hold(
+    resource_id: int,
+    user_id: UUID,
+    start_time: datetime,
+    end_time: datetime,
+    ttl: int = HOLD_TTL_SECONDS,
+) -> Hold:
+    return Hold(
+        id=uuid.uuid4().hex,
+        resource_id=resource_id,
+        user_id=user_id,
+        start_time=start_time,
+        end_time=end_time,
+        expires_at=datetime.now(timezone.utc) + timedelta(seconds=ttl),
+    )
+
+
+def without_held(
+    slots: Sequence[tuple[datetime, datetime]],
+    holds: Iterable[Hold],
+) -> Sequence[tuple[datetime, datetime]]:
+    """Drop slots overlapping any hold."""
+    holds = list(holds)
+    if not holds:
+        return slots
+    return [
+        (start, end)
+        for start, end in slots
+        if not any(hold.overlaps(start, end) for hold in holds)
+    ]
+
+
+class MemoryHoldStorage:
+    """Per-process hold storage."""
+
+    def __init__(self):
+        self._holds: dict[str, Hold] = {}
+        self._by_resource: dict[int, set[str]] = {}
+
+    async def place(
+        self,
+        hold: Hold,
+        limit: int = 1,
+        gap: timedelta = timedelta(0),
+    ) -> bool:
+        """Store hold unless limit holds of other users are within gap of it."""
+        current = await self.active([hold.resource_id])
+        others = [h for h in current[hold.resource_id] if h.user_id != hold.user_id]
+        start, end = hold.start_time - gap, hold.end_time + gap
+        if sum(h.overlaps(start, end) for h in others) >= limit:
+            return False
+        for h in current[hold.resource_id]:
+            if h.user_id == hold.user_id:
+                self._drop(h)
+        self._holds[hold.id] = hold
+        self._by_resource.setdefault(hold.resource_id, set()).add(hold.id)
+        return True
+
+    async def get(self, hold_id: str) -> Hold | None:
+        hold = self._holds.get(hold_id)
+        if hold is None or hold.expires_at <= datetime.now(timezone.utc):
+            return None
+        return hold
+
+    async def release(self, hold_id: str) -> None:
+        hold = self._holds.get(hold_id)
+        if hold is not None:
+            self._drop(hold)
+
+    async def active(self, resource_ids: Iterable[int]) -> dict[int, list[Hold]]:
+        """Unexpired holds by resource, sorted by start."""
+        now = datetime.now(timezone.utc)
+        result: dict[int, list[Hold]] = {}
+        for resource_id in resource_ids:
+            holds = []
+            for hold_id in list(self._by_resource.get(resource_id, ())):
+                hold = self._holds[hold_id]
+                if hold.expires_at <= now:
+                    self._drop(hold)
+                else:
+                    holds.append(hold)
+            result[resource_id] = sorted(holds, key=lambda h: h.start_time)
+        return result
+
+    def _drop(self, hold: Hold) -> None:
+        self._holds.pop(hold.id, None)
+        ids = self._by_resource.get(hold.resource_id)
+        if ids is not None:
+            ids.discard(hold.id)
+            if not ids:
+                del self._by_resource[hold.resource_id]
+
+
+# KEYS[1] - sorted set of hold ids of the resource scored by expiry (ms)
+# ARGV: hold id, user id, start us, end us, now ms, ttl ms, key prefix,
+# resource id, limit of overlapping holds of other users, gap us
+_PLACE_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[5])
+local ids = redis.call('ZRANGE', KEYS[1], 0, -1)
+local own = {}
+local overlapping = 0
+for _, id in ipairs(ids) do
+  local h = redis.call('HMGET', ARGV[7] .. id, 'user_id', 'start_us', 'end_us')
+  if not h[1] then
+    redis.call('ZREM', KEYS[1], id)
+  elseif h[1] == ARGV[2] then
+    table.insert(own, id)
+  elseif tonumber(h[2]) < tonumber(ARGV[4]) + tonumber(ARGV[10])
+      and tonumber(ARGV[3]) - tonumber(ARGV[10]) < tonumber(h[3]) then
+    overlapping = overlapping + 1
+    if overlapping >= tonumber(ARGV[9]) then
+      return 0
+    end
+  end
+end
+for _, id in ipairs(own) do
+  redis.call('DEL', ARGV[7] .. id)
+  redis.call('ZREM', KEYS[1], id)
+end
+local key = ARGV[7] .. ARGV[1]
+local expires_ms = tonumber(ARGV[5]) + tonumber(ARGV[6])
+redis.call('HSET', key, 'resource_id', ARGV[8], 'user_id', ARGV[2],
+  'start_us', ARGV[3], 'end_us', ARGV[4], 'expires_ms', expires_ms)
+redis.call('PEXPIRE', key, ARGV[6])
+redis.call('ZADD', KEYS[1], expires_ms, ARGV[1])
+redis.call('PEXPIRE', KEYS[1], ARGV[6])
+return 1
+"""
+
+
+class RedisHoldStorage:
+    """Hold storage shared by all workers.
+
+    Each hold is a hash with a TTL; a per-resource sorted set scored by
+    expiry lists the hold ids of a resource.
+    """
+
+    def __init__(self, redis: Redis, prefix: str = "hold:"):
+        self.redis = redis
+        self.prefix = prefix
+        self._place = redis.register_script(_PLACE_SCRIPT)
+
+    async def place(
+        self,
+        hold: Hold,
+        limit: int = 1,
+        gap: timedelta = timedelta(0),
+    ) -> bool:
+        """Store hold unless limit holds of other users are within gap (atomic)."""
+        now = datetime.now(timezone.utc)
+        ttl_ms = max(int((hold.expires_at - now) / timedelta(milliseconds=1)), 1)
+        placed = await self._place(
+            keys=[self._resource_key(hold.resource_id)],
+            args=[
+                hold.id,
+                str(hold.user_id),
+                _to_us(hold.start_time),
+                _to_us(hold.end_time),
+                _to_us(now) // 1000,
+                ttl_ms,
+                self.prefix,
+                hold.resource_id,
+                limit,
+                gap // _MICROSECOND,
+            ],
+        )
+        return bool(placed)
+
+    async def get(self, hold_id: str) -> Hold | None:
+        data = await self.redis.hgetall(self.prefix + hold_id)
+        return self._parse(hold_id, data)
+
+    async def release(self, hold_id: str) -> None:
+        resource_id = await self.redis.hget(self.prefix + hold_id, "resource_id")
+        if resource_id is None:
+            return
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self.prefix + hold_id)
+            pipe.zrem(self._resource_key(int(resource_id)), hold_id)
+            await pipe.execute()
+
+    async def active(self, resource_ids: Iterable[int]) -> dict[int, list[Hold]]:
+        """Unexpired holds by resource, sorted by start (two round trips)."""
+        resource_ids = list(resource_ids)
+        now_ms = _to_us(datetime.now(timezone.utc)) // 1000
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for resource_id in resource_ids:
+                pipe.zrangebyscore(self._resource_key(resource_id), now_ms, "+inf")
+            ids_by_resource = await pipe.execute()
+
+        hold_ids = [
+            hold_id.decode() if isinstance(hold_id, bytes) else hold_id
+            for ids in ids_by_resource
+            for hold_id in ids
+        ]
+        if not hold_ids:
+            return {resource_id: [] for resource_id in resource_ids}
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for hold_id in hold_ids:
+                pipe.hgetall(self.prefix + hold_id)
+            rows = await pipe.execute()
+
+        result: dict[int, list[Hold]] = {rid: [] for rid in resource_ids}
+        for hold_id, data in zip(hold_ids, rows, strict=True):
+            hold = self._parse(hold_id, data)
+            if hold is not None:
+                result[hold.resource_id].append(hold)
+        for holds in result.values():
+            holds.sort(key=lambda h: h.start_time)
+        return result
+
+    def _resource_key(self, resource_id: int) -> str:
+        return f"{self.prefix}resource:{resource_id}"
+
+    @staticmethod
+    def _parse(hold_id: str, data: dict) -> Hold | None:
+        if not data:
+            return None
+        data = {
+            (k.decode() if isinstance(k, bytes) else k): (
+                v.decode() if isinstance(v, bytes) else v
+            )
+            for k, v in data.items()
+        }
+        expires_at = _EPOCH + timedelta(milliseconds=int(data["expires_ms"]))
+        if expires_at <= datetime.now(timezone.utc):
+            return None
+        return Hold(
+            id=hold_id,
+            resource_id=int(data["resource_id"]),
+            user_id=UUID(data["user_id"]),
+            start_time=_EPOCH + int(data["start_us"]) * _MICROSECOND,
+            end_time=_EPOCH + int(data["end_us"]) * _MICROSECOND,
+            expires_at=expires_at,
+        )
+
+
+def _to_us(dt: datetime) -> int:
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def create_hold_storage() -> RedisHoldStorage | MemoryHoldStorage:
+    if config.bot.USE_REDIS_STORAGE:
+        return RedisHoldStorage(Redis.from_url(config.bot.BOT_REDIS_DSN))
+    return MemoryHoldStorage()
+
+
+hold_storage = create_hold_storage()
@@ -0,0 +1,222 @@
+"""In-memory per-resource interval index for availability and free-slot queries.
+
+Each worker keeps its own index per resource. It is loaded lazily from Postgres
+on first use, kept in sync by BookingService on create/cancel and reloaded after
+INDEX_TTL_SECONDS to pick up bookings made by other workers. Postgres stays the
+source of truth: overlaps are rejected by its exclusion constraint.
+"""
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import time
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from app.depends import AsyncSession, provider
+from app.infrastructure.database import Booking, Resource
+
+from .buffers import NO_BUFFERS, Buffers
+from .capacity import peak_concurrency
+
+# Reload an index after this many seconds even without local changes
+INDEX_TTL_SECONDS = 60
+
+
+@dataclass
+class ResourceIntervalIndex:
+    """Bookings of one resource as (start, end, booking_id) sorted by start.
+
+    Only bookings ending after loaded_from (or within the resource buffers
+    of it) are kept, so queries starting before loaded_from cannot be
+    answered from the index. capacity is the number of concurrent bookings
+    the resource takes.
+    """
+
+    loaded_from: datetime
+    capacity: int = 1
+    loaded_at: float = field(default_factory=time.monotonic)
+    items: list[tuple[datetime, datetime, int]] = field(default_factory=list)
+    max_duration: timedelta = timedelta(0)
+
+    def covers(self, start: datetime) -> bool:
+        """Check if the index holds every booking relevant for [start, ...)."""
+        return start >= self.loaded_from
+
+    def is_stale(self, ttl: float) -> bool:
+        return time.monotonic() - self.loaded_at > ttl
+
+    def add(self, booking_id: int, start: datetime, end: datetime) -> None:
+        self.remove(booking_id)
+        insort(self.items, (start, end, booking_id))
+        self.max_duration = max(self.max_duration, end - start)
+
+    def remove(self, booking_id: int) -> None:
+        for i, item in enumerate(self.items):
+            if item[2] == booking_id:
+                del self.items[i]
+                return
+
+    def overlapping(
+        self,
+        start: datetime,
+        end: datetime,
+    ) -> list[tuple[datetime, datetime]]:
+        """Return intervals overlapping [start, end) sorted by start.
+
+        Bookings starting before start - max_duration cannot reach start, so
+        the scan window is found with two binary searches: O(log n + k).
+        """
+        lo = bisect_left(self.items, (start - self.max_duration,))
+        hi = bisect_left(self.items, (end,))
+        return [(s, e) for s, e, _ in self.items[lo:hi] if e > start]
+
+    def is_free(
+        self,
+        start: datetime,
+        end: datetime,
+        extra: Iterable[tuple[datetime, datetime]] = (),
+        buffers: Buffers = NO_BUFFERS,
+    ) -> bool:
+        """Check if [start, end) has room, counting extra intervals as busy.
+
+        With buffers, occupied intervals of bookings, extra ones and the
+        checked one are compared.
+        """
+        intervals = self.overlapping(*buffers.probe(start, end))
+        if buffers:
+            start, end = buffers.occupied(start, end)
+            intervals = [buffers.occupied(*interval) for interval in intervals]
+            extra = [buffers.occupied(*interval) for interval in extra]
+        if self.capacity == 1:
+            return not intervals and not any(
+                e_start < end and start < e_end for e_start, e_end in extra
+            )
+        return peak_concurrency([*intervals, *extra], start, end) < self.capacity
+
+
+class IntervalIndexRegistry:
+    """Per-worker registry of resource interval indexes."""
+
+    def __init__(self, ttl: float = INDEX_TTL_SECONDS):
+        self.ttl = ttl
+        self._indexes: dict[int, ResourceIntervalIndex] = {}
+        self._versions: dict[int, int] = {}
+
+    @provider.inject_session
+    async def get(
+        self,
+        resource_id: int,
+        session: AsyncSession | None = None,
+    ) -> ResourceIntervalIndex:
+        """Return index for resource, loading it from DB when missing or stale."""
+        indexes = await self.get_many(resource_ids=[resource_id], session=session)
+        return indexes[resource_id]
+
+    @provider.inject_session
+    async def get_many(
+        self,
+        resource_ids: list[int],
+        session: AsyncSession | None = None,
+    ) -> dict[int, ResourceIntervalIndex]:
+        """Return indexes for resources, loading missing/stale ones in one query."""
+        result: dict[int, ResourceIntervalIndex] = {}
+        to_load: list[int] = []
+        for resource_id in resource_ids:
+            index = self._indexes.get(resource_id)
+            if index is not None and not index.is_stale(self.ttl):
+                result[resource_id] = index
+            else:
+                to_load.append(resource_id)
+        if not to_load:
+            return result
+
+        versions = {rid: self._versions.get(rid, 0) for rid in to_load}
+        loaded_from = datetime.now(timezone.utc)
+        # Capacity comes with the bookings: resources without any give one
+        # row of NULL booking columns. Bookings ended less than the buffers
+        # ago still occupy the resource.
+        gap = (Resource.buffer_before + Resource.buffer_after) * sa.literal(
+            timedelta(seconds=1),
+            sa.Interval,
+        )
+        stmt = (
+            sa.select(
+                Resource.id,
+                Resource.capacity,
+                Booking.id,
+                Booking.start_time,
+                Booking.end_time,
+            )
+            .outerjoin(
+                Booking,
+                sa.and_(
+                    Booking.resource_id == Resource.id,
+                    Booking.end_time
+                    > sa.literal(loaded_from, Booking.end_time.type) - gap,
+                ),
+            )
+            .where(
+                Resource.id
+                == sa.any_(
+                    sa.bindparam(None, to_load, type_=ARRAY(sa.Integer)),
+                ),
+            )
+            .order_by(
+                Resource.id,
+                Booking.start_time,
+                Booking.end_time,
+                Booking.id,
+            )
+        )
+        rows = (await session.execute(stmt)).all()
+
+        for resource_id in to_load:
+            result[resource_id] = ResourceIntervalIndex(loaded_from=loaded_from)
+        for resource_id, capacity, booking_id, start, end in rows:
+            index = result[resource_id]
+            index.capacity = capacity
+            if booking_id is None:
+                continue
+            # Rows arrive in index order: append keeps the list sorted
+            index.items.append((start, end, booking_id))
+            index.max_duration = max(index.max_duration, end - start)
+
+        for resource_id in to_load:
+            # A create/cancel landed while loading: serve this result, don't cache
+            if self._versions.get(resource_id, 0) == versions[resource_id]:
+                self._indexes[resource_id] = result[resource_id]
+        return result
+
+    def add(
+        self,
+        resource_id: int,
+        booking_id: int,
+        start: datetime,
+        end: datetime,
+    ) -> None:
+        """Register a committed booking."""
+        self._bump(resource_id)
+        index = self._indexes.get(resource_id)
+        if index is not None:
+            index.add(booking_id, start, end)
+
+    def remove(self, resource_id: int, booking_id: int) -> None:
+        """Forget a cancelled booking."""
+        self._bump(resource_id)
+        index = self._indexes.get(resource_id)
+        if index is not None:
+            index.remove(booking_id)
+
+    def drop(self, resource_id: int) -> None:
+        """Drop index for resource (deleted resource or external change)."""
+        self._bump(resource_id)
+        self._indexes.pop(resource_id, None)
+
+    def _bump(self, resource_id: int) -> None:
+        self._versions[resource_id] = self._versions.get(resource_id, 0) + 1
+
+
+interval_index = IntervalIndexRegistry()
@@ -1,14 +1,22 @@
 """Resource service for handling resource business logic with multitenancy support."""
 
+from collections.abc import AsyncIterator, Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+import heapq
 from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from app.depends import AsyncSession, provider
-from app.infrastructure.database import Booking
-from app.infrastructure.database.models.booking import Resource
+from app.infrastructure.database.models.booking import (
+    Booking,
+    Resource,
+    ResourceBlackout,
+    ResourceHours,
+)
 from app.infrastructure.database.models.users import (
     Customer,
     CustomerAdmin,
@@ -16,6 +24,26 @@ from app.infrastructure.database.models.users import (
     User,
 )
 
+from .buffers import NO_BUFFERS, Buffers
+from .cache import day_bucket, free_slots_cache
+from .capacity import (
+    SaturationSweep,
+    lock_resource,
+    peak_concurrency,
+    saturated_intervals,
+)
+from .holds import Hold, hold_storage, without_held
+from .interval_index import interval_index
+from .schedule import MINUTES_PER_DAY, ResourceSchedule, schedule_registry
+from .slots import build_free_slots_vectorized, should_vectorize
+
+# Longest interval for list-based free slots queries
+MAX_INTERVAL = timedelta(days=1)
+# Longest interval for streamed free slots queries (week/month calendars)
+MAX_STREAM_INTERVAL = timedelta(days=366)
+# Rows fetched per round-trip from the server-side bookings cursor
+STREAM_FETCH_SIZE = 500
+
 
 @dataclass(frozen=True)
 class FreeSlotsParams:
@@ -26,6 +54,16 @@ class FreeSlotsParams:
     slot: int
 
 
+@dataclass(frozen=True)
+class EarliestSlot:
+    """First free interval of the requested duration found across resources."""
+
+    resource_id: int
+    resource_name: str
+    start: datetime
+    end: datetime
+
+
 def _merge_intervals(
     intervals: list[tuple[datetime, datetime]],
 ) -> list[tuple[datetime, datetime]]:
@@ -120,11 +158,13 @@ class ResourceService:
         current_user: User,
         name: str,
         customer_id: UUID | None = None,
+        capacity: int = 1,
         session: AsyncSession | None = None,
     ) -> Resource | None:
         """Create a new resource for a customer.
 
         If customer_id is not provided, uses the customer where user is owner/admin.
+        capacity is the number of concurrent bookings the resource takes.
         """
         # Determine customer_id
         if customer_id is None:
@@ -143,7 +183,7 @@ class ResourceService:
         ):
             return None
 
-        resource = Resource(customer_id=customer_id, name=name)
+        resource = Resource(customer_id=customer_id, name=name, capacity=capacity)
         session.add(resource)
         await session.flush()
         await session.refresh(resource)
@@ -211,14 +251,26 @@ class ResourceService:
         return resource
 
     @provider.inject_session
-    async def update_resource(
+    async def update_resource(  # noqa: PLR0913
         self,
         resource_id: int,
         current_user: User,
+        *,
         name: str | None = None,
+        capacity: int | None = None,
+        timezone: str | None = None,
+        buffer_before: int | None = None,
+        buffer_after: int | None = None,
         session: AsyncSession | None = None,
     ) -> Resource | None:
-        """Update resource with permission check."""
+        """Update resource with permission check.
+
+        Buffers (seconds) apply to new bookings and holds; existing bookings
+        are kept even if they are closer to each other.
+        Raises ValueError if the new capacity is below the number of future
+        bookings already active at one moment, the timezone is unknown or a
+        buffer is negative.
+        """
         resource = await self.get_resource(
             resource_id=resource_id,
             current_user=current_user,
@@ -229,11 +281,262 @@ class ResourceService:
 
         if name is not None:
             resource.name = name
+        if capacity is not None and capacity != resource.capacity:
+            await self._set_capacity(resource, capacity, session)
+        if timezone is not None and timezone != resource.timezone:
+            try:
+                ZoneInfo(timezone)
+            except (ZoneInfoNotFoundError, ValueError) as e:
+                msg = f"Unknown timezone: {timezone}"
+                raise ValueError(msg) from e
+            # Opening hours are local: the same hours now close other moments
+            resource.timezone = timezone
+            _schedule_changed(resource.id)
+        if buffer_before is not None or buffer_after is not None:
+            self._set_buffers(resource, buffer_before, buffer_after)
 
         await session.flush()
         await session.refresh(resource)
         return resource
 
+    def _set_buffers(
+        self,
+        resource: Resource,
+        before: int | None,
+        after: int | None,
+    ) -> None:
+        """Change buffers of the resource, keeping unset ones."""
+        if (before is not None and before < 0) or (after is not None and after < 0):
+            msg = "buffers must be non-negative (seconds)"
+            raise ValueError(msg)
+        if before is not None:
+            resource.buffer_before = before
+        if after is not None:
+            resource.buffer_after = after
+        # The index keeps bookings within the old buffers of its start only
+        interval_index.drop(resource.id)
+        _schedule_changed(resource.id)
+
+    async def _set_capacity(
+        self,
+        resource: Resource,
+        capacity: int,
+        session: AsyncSession,
+    ) -> None:
+        """Change capacity and the exclusive flag of the resource bookings.
+
+        Runs under the resource lock, so no shared booking is created
+        meanwhile. Bookings of a capacity 1 resource are exclusive: the
+        no-overlap constraint covers them. Ended bookings keep their flag.
+        """
+        if capacity < 1:
+            msg = "capacity must be a positive integer"
+            raise ValueError(msg)
+        await lock_resource(resource.id, session)
+        now = datetime.now(timezone.utc)
+        if capacity < resource.capacity:
+            rows = await session.execute(
+                sa.select(Booking.start_time, Booking.end_time).where(
+                    sa.and_(
+                        Booking.resource_id == resource.id,
+                        Booking.end_time > now,
+                    ),
+                ),
+            )
+            intervals = rows.all()
+            if intervals:
+                peak = peak_concurrency(
+                    intervals,
+                    now,
+                    max(end for _, end in intervals),
+                )
+                if peak > capacity:
+                    msg = (
+                        f"Resource has {peak} concurrent future bookings, "
+                        f"capacity must be at least {peak}"
+                    )
+                    raise ValueError(msg)
+
+        await session.execute(
+            sa.update(Booking)
+            .where(
+                sa.and_(
+                    Booking.resource_id == resource.id,
+                    Booking.end_time > now,
+                ),
+            )
+            .values(exclusive=capacity == 1),
+        )
+        resource.capacity = capacity
+        interval_index.drop(resource.id)
+        free_slots_cache.invalidate_resource(resource.id)
+
+    @provider.inject_session
+    async def get_hours(
+        self,
+        resource_id: int,
+        current_user: User,
+        session: AsyncSession | None = None,
+    ) -> list[ResourceHours] | None:
+        """Get opening hours of resource, sorted by weekday and opening."""
+        resource = await self.get_resource(
+            resource_id=resource_id,
+            current_user=current_user,
+            session=session,
+        )
+        if not resource:
+            return None
+
+        stmt = (
+            sa.select(ResourceHours)
+            .where(ResourceHours.resource_id == resource_id)
+            .order_by(ResourceHours.weekday, ResourceHours.open_minute)
+        )
+        result = await session.scalars(stmt)
+        return list(result.all())
+
+    @provider.inject_session
+    async def set_hours(
+        self,
+        resource_id: int,
+        current_user: User,
+        hours: list[tuple[int, int, int]],
+        session: AsyncSession | None = None,
+    ) -> list[ResourceHours] | None:
+        """Replace opening hours of resource.
+
+        hours are (weekday, open_minute, close_minute) in the resource
+        timezone, Monday = 0; an empty list makes the resource open around
+        the clock. Weekdays without hours are closed. Raises ValueError on
+        invalid or overlapping hours. Existing bookings are kept.
+        """
+        _validate_hours(hours)
+        resource = await self.get_resource(
+            resource_id=resource_id,
+            current_user=current_user,
+            session=session,
+        )
+        if not resource:
+            return None
+
+        await session.execute(
+            sa.delete(ResourceHours).where(ResourceHours.resource_id == resource_id),
+        )
+        rows = [
+            ResourceHours(
+                resource_id=resource_id,
+                weekday=weekday,
+                open_minute=open_minute,
+                close_minute=close_minute,
+            )
+            for weekday, open_minute, close_minute in sorted(hours)
+        ]
+        session.add_all(rows)
+        await session.flush()
+        _schedule_changed(resource_id)
+        return rows
+
+    @provider.inject_session
+    async def get_blackouts(
+        self,
+        resource_id: int,
+        current_user: User,
+        session: AsyncSession | None = None,
+    ) -> list[ResourceBlackout] | None:
+        """Get blackouts of resource that have not ended, sorted by start."""
+        resource = await self.get_resource(
+            resource_id=resource_id,
+            current_user=current_user,
+            session=session,
+        )
+        if not resource:
+            return None
+
+        stmt = (
+            sa.select(ResourceBlackout)
+            .where(
+                sa.and_(
+                    ResourceBlackout.resource_id == resource_id,
+                    ResourceBlackout.end_time > datetime.now(timezone.utc),
+                ),
+            )
+            .order_by(ResourceBlackout.start_time)
+        )
+        result = await session.scalars(stmt)
+        return list(result.all())
+
+    @provider.inject_session
+    async def add_blackout(  # noqa: PLR0913
+        self,
+        resource_id: int,
+        current_user: User,
+        start: datetime,
+        end: datetime,
+        *,
+        reason: str | None = None,
+        session: AsyncSession | None = None,
+    ) -> ResourceBlackout | None:
+        """Close resource for [start, end).
+
+        Bookings already made in the period are kept; new bookings, holds
+        and free slots skip it. Raises ValueError if end is not after start.
+        """
+        if start.tzinfo is None or end.tzinfo is None:
+            msg = "start and end must be timezone-aware"
+            raise ValueError(msg)
+        if end <= start:
+            msg = "end must be after start"
+            raise ValueError(msg)
+        resource = await self.get_resource(
+            resource_id=resource_id,
+            current_user=current_user,
+            session=session,
+        )
+        if not resource:
+            return None
+
+        blackout = ResourceBlackout(
+            resource_id=resource_id,
+            start_time=start,
+            end_time=end,
+            reason=reason,
+        )
+        session.add(blackout)
+        await session.flush()
+        await session.refresh(blackout)
+        _schedule_changed(resource_id)
+        return blackout
+
+    @provider.inject_session
+    async def delete_blackout(
+        self,
+        resource_id: int,
+        blackout_id: int,
+        current_user: User,
+        session: AsyncSession | None = None,
+    ) -> bool:
+        """Delete blackout of resource; False if not found or access denied."""
+        resource = await self.get_resource(
+            resource_id=resource_id,
+            current_user=current_user,
+            session=session,
+        )
+        if not resource:
+            return False
+
+        result = await session.execute(
+            sa.delete(ResourceBlackout).where(
+                sa.and_(
+                    ResourceBlackout.id == blackout_id,
+                    ResourceBlackout.resource_id == resource_id,
+                ),
+            ),
+        )
+        if not result.rowcount:
+            return False
+        _schedule_changed(resource_id)
+        return True
+
     @provider.inject_session
     async def delete_resource(
         self,
@@ -254,6 +557,9 @@ class ResourceService:
             return False
 
         await session.delete(resource)
+        interval_index.drop(resource_id)
+        schedule_registry.drop(resource_id)
+        free_slots_cache.invalidate_resource(resource_id)
         return True
 
     @provider.inject_session
@@ -263,32 +569,16 @@ class ResourceService:
         current_user: User,
         params: FreeSlotsParams,
         session: AsyncSession | None = None,
-    ) -> list[tuple[datetime, datetime]] | None:
+    ) -> Sequence[tuple[datetime, datetime]] | None:
         """Return list of free slots (start,end) for given interval and slot size.
 
         Returns None if resource not found or access denied (multitenancy).
         Raises ValueError for invalid params.
         """
-        start = params.start
-        end = params.end
-        slot = params.slot
-
-        if start.tzinfo is None or end.tzinfo is None:
-            msg = "start and end must be timezone-aware datetimes"
-            raise ValueError(msg)
-        if end <= start:
-            msg = "end must be after start"
-            raise ValueError(msg)
-        if (end - start) > timedelta(days=1):
-            msg = "interval duration must not exceed 1 days"
-            raise ValueError(msg)
-        if slot <= 0:
-            msg = "slot must be a positive integer (seconds)"
-            raise ValueError(msg)
+        _validate_free_slots_params(params)
 
-        now = datetime.now(timezone.utc)
-        effective_start = max(start, now)
-        if effective_start >= end:
+        effective_start = _effective_start(params)
+        if effective_start >= params.end:
             return []
 
         # Permission/resource existence check
@@ -300,44 +590,705 @@ class ResourceService:
         if resource is None:
             return None
 
-        # Load bookings that overlap requested interval (SQL does the filtering)
-        stmt = sa.select(Booking).where(
-            sa.and_(
-                Booking.resource_id == resource_id,
-                Booking.start_time < end,
-                Booking.end_time > start,
-            ),
+        slots_by_resource = await self._free_slots_for_resources(
+            resource_ids=[resource_id],
+            capacities={resource_id: resource.capacity},
+            params=params,
+            effective_start=effective_start,
+            session=session,
         )
-        result = await session.scalars(stmt)
-        bookings = list(result.all())
+        return slots_by_resource[resource_id]
 
-        busy = _merge_intervals(
-            [
-                (max(b.start_time, effective_start), min(b.end_time, end))
-                for b in bookings
-            ],
+    @provider.inject_session
+    async def get_customer_free_slots(
+        self,
+        resource_id: int,
+        customer_id: UUID,
+        params: FreeSlotsParams,
+        session: AsyncSession | None = None,
+    ) -> Sequence[tuple[datetime, datetime]] | None:
+        """Return free slots of a customer resource offered for booking.
+
+        Same slots as get_free_slots, for clients booking at the customer
+        (the bot) without admin rights on it. Returns None if the resource is
+        not found or belongs to another customer.
+        Raises ValueError for invalid params.
+        """
+        _validate_free_slots_params(params)
+
+        resource = await Resource.get(id=resource_id, session=session)
+        if resource is None or resource.customer_id != customer_id:
+            return None
+
+        effective_start = _effective_start(params)
+        if effective_start >= params.end:
+            return []
+
+        slots_by_resource = await self._free_slots_for_resources(
+            resource_ids=[resource_id],
+            capacities={resource_id: resource.capacity},
+            params=params,
+            effective_start=effective_start,
+            session=session,
         )
+        return slots_by_resource[resource_id]
 
-        # Build free intervals (gaps between busy intervals)
-        free_intervals: list[tuple[datetime, datetime]] = []
-        cursor = effective_start
-        for b_start, b_end in busy:
+    @provider.inject_session
+    async def get_free_slots_batch(
+        self,
+        resource_ids: list[int],
+        current_user: User,
+        params: FreeSlotsParams,
+        session: AsyncSession | None = None,
+    ) -> dict[int, Sequence[tuple[datetime, datetime]]]:
+        """Return free slots for several resources sharing one interval and slot.
+
+        Permissions are checked once per customer and bookings of all resources
+        are loaded with a single query. Resources that are not found or not
+        accessible are left out of the result.
+        Raises ValueError for invalid params.
+        """
+        _validate_free_slots_params(params)
+
+        stmt = sa.select(Resource).where(
+            Resource.id == sa.any_(_int_array(resource_ids)),
+        )
+        resources = list((await session.scalars(stmt)).all())
+
+        allowed_customers: dict[UUID, bool] = {}
+        for customer_id in {r.customer_id for r in resources}:
+            allowed_customers[customer_id] = await self.is_admin_or_owner(
+                user_id=current_user.id,
+                customer_id=customer_id,
+                session=session,
+            )
+        allowed = [r for r in resources if allowed_customers[r.customer_id]]
+        allowed_ids = [r.id for r in allowed]
+
+        effective_start = _effective_start(params)
+        if effective_start >= params.end:
+            return {resource_id: [] for resource_id in allowed_ids}
+
+        return await self._free_slots_for_resources(
+            resource_ids=allowed_ids,
+            capacities={r.id: r.capacity for r in allowed},
+            params=params,
+            effective_start=effective_start,
+            session=session,
+        )
+
+    async def _free_slots_for_resources(
+        self,
+        resource_ids: list[int],
+        capacities: dict[int, int],
+        params: FreeSlotsParams,
+        effective_start: datetime,
+        session: AsyncSession,
+    ) -> dict[int, Sequence[tuple[datetime, datetime]]]:
+        """Free slots of authorized resources without slots held by anyone.
+
+        Slots from bookings and closed hours come from the cache, then from
+        the interval index and the schedule; active holds are applied on top
+        and are never cached. On a shared or buffered resource each hold
+        takes one unit and its buffers, so its slots are rebuilt with the
+        holds counted as bookings.
+        """
+        result = await self._booked_free_slots(
+            resource_ids=resource_ids,
+            params=params,
+            effective_start=effective_start,
+            session=session,
+        )
+        holds = await hold_storage.active(resource_ids)
+        held = [rid for rid in resource_ids if holds[rid]]
+        schedules = {}
+        if held:
+            schedules = await schedule_registry.get_many(
+                resource_ids=held,
+                session=session,
+            )
+        rebuild = [rid for rid in held if capacities[rid] > 1 or schedules[rid].buffers]
+        indexes = {}
+        if rebuild:
+            indexes = await interval_index.get_many(
+                resource_ids=rebuild,
+                session=session,
+            )
+        for resource_id in resource_ids:
+            if resource_id in indexes:
+                index = indexes[resource_id]
+                schedule = schedules[resource_id]
+                result[resource_id] = _build_free_slots(
+                    bookings=[
+                        *index.overlapping(
+                            *schedule.buffers.probe(effective_start, params.end),
+                        ),
+                        *_hold_intervals(holds[resource_id]),
+                    ],
+                    start=effective_start,
+                    end=params.end,
+                    slot=params.slot,
+                    capacity=index.capacity,
+                    schedule=schedule,
+                )
+            else:
+                result[resource_id] = without_held(
+                    result[resource_id],
+                    holds[resource_id],
+                )
+        return result
+
+    async def _booked_free_slots(
+        self,
+        resource_ids: list[int],
+        params: FreeSlotsParams,
+        effective_start: datetime,
+        session: AsyncSession,
+    ) -> dict[int, Sequence[tuple[datetime, datetime]]]:
+        """Free slots considering bookings and closed hours only.
+
+        Cache first, then the interval index and the resource schedule.
+        """
+        result: dict[int, Sequence[tuple[datetime, datetime]]] = {}
+        day = day_bucket(params.start, params.end)
+        if day is not None:
+            for resource_id in resource_ids:
+                cached = free_slots_cache.get(
+                    resource_id=resource_id,
+                    day=day,
+                    slot=params.slot,
+                    effective_start=effective_start,
+                    end=params.end,
+                )
+                if cached is not None:
+                    result[resource_id] = cached
+
+        missing = [rid for rid in resource_ids if rid not in result]
+        if not missing:
+            return result
+        versions = {rid: free_slots_cache.version(rid) for rid in missing}
+
+        # Bookings overlapping requested interval come from the in-memory index,
+        # already sorted by start
+        indexes = await interval_index.get_many(resource_ids=missing, session=session)
+        schedules = await schedule_registry.get_many(
+            resource_ids=missing,
+            session=session,
+        )
+        for resource_id in missing:
+            index = indexes[resource_id]
+            schedule = schedules[resource_id]
+            slots = _build_free_slots(
+                bookings=index.overlapping(
+                    *schedule.buffers.probe(effective_start, params.end),
+                ),
+                start=effective_start,
+                end=params.end,
+                slot=params.slot,
+                capacity=index.capacity,
+                schedule=schedule,
+            )
+            if day is not None:
+                free_slots_cache.set(
+                    resource_id=resource_id,
+                    day=day,
+                    slot=params.slot,
+                    effective_start=effective_start,
+                    end=params.end,
+                    slots=slots,
+                    version=versions[resource_id],
+                )
+            result[resource_id] = slots
+        return result
+
+    @provider.inject_session
+    async def stream_free_slots(
+        self,
+        resource_id: int,
+        current_user: User,
+        params: FreeSlotsParams,
+        session: AsyncSession | None = None,
+    ) -> AsyncIterator[tuple[datetime, datetime]] | None:
+        """Return async iterator of free slots for intervals up to a year.
+
+        Bookings are read through a server-side cursor ordered by start_time,
+        so memory does not depend on the window size. The iterator must be
+        consumed while the session is open.
+        Returns None if resource not found or access denied (multitenancy).
+        Raises ValueError for invalid params.
+        """
+        _validate_free_slots_params(params, max_interval=MAX_STREAM_INTERVAL)
+
+        resource = await self.get_resource(
+            resource_id=resource_id,
+            current_user=current_user,
+            session=session,
+        )
+        if resource is None:
+            return None
+
+        return self._iter_free_slots(
+            resource_id=resource_id,
+            capacity=resource.capacity,
+            params=params,
+            session=session,
+        )
+
+    async def _iter_free_slots(
+        self,
+        resource_id: int,
+        capacity: int,
+        params: FreeSlotsParams,
+        session: AsyncSession,
+    ) -> AsyncIterator[tuple[datetime, datetime]]:
+        end = params.end
+        cursor = _effective_start(params)
+        if cursor >= end:
+            return
+
+        holds = (await hold_storage.active([resource_id]))[resource_id]
+        schedule = await schedule_registry.get(resource_id=resource_id, session=session)
+        buffers = schedule.buffers
+        probe_start, probe_end = buffers.probe(cursor, end)
+        stmt = (
+            sa.select(Booking.start_time, Booking.end_time)
+            .where(
+                sa.and_(
+                    Booking.resource_id == resource_id,
+                    Booking.start_time < probe_end,
+                    Booking.end_time > probe_start,
+                ),
+            )
+            .order_by(Booking.start_time)
+            .execution_options(yield_per=STREAM_FETCH_SIZE)
+        )
+        # Closed hours take all units; on a shared or buffered resource holds
+        # take one each, otherwise slots overlapping them are dropped
+        extra = [
+            (c_start, c_end, capacity)
+            for c_start, c_end in schedule.closed_intervals(
+                *buffers.occupied(cursor, end),
+            )
+        ]
+        if capacity > 1 or buffers:
+            extra.extend(
+                (*buffers.occupied(hold.start_time, hold.end_time), 1) for hold in holds
+            )
+            holds = []
+        result = await session.stream(stmt)
+        busy = result
+        if extra or capacity > 1 or buffers:
+            # Saturated spans replace bookings
+            busy = _saturated_stream(result, sorted(extra), capacity, buffers)
+        async for b_start, b_end in busy:
             if cursor < b_start:
-                free_intervals.append((cursor, b_start))
+                for free_slot in without_held(
+                    _split_interval(cursor, min(b_start, end), params.slot),
+                    holds,
+                ):
+                    yield free_slot
             cursor = max(cursor, b_end)
-        if cursor < end:
-            free_intervals.append((cursor, end))
-
-        # Split free intervals into fixed-size slots
-        slot_delta = timedelta(seconds=slot)
-        free_slots: list[tuple[datetime, datetime]] = []
-        for free_start, free_end in free_intervals:
-            t = free_start
-            while t + slot_delta <= free_end:
-                free_slots.append((t, t + slot_delta))
-                t = t + slot_delta
-
-        return free_slots
+        for free_slot in without_held(
+            _split_interval(cursor, end, params.slot),
+            holds,
+        ):
+            yield free_slot
+
+    @provider.inject_session
+    async def find_earliest_slot(  # noqa: PLR0912, PLR0913, PLR0915
+        self,
+        current_user: User,
+        duration: int,
+        *,
+        horizon: timedelta,
+        customer_id: UUID | None = None,
+        start: datetime | None = None,
+        session: AsyncSession | None = None,
+    ) -> EarliestSlot | None:
+        """Find the earliest free interval of duration seconds on any resource.
+
+        Bookings of all customer resources are read in one query ordered by
+        start_time (the k-way merge of per-resource timelines). A min-heap of
+        per-resource "free since" cursors tells at every booking whether some
+        resource already has a gap that fits; reading stops at the first one.
+        A resource is busy while it has capacity bookings active, tracked by
+        one saturation sweep per resource. With buffers a gap must also hold
+        the buffers of the slot, measured against its occupied interval.
+        Returns None if nothing fits before start + horizon or access denied.
+        Raises ValueError for invalid params.
+        """
+        if duration <= 0:
+            msg = "duration must be a positive integer (seconds)"
+            raise ValueError(msg)
+        if horizon <= timedelta(0) or horizon > MAX_STREAM_INTERVAL:
+            msg = f"horizon must be between 0 and {MAX_STREAM_INTERVAL.days} days"
+            raise ValueError(msg)
+        if start is not None and start.tzinfo is None:
+            msg = "start must be timezone-aware datetime"
+            raise ValueError(msg)
+
+        if customer_id is None:
+            customer = await self.get_customer_for_user(
+                user_id=current_user.id,
+                session=session,
+            )
+            if not customer:
+                return None
+            customer_id = customer.id
+        elif not await self.is_member_or_admin_or_owner(
+            user_id=current_user.id,
+            customer_id=customer_id,
+            session=session,
+        ):
+            return None
+
+        now = datetime.now(timezone.utc)
+        search_start = max(start or now, now)
+        search_end = search_start + horizon
+        needed = timedelta(seconds=duration)
+
+        resources = (
+            await session.scalars(
+                sa.select(Resource).where(Resource.customer_id == customer_id),
+            )
+        ).all()
+        if not resources:
+            return None
+        names = {resource.id: resource.name for resource in resources}
+        sweeps = {
+            resource.id: SaturationSweep(resource.capacity) for resource in resources
+        }
+        buffers = {resource.id: Buffers.of(resource) for resource in resources}
+        gaps = {resource_id: b.gap for resource_id, b in buffers.items()}
+        max_gap = max(gaps.values())
+
+        # Times are slot starts: an item blocks starts until its end plus
+        # the resource gap, and a slot fits if it ends a gap before the next
+        # item. (free since, resource_id); outdated entries are skipped
+        # lazily, settled resources have None
+        free_since: dict[int, datetime | None] = dict.fromkeys(names, search_start)
+        heap = [(search_start, resource_id) for resource_id in names]
+        heapq.heapify(heap)
+        best: EarliestSlot | None = None
+
+        def fits_before(resource_id: int, moment: datetime) -> EarliestSlot | None:
+            cursor = free_since[resource_id]
+            if (
+                cursor + needed <= search_end
+                and cursor + needed + gaps[resource_id] <= moment
+            ):
+                return EarliestSlot(
+                    resource_id=resource_id,
+                    resource_name=names[resource_id],
+                    start=cursor,
+                    end=cursor + needed,
+                )
+            return None
+
+        def first() -> int | None:
+            while heap and heap[0][0] != free_since[heap[0][1]]:
+                heapq.heappop(heap)
+            return heap[0][1] if heap else None
+
+        stmt = (
+            sa.select(Booking.resource_id, Booking.start_time, Booking.end_time)
+            .where(
+                sa.and_(
+                    Booking.customer_id == customer_id,
+                    Booking.start_time < search_end + max_gap,
+                    Booking.end_time > search_start - max_gap,
+                ),
+            )
+            .order_by(Booking.start_time)
+            .execution_options(yield_per=STREAM_FETCH_SIZE)
+        )
+        extra = await _blocking_extra(
+            search_start,
+            search_end,
+            buffers=buffers,
+            capacities={rid: sweep.capacity for rid, sweep in sweeps.items()},
+            session=session,
+        )
+        result = await session.stream(stmt)
+        try:
+            async for resource_id, b_start, b_end, units in _merge_extra(
+                result,
+                extra,
+                gaps,
+            ):
+                if free_since[resource_id] is None:
+                    continue
+                # Later items of the resource start later: its gap is final
+                found = fits_before(resource_id, b_start)
+                if found is not None:
+                    if best is None or found.start < best.start:
+                        best = found
+                    free_since[resource_id] = None
+                    continue
+                top = first()
+                found = fits_before(top, b_start) if top is not None else None
+                if found is not None:
+                    return found if best is None or found.start < best.start else best
+                if best is not None and (top is None or free_since[top] >= best.start):
+                    return best
+                sweep = sweeps[resource_id]
+                sweep.add(b_start, b_end, units)
+                # Saturated until the end that brings it below capacity,
+                # unless later bookings extend it
+                busy_until = sweep.free_from()
+                if busy_until is not None and busy_until > free_since[resource_id]:
+                    free_since[resource_id] = busy_until
+                    heapq.heappush(heap, (busy_until, resource_id))
+        finally:
+            await result.close()
+
+        top = first()
+        if top is not None and free_since[top] + needed <= search_end:
+            found = EarliestSlot(
+                resource_id=top,
+                resource_name=names[top],
+                start=free_since[top],
+                end=free_since[top] + needed,
+            )
+            if best is None or found.start < best.start:
+                best = found
+        return best
+
+
+async def _blocking_extra(
+    search_start: datetime,
+    search_end: datetime,
+    *,
+    buffers: dict[int, Buffers],
+    capacities: dict[int, int],
+    session: AsyncSession,
+) -> list[tuple[datetime, datetime, int, int]]:
+    """Holds and closed hours of resources as sorted slot-start blockers.
+
+    Active holds take one unit, closed hours all of them; both are shifted
+    like bookings in find_earliest_slot and merged into its booking stream.
+    """
+    extra = [
+        (
+            hold.start_time,
+            hold.end_time + buffers[hold.resource_id].gap,
+            hold.resource_id,
+            1,
+        )
+        for resource_holds in (await hold_storage.active(list(buffers))).values()
+        for hold in resource_holds
+        if hold.overlaps(*buffers[hold.resource_id].probe(search_start, search_end))
+    ]
+    schedules = await schedule_registry.get_many(
+        resource_ids=list(buffers),
+        session=session,
+    )
+    for resource_id, schedule in schedules.items():
+        resource_buffers = buffers[resource_id]
+        extra.extend(
+            (
+                c_start + resource_buffers.before,
+                c_end + resource_buffers.before,
+                resource_id,
+                capacities[resource_id],
+            )
+            for c_start, c_end in schedule.closed_intervals(
+                *resource_buffers.occupied(search_start, search_end),
+            )
+        )
+    extra.sort()
+    return extra
+
+
+async def _merge_extra(
+    rows: AsyncIterator[tuple[int, datetime, datetime]],
+    extra: list[tuple[datetime, datetime, int, int]],
+    gaps: dict[int, timedelta],
+) -> AsyncIterator[tuple[int, datetime, datetime, int]]:
+    """Merge (start, end, resource_id, units) into rows ordered by start.
+
+    Yields (resource_id, start, end, units); bookings take one unit and
+    their ends are extended by the resource gap.
+    """
+    i = 0
+    async for resource_id, b_start, b_end in rows:
+        while i < len(extra) and extra[i][0] <= b_start:
+            e_start, e_end, e_resource_id, units = extra[i]
+            yield e_resource_id, e_start, e_end, units
+            i += 1
+        yield resource_id, b_start, b_end + gaps[resource_id], 1
+    for e_start, e_end, e_resource_id, units in extra[i:]:
+        yield e_resource_id, e_start, e_end, units
+
+
+async def _saturated_stream(
+    rows: AsyncIterator[tuple[datetime, datetime]],
+    extra: list[tuple[datetime, datetime, int]],
+    capacity: int,
+    buffers: Buffers = NO_BUFFERS,
+) -> AsyncIterator[tuple[datetime, datetime]]:
+    """Spans with capacity units taken, from rows ordered by start.
+
+    extra holds (start, end, units) occupied intervals sorted by start,
+    merged into the occupied intervals of rows; spans are yielded as
+    intervals slots must not overlap. Memory is bounded by the peak
+    concurrency.
+    """
+    sweep = SaturationSweep(capacity)
+    i = 0
+    async for b_start, b_end in rows:
+        o_start, o_end = buffers.occupied(b_start, b_end)
+        while i < len(extra) and extra[i][0] <= o_start:
+            for span in buffers.blocking(sweep.add(*extra[i])):
+                yield span
+            i += 1
+        for span in buffers.blocking(sweep.add(o_start, o_end)):
+            yield span
+    for e_start, e_end, units in extra[i:]:
+        for span in buffers.blocking(sweep.add(e_start, e_end, units)):
+            yield span
+    for span in buffers.blocking(sweep.finish()):
+        yield span
+
+
+def _hold_intervals(holds: list[Hold]) -> list[tuple[datetime, datetime]]:
+    return [(hold.start_time, hold.end_time) for hold in holds]
+
+
+def _int_array(values: list[int]) -> sa.BindParameter:
+    """Bind a list as one integer[] parameter for `= ANY(...)` filters."""
+    return sa.bindparam(None, list(values), type_=ARRAY(sa.Integer))
+
+
+def _effective_start(params: FreeSlotsParams) -> datetime:
+    """First slot boundary not before now, on the grid anchored at params.start.
+
+    Keeps results stable between slot boundaries, which makes them cacheable.
+    """
+    now = datetime.now(timezone.utc)
+    if params.start >= now:
+        return params.start
+    slot_delta = timedelta(seconds=params.slot)
+    steps = -((params.start - now) // slot_delta)
+    return params.start + steps * slot_delta
+
+
+def _validate_free_slots_params(
+    params: FreeSlotsParams,
+    max_interval: timedelta = MAX_INTERVAL,
+) -> None:
+    """Raise ValueError if free slots params are invalid."""
+    start = params.start
+    end = params.end
+
+    if start.tzinfo is None or end.tzinfo is None:
+        msg = "start and end must be timezone-aware datetimes"
+        raise ValueError(msg)
+    if end <= start:
+        msg = "end must be after start"
+        raise ValueError(msg)
+    if (end - start) > max_interval:
+        msg = f"interval duration must not exceed {max_interval.days} days"
+        raise ValueError(msg)
+    if params.slot <= 0:
+        msg = "slot must be a positive integer (seconds)"
+        raise ValueError(msg)
+
+
+def _schedule_changed(resource_id: int) -> None:
+    """Reload schedule and free slots of resource after hours/blackouts change."""
+    schedule_registry.drop(resource_id)
+    free_slots_cache.invalidate_resource(resource_id)
+
+
+def _validate_hours(hours: list[tuple[int, int, int]]) -> None:
+    """Raise ValueError on bad weekday/minutes or overlapping hours of a day."""
+    previous: tuple[int, int, int] | None = None
+    for weekday, open_minute, close_minute in sorted(hours):
+        if not 0 <= weekday <= 6:  # noqa: PLR2004
+            msg = "weekday must be from 0 (Monday) to 6 (Sunday)"
+            raise ValueError(msg)
+        if not 0 <= open_minute < close_minute <= MINUTES_PER_DAY:
+            msg = (
+                "open/close minutes must satisfy "
+                f"0 <= open < close <= {MINUTES_PER_DAY}"
+            )
+            raise ValueError(msg)
+        if previous and previous[0] == weekday and previous[2] > open_minute:
+            msg = f"opening hours of weekday {weekday} overlap"
+            raise ValueError(msg)
+        previous = (weekday, open_minute, close_minute)
+
+
+def _build_free_slots(  # noqa: PLR0913
+    bookings: list[tuple[datetime, datetime]],
+    start: datetime,
+    end: datetime,
+    slot: int,
+    *,
+    capacity: int = 1,
+    schedule: ResourceSchedule | None = None,
+) -> Sequence[tuple[datetime, datetime]]:
+    """Split [start, end) minus booked and closed intervals into slots.
+
+    With capacity above 1 only spans where capacity bookings are active are
+    busy. With buffers of the schedule, spans occupied by bookings (and
+    closed hours) are widened by them into intervals slots must not overlap.
+    Large windows with small slots go through the numpy path when available.
+    """
+    buffers = schedule.buffers if schedule is not None else NO_BUFFERS
+    if buffers:
+        bookings = [buffers.occupied(b_start, b_end) for b_start, b_end in bookings]
+    if capacity > 1:
+        bookings = saturated_intervals(bookings, capacity)
+    if schedule is not None:
+        closed = schedule.closed_intervals(*buffers.occupied(start, end))
+        if closed:
+            bookings = [*bookings, *closed]
+    if buffers:
+        bookings = buffers.blocking(bookings)
+    if should_vectorize(start, end, slot):
+        return build_free_slots_vectorized(bookings, start, end, slot)
+
+    busy = _merge_intervals(
+        [(max(b_start, start), min(b_end, end)) for b_start, b_end in bookings],
+    )
+
+    # Build free intervals (gaps between busy intervals); bounds taken from
+    # bookings are returned in the timezone of the window, like start/end
+    tz = start.tzinfo
+    free_intervals: list[tuple[datetime, datetime]] = []
+    cursor = start
+    for b_start, b_end in busy:
+        if cursor < b_start:
+            free_intervals.append((cursor, b_start.astimezone(tz)))
+        cursor = max(cursor, b_end.astimezone(tz))
+    if cursor < end:
+        free_intervals.append((cursor, end))
+
+    # Split free intervals into fixed-size slots
+    free_slots: list[tuple[datetime, datetime]] = []
+    for free_start, free_end in free_intervals:
+        free_slots.extend(_split_interval(free_start, free_end, slot))
+
+    return free_slots
+
+
+def _split_interval(
+    free_start: datetime,
+    free_end: datetime,
+    slot: int,
+) -> Iterator[tuple[datetime, datetime]]:
+    """Yield fixed-size slots that fit into [free_start, free_end)."""
+    if should_vectorize(free_start, free_end, slot):
+        yield from build_free_slots_vectorized([], free_start, free_end, slot)
+        return
+
+    slot_delta = timedelta(seconds=slot)
+    t = free_start
+    while t + slot_delta <= free_end:
+        yield (t, t + slot_delta)
+        t = t + slot_delta
 
 
 resource_service = ResourceService()
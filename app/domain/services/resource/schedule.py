@@ -0,0 +1,252 @@
+"""Opening hours and blackouts compiled into closed intervals.
+
+A resource without opening hours is open around the clock. With hours, the
+rest of every local day is closed; blackouts are closed as well. Closed
+intervals of a local day are compiled once into a sorted list memoized on
+the schedule; each worker keeps schedules like the interval index and
+reloads them after SCHEDULE_TTL_SECONDS to pick up changes of other workers.
+The schedule also carries the resource buffers, needed by the same checks.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import (
+    date,
+    datetime,
+    time as dt_time,
+    timedelta,
+    timezone,
+)
+import time
+from zoneinfo import ZoneInfo
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from app.depends import AsyncSession, provider
+from app.infrastructure.database import Resource, ResourceBlackout, ResourceHours
+
+from .buffers import NO_BUFFERS, Buffers
+
+# Reload a schedule after this many seconds even without local changes
+SCHEDULE_TTL_SECONDS = 60
+MINUTES_PER_DAY = 24 * 60
+
+_DAY = timedelta(days=1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass
+class ResourceSchedule:
+    """Opening hours by weekday and blackouts of one resource.
+
+    hours maps weekday (Monday = 0) to sorted (open_minute, close_minute)
+    pairs in the resource timezone; blackouts are sorted by start.
+    """
+
+    zone: ZoneInfo = field(default_factory=lambda: ZoneInfo("UTC"))
+    buffers: Buffers = NO_BUFFERS
+    hours: dict[int, list[tuple[int, int]]] = field(default_factory=dict)
+    blackouts: list[tuple[datetime, datetime]] = field(default_factory=list)
+    loaded_at: float = field(default_factory=time.monotonic)
+    # Local day -> its compiled closed intervals
+    _days: dict[date, list[tuple[datetime, datetime]]] = field(
+        default_factory=dict,
+        repr=False,
+    )
+
+    @property
+    def always_open(self) -> bool:
+        return not self.hours and not self.blackouts
+
+    def is_stale(self, ttl: float) -> bool:
+        return time.monotonic() - self.loaded_at > ttl
+
+    def closed_on(self, day: date) -> list[tuple[datetime, datetime]]:
+        """Closed intervals (UTC) of a local day, sorted and disjoint."""
+        closed = self._days.get(day)
+        if closed is None:
+            closed = self._compile(day)
+            self._days[day] = closed
+        return closed
+
+    def closed_intervals(
+        self,
+        start: datetime,
+        end: datetime,
+    ) -> list[tuple[datetime, datetime]]:
+        """Closed intervals overlapping [start, end), clipped and merged."""
+        if self.always_open:
+            return []
+        result: list[tuple[datetime, datetime]] = []
+        day = start.astimezone(self.zone).date()
+        last_day = (end - _MICROSECOND).astimezone(self.zone).date()
+        while day <= last_day:
+            for c_start, c_end in self.closed_on(day):
+                if c_start >= end or c_end <= start:
+                    continue
+                clip_start, clip_end = max(c_start, start), min(c_end, end)
+                # Closed evening and next closed morning join at midnight
+                if result and result[-1][1] >= clip_start:
+                    result[-1] = (result[-1][0], max(result[-1][1], clip_end))
+                else:
+                    result.append((clip_start, clip_end))
+            day += _DAY
+        return result
+
+    def is_open(self, start: datetime, end: datetime) -> bool:
+        """Check that no part of [start, end) is closed."""
+        return not self.closed_intervals(start, end)
+
+    def _compile(self, day: date) -> list[tuple[datetime, datetime]]:
+        day_start = self._local(day, 0)
+        day_end = self._local(day, MINUTES_PER_DAY)
+        closed: list[tuple[datetime, datetime]] = []
+        if self.hours:
+            cursor = day_start
+            for open_minute, close_minute in self.hours.get(day.weekday(), ()):
+                opens = self._local(day, open_minute)
+                if cursor < opens:
+                    closed.append((cursor, opens))
+                cursor = max(cursor, self._local(day, close_minute))
+            if cursor < day_end:
+                closed.append((cursor, day_end))
+
+        # Blackouts can't be longer than the longest one: skip earlier starts
+        lo = bisect_left(self.blackouts, (day_start - self._max_blackout(),))
+        hi = bisect_left(self.blackouts, (day_end,))
+        for b_start, b_end in self.blackouts[lo:hi]:
+            if b_end > day_start:
+                closed.append((max(b_start, day_start), min(b_end, day_end)))
+
+        merged: list[tuple[datetime, datetime]] = []
+        for c_start, c_end in sorted(closed):
+            if merged and merged[-1][1] >= c_start:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], c_end))
+            else:
+                merged.append((c_start, c_end))
+        return merged
+
+    def _local(self, day: date, minute: int) -> datetime:
+        """UTC moment of a local wall-clock minute of day (1440 = next day)."""
+        wall = datetime.combine(day, dt_time.min) + timedelta(minutes=minute)
+        return wall.replace(tzinfo=self.zone).astimezone(timezone.utc)
+
+    def _max_blackout(self) -> timedelta:
+        return max((end - start for start, end in self.blackouts), default=_DAY)
+
+
+class ScheduleRegistry:
+    """Per-worker registry of resource schedules."""
+
+    def __init__(self, ttl: float = SCHEDULE_TTL_SECONDS):
+        self.ttl = ttl
+        self._schedules: dict[int, ResourceSchedule] = {}
+        self._versions: dict[int, int] = {}
+
+    @provider.inject_session
+    async def get(
+        self,
+        resource_id: int,
+        session: AsyncSession | None = None,
+    ) -> ResourceSchedule:
+        """Return schedule of resource, loading it when missing or stale."""
+        schedules = await self.get_many(resource_ids=[resource_id], session=session)
+        return schedules[resource_id]
+
+    @provider.inject_session
+    async def get_many(
+        self,
+        resource_ids: list[int],
+        session: AsyncSession | None = None,
+    ) -> dict[int, ResourceSchedule]:
+        """Return schedules of resources, loading missing/stale ones together.
+
+        Unknown resources get an always open schedule.
+        """
+        result: dict[int, ResourceSchedule] = {}
+        to_load: list[int] = []
+        for resource_id in resource_ids:
+            schedule = self._schedules.get(resource_id)
+            if schedule is not None and not schedule.is_stale(self.ttl):
+                result[resource_id] = schedule
+            else:
+                to_load.append(resource_id)
+        if not to_load:
+            return result
+
+        versions = {rid: self._versions.get(rid, 0) for rid in to_load}
+        ids = sa.bindparam(None, to_load, type_=ARRAY(sa.Integer))
+        resources = await session.execute(
+            sa.select(
+                Resource.id,
+                Resource.timezone,
+                Resource.buffer_before,
+                Resource.buffer_after,
+            ).where(Resource.id == sa.any_(ids)),
+        )
+        for resource_id in to_load:
+            result[resource_id] = ResourceSchedule()
+        for resource_id, tz, before, after in resources:
+            # Validated by ResourceService when set
+            result[resource_id].zone = ZoneInfo(tz)
+            result[resource_id].buffers = Buffers(
+                before=timedelta(seconds=before),
+                after=timedelta(seconds=after),
+            )
+
+        hours = await session.execute(
+            sa.select(
+                ResourceHours.resource_id,
+                ResourceHours.weekday,
+                ResourceHours.open_minute,
+                ResourceHours.close_minute,
+            )
+            .where(ResourceHours.resource_id == sa.any_(ids))
+            .order_by(ResourceHours.resource_id, ResourceHours.open_minute),
+        )
+        for resource_id, weekday, open_minute, close_minute in hours:
+            result[resource_id].hours.setdefault(weekday, []).append(
+                (open_minute, close_minute),
+            )
+
+        # Ended blackouts can't affect bookings or slots any more
+        blackouts = await session.execute(
+            sa.select(
+                ResourceBlackout.resource_id,
+                ResourceBlackout.start_time,
+                ResourceBlackout.end_time,
+            )
+            .where(
+                sa.and_(
+                    ResourceBlackout.resource_id == sa.any_(ids),
+                    ResourceBlackout.end_time > datetime.now(timezone.utc),
+                ),
+            )
+            .order_by(ResourceBlackout.start_time),
+        )
+        for resource_id, start, end in blackouts:
+            result[resource_id].blackouts.append((start, end))
+
+        for resource_id in to_load:
+            # Changed while loading: serve this result, don't cache
+            if self._versions.get(resource_id, 0) == versions[resource_id]:
+                self._schedules[resource_id] = result[resource_id]
+        return result
+
+    def buffers(self, resource_id: int) -> Buffers:
+        """Buffers of the loaded schedule of resource, even a stale one.
+
+        Free slots of a buffered resource are computed and cached with the
+        loaded schedule, so they depend on bookings within these buffers.
+        """
+        schedule = self._schedules.get(resource_id)
+        return schedule.buffers if schedule is not None else NO_BUFFERS
+
+    def drop(self, resource_id: int) -> None:
+        """Drop schedule of resource (hours, blackouts, timezone or buffers)."""
+        self._versions[resource_id] = self._versions.get(resource_id, 0) + 1
+        self._schedules.pop(resource_id, None)
+
+
+schedule_registry = ScheduleRegistry()
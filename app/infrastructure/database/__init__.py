@@ -1,13 +1,18 @@
 from .models import (
     Base,
     Booking,
+    BookingArchive,
+    BookingSeries,
     BotConfig,
     Customer,
     CustomerAdmin,
     CustomerMember,
     Feedback,
+    IdempotencyKey,
     Notification,
     Resource,
+    ResourceBlackout,
+    ResourceHours,
     User,
     UserBot,
 )
@@ -0,0 +1,47 @@
+"""bookings no overlap exclusion constraint
+
+Revision ID: 3f1c9d2ab7e4
+Revises: notifications001
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c9d2ab7e4"
+down_revision: Union[str, None] = "notifications001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # btree_gist provides the "=" operator class for resource_id in GiST
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.add_column(
+        "bookings",
+        sa.Column(
+            "during",
+            postgresql.TSTZRANGE(),
+            sa.Computed("tstzrange(start_time, end_time)", persisted=True),
+            nullable=False,
+        ),
+    )
+    # Fails if overlapping bookings already exist: resolve them before upgrade
+    op.create_exclude_constraint(
+        "ex__bookings__no_overlap",
+        "bookings",
+        ("resource_id", "="),
+        ("during", "&&"),
+        using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ex__bookings__no_overlap", "bookings")
+    op.drop_column("bookings", "during")
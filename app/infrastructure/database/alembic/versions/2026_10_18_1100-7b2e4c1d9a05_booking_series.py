@@ -0,0 +1,94 @@
+"""booking series
+
+Revision ID: 7b2e4c1d9a05
+Revises: 3f1c9d2ab7e4
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2e4c1d9a05"
+down_revision: Union[str, None] = "3f1c9d2ab7e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "booking_series",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("resource_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "start_time",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Начало первого вхождения",
+        ),
+        sa.Column(
+            "end_time",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Конец первого вхождения",
+        ),
+        sa.Column(
+            "rrule",
+            sa.String(length=255),
+            nullable=False,
+            comment="Правило повторения (RFC 5545 RRULE)",
+        ),
+        sa.Column(
+            "timezone",
+            sa.String(length=64),
+            nullable=False,
+            comment="Часовой пояс, в котором повторяется локальное время",
+        ),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["resource_id"],
+            ["resources.id"],
+            name=op.f("fk__booking_series__resource_id__resources"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk__booking_series__user_id__users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk__booking_series")),
+    )
+    op.add_column("bookings", sa.Column("series_id", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        op.f("fk__bookings__series_id__booking_series"),
+        "bookings",
+        "booking_series",
+        ["series_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_index(
+        op.f("ix__bookings__series_id"), "bookings", ["series_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix__bookings__series_id"), table_name="bookings")
+    op.drop_constraint(
+        op.f("fk__bookings__series_id__booking_series"),
+        "bookings",
+        type_="foreignkey",
+    )
+    op.drop_column("bookings", "series_id")
+    op.drop_table("booking_series")
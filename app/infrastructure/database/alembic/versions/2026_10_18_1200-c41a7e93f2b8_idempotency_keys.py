@@ -0,0 +1,82 @@
+"""idempotency keys
+
+Revision ID: c41a7e93f2b8
+Revises: 7b2e4c1d9a05
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c41a7e93f2b8"
+down_revision: Union[str, None] = "7b2e4c1d9a05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "idempotency_keys",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "scope",
+            sa.String(length=32),
+            nullable=False,
+            comment="Операция, к которой относится ключ",
+        ),
+        sa.Column(
+            "key",
+            sa.String(length=255),
+            nullable=False,
+            comment="Ключ идемпотентности клиента",
+        ),
+        sa.Column(
+            "request_hash",
+            sa.String(length=64),
+            nullable=False,
+            comment="SHA-256 тела исходного запроса",
+        ),
+        sa.Column(
+            "response",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="Ответ на исходный запрос",
+        ),
+        sa.Column(
+            "expires_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Время, после которого ключ удаляется",
+        ),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk__idempotency_keys__user_id__users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "user_id", "scope", "key", name=op.f("pk__idempotency_keys")
+        ),
+    )
+    op.create_index(
+        op.f("ix__idempotency_keys__expires_at"),
+        "idempotency_keys",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix__idempotency_keys__expires_at"), table_name="idempotency_keys"
+    )
+    op.drop_table("idempotency_keys")
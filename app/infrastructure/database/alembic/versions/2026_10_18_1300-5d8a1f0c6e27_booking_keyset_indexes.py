@@ -0,0 +1,40 @@
+"""booking keyset indexes
+
+Revision ID: 5d8a1f0c6e27
+Revises: c41a7e93f2b8
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d8a1f0c6e27"
+down_revision: Union[str, None] = "c41a7e93f2b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix__bookings__user_id_start_time_id"),
+        "bookings",
+        ["user_id", "start_time", "id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix__bookings__resource_id_start_time_id"),
+        "bookings",
+        ["resource_id", "start_time", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix__bookings__resource_id_start_time_id"), table_name="bookings"
+    )
+    op.drop_index(op.f("ix__bookings__user_id_start_time_id"), table_name="bookings")
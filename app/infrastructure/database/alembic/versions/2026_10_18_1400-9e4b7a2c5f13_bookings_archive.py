@@ -0,0 +1,106 @@
+"""bookings archive
+
+Revision ID: 9e4b7a2c5f13
+Revises: 5d8a1f0c6e27
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9e4b7a2c5f13"
+down_revision: Union[str, None] = "5d8a1f0c6e27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bookings_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("start_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("end_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("resource_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("series_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["resource_id"],
+            ["resources.id"],
+            name=op.f("fk__bookings_archive__resource_id__resources"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk__bookings_archive__user_id__users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", "start_time", name=op.f("pk__bookings_archive")),
+        postgresql_partition_by="RANGE (start_time)",
+    )
+    op.create_index(
+        op.f("ix__bookings_archive__user_id_start_time_id"),
+        "bookings_archive",
+        ["user_id", "start_time", "id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix__bookings_archive__resource_id_start_time_id"),
+        "bookings_archive",
+        ["resource_id", "start_time", "id"],
+        unique=False,
+    )
+    # Monthly partitions are created by the archive job; the default one
+    # takes months older than BOOKING_ARCHIVE_KEEP_MONTHS
+    op.execute(
+        "CREATE TABLE bookings_archive_default PARTITION OF bookings_archive DEFAULT"
+    )
+
+    # Feedbacks outlive the booking row once it is archived
+    op.drop_constraint(
+        op.f("fk__feedbacks__booking_id__bookings"),
+        "feedbacks",
+        type_="foreignkey",
+    )
+    op.create_index(
+        op.f("ix__feedbacks__booking_id"), "feedbacks", ["booking_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix__feedbacks__booking_id"), table_name="feedbacks")
+    # Move archived bookings back so feedbacks satisfy the foreign key again
+    op.execute(
+        "INSERT INTO bookings "
+        "(id, start_time, end_time, resource_id, user_id, series_id, "
+        "created_at, updated_at) "
+        "SELECT id, start_time, end_time, resource_id, user_id, series_id, "
+        "created_at, updated_at FROM bookings_archive"
+    )
+    op.execute(
+        "DELETE FROM feedbacks f "
+        "WHERE NOT EXISTS (SELECT 1 FROM bookings b WHERE b.id = f.booking_id)"
+    )
+    op.create_foreign_key(
+        op.f("fk__feedbacks__booking_id__bookings"),
+        "feedbacks",
+        "bookings",
+        ["booking_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    # Dropping the parent drops its attached partitions too
+    op.drop_table("bookings_archive")
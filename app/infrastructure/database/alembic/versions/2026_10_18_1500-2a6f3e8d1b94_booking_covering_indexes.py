@@ -0,0 +1,72 @@
+"""booking covering indexes
+
+Revision ID: 2a6f3e8d1b94
+Revises: 9e4b7a2c5f13
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2a6f3e8d1b94"
+down_revision: Union[str, None] = "9e4b7a2c5f13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps bookings writable while the indexes are built
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix__bookings__end_time"),
+            "bookings",
+            ["end_time"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix__bookings__resource_id_start_time_id_covering",
+            "bookings",
+            ["resource_id", "start_time", "id"],
+            unique=False,
+            postgresql_include=["end_time"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix__bookings__resource_id_start_time_id"),
+            table_name="bookings",
+            postgresql_concurrently=True,
+        )
+    op.execute(
+        "ALTER INDEX ix__bookings__resource_id_start_time_id_covering "
+        "RENAME TO ix__bookings__resource_id_start_time_id"
+    )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix__bookings__resource_id_start_time_id_plain",
+            "bookings",
+            ["resource_id", "start_time", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix__bookings__resource_id_start_time_id"),
+            table_name="bookings",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix__bookings__end_time"),
+            table_name="bookings",
+            postgresql_concurrently=True,
+        )
+    op.execute(
+        "ALTER INDEX ix__bookings__resource_id_start_time_id_plain "
+        "RENAME TO ix__bookings__resource_id_start_time_id"
+    )
@@ -0,0 +1,65 @@
+"""booking customer_id
+
+Revision ID: 6c1d9b4e7a38
+Revises: 2a6f3e8d1b94
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6c1d9b4e7a38"
+down_revision: Union[str, None] = "2a6f3e8d1b94"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table in ("bookings", "bookings_archive"):
+        op.add_column(table, sa.Column("customer_id", sa.UUID(), nullable=True))
+        op.execute(
+            f"UPDATE {table} b SET customer_id = r.customer_id "  # noqa: S608
+            "FROM resources r WHERE r.id = b.resource_id"
+        )
+        op.alter_column(table, "customer_id", nullable=False)
+        op.create_foreign_key(
+            op.f(f"fk__{table}__customer_id__customers"),
+            table,
+            "customers",
+            ["customer_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
+    op.create_index(
+        op.f("ix__bookings__customer_id_user_id_start_time_id"),
+        "bookings",
+        ["customer_id", "user_id", "start_time", "id"],
+        unique=False,
+    )
+    # Superseded by the customer-scoped index above
+    op.drop_index(op.f("ix__bookings__user_id_start_time_id"), table_name="bookings")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix__bookings__user_id_start_time_id"),
+        "bookings",
+        ["user_id", "start_time", "id"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix__bookings__customer_id_user_id_start_time_id"),
+        table_name="bookings",
+    )
+    for table in ("bookings_archive", "bookings"):
+        op.drop_constraint(
+            op.f(f"fk__{table}__customer_id__customers"),
+            table,
+            type_="foreignkey",
+        )
+        op.drop_column(table, "customer_id")
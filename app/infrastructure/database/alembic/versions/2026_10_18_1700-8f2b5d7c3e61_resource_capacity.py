@@ -0,0 +1,69 @@
+"""resource capacity
+
+Revision ID: 8f2b5d7c3e61
+Revises: 6c1d9b4e7a38
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8f2b5d7c3e61"
+down_revision: Union[str, None] = "6c1d9b4e7a38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "resources",
+        sa.Column("capacity", sa.Integer(), server_default="1", nullable=False),
+    )
+    op.create_check_constraint(
+        op.f("ck__resources__capacity_positive"),
+        "resources",
+        "capacity >= 1",
+    )
+    # Existing resources keep capacity 1, so all their bookings are exclusive
+    op.add_column(
+        "bookings",
+        sa.Column(
+            "exclusive",
+            sa.Boolean(),
+            server_default=sa.true(),
+            nullable=False,
+        ),
+    )
+    op.drop_constraint("ex__bookings__no_overlap", "bookings")
+    op.create_exclude_constraint(
+        "ex__bookings__no_overlap",
+        "bookings",
+        ("resource_id", "="),
+        ("during", "&&"),
+        using="gist",
+        where=sa.text("exclusive"),
+    )
+
+
+def downgrade() -> None:
+    # Fails if shared resources have overlapping bookings: resolve them first
+    op.drop_constraint("ex__bookings__no_overlap", "bookings")
+    op.create_exclude_constraint(
+        "ex__bookings__no_overlap",
+        "bookings",
+        ("resource_id", "="),
+        ("during", "&&"),
+        using="gist",
+    )
+    op.drop_column("bookings", "exclusive")
+    op.drop_constraint(
+        op.f("ck__resources__capacity_positive"),
+        "resources",
+        type_="check",
+    )
+    op.drop_column("resources", "capacity")
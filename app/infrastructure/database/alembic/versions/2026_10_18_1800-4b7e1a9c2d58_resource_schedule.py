@@ -0,0 +1,120 @@
+"""resource schedule
+
+Revision ID: 4b7e1a9c2d58
+Revises: 8f2b5d7c3e61
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4b7e1a9c2d58"
+down_revision: Union[str, None] = "8f2b5d7c3e61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "resources",
+        sa.Column(
+            "timezone",
+            sa.String(length=64),
+            server_default="UTC",
+            nullable=False,
+        ),
+    )
+    op.create_table(
+        "resource_hours",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("resource_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "weekday",
+            sa.Integer(),
+            nullable=False,
+            comment="День недели, понедельник = 0",
+        ),
+        sa.Column(
+            "open_minute",
+            sa.Integer(),
+            nullable=False,
+            comment="Открытие, минут от полуночи",
+        ),
+        sa.Column(
+            "close_minute",
+            sa.Integer(),
+            nullable=False,
+            comment="Закрытие, минут от полуночи (1440 - конец дня)",
+        ),
+        sa.CheckConstraint(
+            "weekday BETWEEN 0 AND 6",
+            name=op.f("ck__resource_hours__weekday_range"),
+        ),
+        sa.CheckConstraint(
+            "0 <= open_minute AND open_minute < close_minute AND close_minute <= 1440",
+            name=op.f("ck__resource_hours__minutes_range"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["resource_id"],
+            ["resources.id"],
+            name=op.f("fk__resource_hours__resource_id__resources"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk__resource_hours")),
+    )
+    op.create_index(
+        op.f("ix__resource_hours__resource_id"),
+        "resource_hours",
+        ["resource_id"],
+        unique=False,
+    )
+    op.create_table(
+        "resource_blackouts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("resource_id", sa.Integer(), nullable=False),
+        sa.Column("start_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("end_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("reason", sa.String(length=255), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.CheckConstraint(
+            "start_time < end_time",
+            name=op.f("ck__resource_blackouts__time_range"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["resource_id"],
+            ["resources.id"],
+            name=op.f("fk__resource_blackouts__resource_id__resources"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk__resource_blackouts")),
+    )
+    op.create_index(
+        op.f("ix__resource_blackouts__resource_id_end_time"),
+        "resource_blackouts",
+        ["resource_id", "end_time"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix__resource_blackouts__resource_id_end_time"),
+        table_name="resource_blackouts",
+    )
+    op.drop_table("resource_blackouts")
+    op.drop_index(
+        op.f("ix__resource_hours__resource_id"),
+        table_name="resource_hours",
+    )
+    op.drop_table("resource_hours")
+    op.drop_column("resources", "timezone")
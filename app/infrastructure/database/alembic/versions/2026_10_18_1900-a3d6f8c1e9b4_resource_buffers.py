@@ -0,0 +1,45 @@
+"""resource buffers
+
+Revision ID: a3d6f8c1e9b4
+Revises: 4b7e1a9c2d58
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3d6f8c1e9b4"
+down_revision: Union[str, None] = "4b7e1a9c2d58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "resources",
+        sa.Column("buffer_before", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "resources",
+        sa.Column("buffer_after", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.create_check_constraint(
+        op.f("ck__resources__buffers_non_negative"),
+        "resources",
+        "buffer_before >= 0 AND buffer_after >= 0",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        op.f("ck__resources__buffers_non_negative"),
+        "resources",
+        type_="check",
+    )
+    op.drop_column("resources", "buffer_after")
+    op.drop_column("resources", "buffer_before")
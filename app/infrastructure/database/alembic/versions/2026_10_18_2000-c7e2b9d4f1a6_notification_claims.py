@@ -0,0 +1,56 @@
+"""notification claims
+
+Revision ID: c7e2b9d4f1a6
+Revises: a3d6f8c1e9b4
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e2b9d4f1a6"
+down_revision: Union[str, None] = "a3d6f8c1e9b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "notifications",
+        sa.Column(
+            "claimed_by",
+            sa.String(length=255),
+            nullable=True,
+            comment="Экземпляр, взявший уведомление в отправку",
+        ),
+    )
+    op.add_column(
+        "notifications",
+        sa.Column(
+            "claimed_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Время захвата уведомления в отправку",
+        ),
+    )
+    op.create_index(
+        "ix__notifications__claimed_at_processing",
+        "notifications",
+        ["claimed_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'processing'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix__notifications__claimed_at_processing",
+        table_name="notifications",
+    )
+    op.drop_column("notifications", "claimed_at")
+    op.drop_column("notifications", "claimed_by")
@@ -0,0 +1,78 @@
+"""feedback cleanup triggers
+
+Revision ID: e5a1c8f3b7d2
+Revises: c7e2b9d4f1a6
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a1c8f3b7d2"
+down_revision: Union[str, None] = "c7e2b9d4f1a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # feedbacks.booking_id has no foreign key (bookings move to the archive),
+    # so deleting a booking removes its feedbacks here, for every delete path
+    # including cascades from resources, users and customers. A booking
+    # moved to the archive by the same statement keeps them: AFTER triggers
+    # fire at the end of the statement and see the archived row.
+    op.execute(
+        """
+        CREATE FUNCTION delete_booking_feedbacks() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            DELETE FROM feedbacks f
+            WHERE f.booking_id = OLD.id
+              AND NOT EXISTS (
+                  SELECT 1 FROM bookings_archive a
+                  WHERE a.id = OLD.id AND a.start_time = OLD.start_time
+              );
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION delete_archived_booking_feedbacks() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            DELETE FROM feedbacks f WHERE f.booking_id = OLD.id;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER tr__bookings__delete_feedbacks "
+        "AFTER DELETE ON bookings "
+        "FOR EACH ROW EXECUTE FUNCTION delete_booking_feedbacks()"
+    )
+    op.execute(
+        "CREATE TRIGGER tr__bookings_archive__delete_feedbacks "
+        "AFTER DELETE ON bookings_archive "
+        "FOR EACH ROW EXECUTE FUNCTION delete_archived_booking_feedbacks()"
+    )
+    # Feedbacks already orphaned by deletes without the triggers
+    op.execute(
+        "DELETE FROM feedbacks f "
+        "WHERE NOT EXISTS (SELECT 1 FROM bookings b WHERE b.id = f.booking_id) "
+        "AND NOT EXISTS (SELECT 1 FROM bookings_archive a WHERE a.id = f.booking_id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER tr__bookings_archive__delete_feedbacks ON bookings_archive"
+    )
+    op.execute("DROP TRIGGER tr__bookings__delete_feedbacks ON bookings")
+    op.execute("DROP FUNCTION delete_archived_booking_feedbacks()")
+    op.execute("DROP FUNCTION delete_booking_feedbacks()")
@@ -0,0 +1,45 @@
+"""idempotency pending keys
+
+Revision ID: f2b8d6a4c9e1
+Revises: e5a1c8f3b7d2
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b8d6a4c9e1"
+down_revision: Union[str, None] = "e5a1c8f3b7d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A key is reserved before the request runs; the response is filled in
+    # by the same transaction
+    op.alter_column(
+        "idempotency_keys",
+        "response",
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        nullable=True,
+        comment="Ответ на исходный запрос (NULL, пока запрос выполняется)",
+        existing_comment="Ответ на исходный запрос",
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM idempotency_keys WHERE response IS NULL")
+    op.alter_column(
+        "idempotency_keys",
+        "response",
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        nullable=False,
+        comment="Ответ на исходный запрос",
+        existing_comment="Ответ на исходный запрос (NULL, пока запрос выполняется)",
+    )
@@ -1,5 +1,13 @@
-from .booking import Booking, Resource
+from .booking import (
+    Booking,
+    BookingArchive,
+    BookingSeries,
+    Resource,
+    ResourceBlackout,
+    ResourceHours,
+)
 from .feedback import Feedback
+from .idempotency import IdempotencyKey
 from .notification import Notification, NotificationStatus, NotificationType
 from .shared import Base
 from .users import BotConfig, Customer, CustomerAdmin, CustomerMember, User, UserBot
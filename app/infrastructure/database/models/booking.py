@@ -1,8 +1,14 @@
+from datetime import datetime
 from typing import TYPE_CHECKING
 import uuid as uuid_lib
 
 import sqlalchemy as sa
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import (
+    TSTZRANGE,
+    UUID,
+    ExcludeConstraint,
+    Range,
+)
 import sqlalchemy.orm as so
 
 from app.infrastructure.database.models.shared import (
@@ -26,6 +32,125 @@ class Resource(Base, CreatedMixin):
         UUID,
         sa.ForeignKey("customers.id", ondelete="CASCADE"),
     )
+    # Concurrent bookings the resource takes (seats, desks, units)
+    capacity: so.Mapped[int] = so.mapped_column(default=1, server_default="1")
+    # IANA timezone of the opening hours
+    timezone: so.Mapped[str] = so.mapped_column(
+        sa.String(64),
+        default="UTC",
+        server_default="UTC",
+    )
+
+    # Setup before and turnaround after each booking, seconds
+    buffer_before: so.Mapped[int] = so.mapped_column(default=0, server_default="0")
+    buffer_after: so.Mapped[int] = so.mapped_column(default=0, server_default="0")
+
+    __table_args__ = (
+        sa.CheckConstraint("capacity >= 1", name="capacity_positive"),
+        sa.CheckConstraint(
+            "buffer_before >= 0 AND buffer_after >= 0",
+            name="buffers_non_negative",
+        ),
+    )
+
+
+class ResourceHours(Base):
+    """Opening interval of a resource on a weekday, in its local time.
+
+    A resource without any rows is open around the clock; with rows it is
+    closed outside them, including weekdays without rows.
+    """
+
+    __tablename__ = "resource_hours"
+
+    id: so.Mapped[int] = so.mapped_column(
+        primary_key=True,
+    )
+    resource_id: so.Mapped[int] = so.mapped_column(
+        sa.ForeignKey("resources.id", ondelete="CASCADE"),
+        index=True,
+    )
+    weekday: so.Mapped[int] = so.mapped_column(
+        comment="День недели, понедельник = 0",
+    )
+    open_minute: so.Mapped[int] = so.mapped_column(
+        comment="Открытие, минут от полуночи",
+    )
+    close_minute: so.Mapped[int] = so.mapped_column(
+        comment="Закрытие, минут от полуночи (1440 - конец дня)",
+    )
+
+    __table_args__ = (
+        sa.CheckConstraint("weekday BETWEEN 0 AND 6", name="weekday_range"),
+        sa.CheckConstraint(
+            "0 <= open_minute AND open_minute < close_minute AND close_minute <= 1440",
+            name="minutes_range",
+        ),
+    )
+
+
+class ResourceBlackout(Base, CreatedMixin):
+    """Period when a resource can't be booked (maintenance, holidays)."""
+
+    __tablename__ = "resource_blackouts"
+
+    id: so.Mapped[int] = so.mapped_column(
+        primary_key=True,
+    )
+    resource_id: so.Mapped[int] = so.mapped_column(
+        sa.ForeignKey("resources.id", ondelete="CASCADE"),
+    )
+    start_time: so.Mapped[datetime] = so.mapped_column(
+        sa.DateTime(timezone=True),
+    )
+    end_time: so.Mapped[datetime] = so.mapped_column(
+        sa.DateTime(timezone=True),
+    )
+    reason: so.Mapped[str | None] = so.mapped_column(sa.String(255))
+
+    __table_args__ = (
+        sa.CheckConstraint("start_time < end_time", name="time_range"),
+        # Schedules load blackouts not ended yet
+        sa.Index(
+            "ix__resource_blackouts__resource_id_end_time",
+            "resource_id",
+            "end_time",
+        ),
+    )
+
+
+class BookingSeries(BaseWithDt):
+    """Recurring booking: first occurrence plus an RRULE expanded from it."""
+
+    __tablename__ = "booking_series"
+
+    id: so.Mapped[int] = so.mapped_column(
+        primary_key=True,
+    )
+    resource_id: so.Mapped[int] = so.mapped_column(
+        sa.ForeignKey("resources.id", ondelete="CASCADE"),
+    )
+    user_id: so.Mapped[uuid_lib.UUID] = so.mapped_column(
+        UUID,
+        sa.ForeignKey("users.id", ondelete="CASCADE"),
+    )
+    start_time: so.Mapped[datetime] = so.mapped_column(
+        sa.DateTime(timezone=True),
+        comment="Начало первого вхождения",
+    )
+    end_time: so.Mapped[datetime] = so.mapped_column(
+        sa.DateTime(timezone=True),
+        comment="Конец первого вхождения",
+    )
+    rrule: so.Mapped[str] = so.mapped_column(
+        sa.String(255),
+        comment="Правило повторения (RFC 5545 RRULE)",
+    )
+    timezone: so.Mapped[str] = so.mapped_column(
+        sa.String(64),
+        default="UTC",
+        comment="Часовой пояс, в котором повторяется локальное время",
+    )
 
 
 class Booking(BaseWithDt):
@@ -41,11 +166,33 @@ class Booking(BaseWithDt):
         UUID,
         sa.ForeignKey("users.id", ondelete="CASCADE"),
     )
+    # Copy of resources.customer_id for per-tenant filters without a join
+    customer_id: so.Mapped[uuid_lib.UUID] = so.mapped_column(
+        UUID,
+        sa.ForeignKey("customers.id", ondelete="CASCADE"),
+    )
     start_time: so.Mapped[sa.DateTime] = so.mapped_column(
         sa.DateTime(timezone=True),
     )
     end_time: so.Mapped[sa.DateTime] = so.mapped_column(
         sa.DateTime(timezone=True),
+        index=True,  # Evaluation notifications and archiving scan by end
+    )
+    # [start_time, end_time) generated by Postgres, used by the exclusion
+    # constraint and GiST overlap lookups
+    during: so.Mapped[Range[datetime]] = so.mapped_column(
+        TSTZRANGE,
+        sa.Computed("tstzrange(start_time, end_time)", persisted=True),
+    )
+    series_id: so.Mapped[int | None] = so.mapped_column(
+        sa.ForeignKey("booking_series.id", ondelete="SET NULL"),
+        index=True,
+    )
+    # Resource has capacity 1: only such bookings are checked by the
+    # no-overlap constraint, shared resources are counted by the service
+    exclusive: so.Mapped[bool] = so.mapped_column(
+        default=True,
+        server_default=sa.true(),
     )
 
     notifications: so.Mapped[list["Notification"]] = so.relationship(
@@ -59,3 +206,87 @@ class Booking(BaseWithDt):
         backref="bookings",
         lazy="select",
     )
+
+    __table_args__ = (
+        ExcludeConstraint(
+            (sa.column("resource_id"), "="),
+            (sa.column("during"), "&&"),
+            name="ex__bookings__no_overlap",
+            using="gist",
+            where=sa.column("exclusive"),
+        ),
+        # Keyset pagination of user listings within a customer
+        sa.Index(
+            "ix__bookings__customer_id_user_id_start_time_id",
+            "customer_id",
+            "user_id",
+            "start_time",
+            "id",
+        ),
+        # Keyset pagination of resource listings and start/end overlap
+        # scans; end_time is included so they don't visit the heap
+        sa.Index(
+            "ix__bookings__resource_id_start_time_id",
+            "resource_id",
+            "start_time",
+            "id",
+            postgresql_include=["end_time"],
+        ),
+    )
+
+
+class BookingArchive(Base):
+    """Ended booking moved out of bookings by the archive job.
+
+    Partitioned by month of start_time; partitions are created and detached
+    by BookingArchiveService. Ids are kept, so feedbacks still resolve.
+    """
+
+    __tablename__ = "bookings_archive"
+
+    id: so.Mapped[int] = so.mapped_column(
+        primary_key=True,
+        autoincrement=False,
+    )
+    # Partition key must be part of the primary key
+    start_time: so.Mapped[datetime] = so.mapped_column(
+        sa.DateTime(timezone=True),
+        primary_key=True,
+    )
+    end_time: so.Mapped[datetime] = so.mapped_column(
+        sa.DateTime(timezone=True),
+    )
+    resource_id: so.Mapped[int] = so.mapped_column(
+        sa.ForeignKey("resources.id", ondelete="CASCADE"),
+    )
+    user_id: so.Mapped[uuid_lib.UUID] = so.mapped_column(
+        UUID,
+        sa.ForeignKey("users.id", ondelete="CASCADE"),
+    )
+    customer_id: so.Mapped[uuid_lib.UUID] = so.mapped_column(
+        UUID,
+        sa.ForeignKey("customers.id", ondelete="CASCADE"),
+    )
+    series_id: so.Mapped[int | None]
+    created_at: so.Mapped[datetime] = so.mapped_column(sa.DateTime)
+    updated_at: so.Mapped[datetime] = so.mapped_column(sa.DateTime)
+    archived_at: so.Mapped[datetime] = so.mapped_column(
+        sa.DateTime(timezone=True),
+        server_default=sa.func.now(),
+    )
+
+    __table_args__ = (
+        sa.Index(
+            "ix__bookings_archive__user_id_start_time_id",
+            "user_id",
+            "start_time",
+            "id",
+        ),
+        sa.Index(
+            "ix__bookings_archive__resource_id_start_time_id",
+            "resource_id",
+            "start_time",
+            "id",
+        ),
+        {"postgresql_partition_by": "RANGE (start_time)"},
+    )
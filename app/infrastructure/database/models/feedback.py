@@ -16,9 +16,10 @@ class Feedback(Base, CreatedMixin):
     id: so.Mapped[int] = so.mapped_column(
         primary_key=True,
     )
-    booking_id: so.Mapped[int] = so.mapped_column(
-        sa.ForeignKey("bookings.id", ondelete="CASCADE"),
-    )
+    # No foreign key: ended bookings move to bookings_archive with their id.
+    # Delete triggers on bookings and bookings_archive remove feedbacks of
+    # deleted (not archived) bookings
+    booking_id: so.Mapped[int] = so.mapped_column(index=True)
     user_id: so.Mapped[uuid_lib.UUID] = so.mapped_column(
         UUID,
         sa.ForeignKey("users.id", ondelete="CASCADE"),
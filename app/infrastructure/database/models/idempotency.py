@@ -0,0 +1,43 @@
+from datetime import datetime
+import uuid as uuid_lib
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+import sqlalchemy.orm as so
+
+from app.infrastructure.database.models.shared import Base, CreatedMixin
+
+
+class IdempotencyKey(Base, CreatedMixin):
+    """Stored result of a request made with an idempotency key."""
+
+    __tablename__ = "idempotency_keys"
+
+    user_id: so.Mapped[uuid_lib.UUID] = so.mapped_column(
+        UUID,
+        sa.ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    scope: so.Mapped[str] = so.mapped_column(
+        sa.String(32),
+        primary_key=True,
+        comment="Операция, к которой относится ключ",
+    )
+    key: so.Mapped[str] = so.mapped_column(
+        sa.String(255),
+        primary_key=True,
+        comment="Ключ идемпотентности клиента",
+    )
+    request_hash: so.Mapped[str] = so.mapped_column(
+        sa.String(64),
+        comment="SHA-256 тела исходного запроса",
+    )
+    response: so.Mapped[dict | None] = so.mapped_column(
+        JSONB,
+        comment="Ответ на исходный запрос (NULL, пока запрос выполняется)",
+    )
+    expires_at: so.Mapped[datetime] = so.mapped_column(
+        sa.DateTime(timezone=True),
+        index=True,
+        comment="Время, после которого ключ удаляется",
+    )
@@ -37,6 +37,14 @@ class Notification(BaseWithDt):
     """Notification model."""
 
     __tablename__ = "notifications"
+    __table_args__ = (
+        # The reaper looks for stale claims among processing rows only
+        sa.Index(
+            "ix__notifications__claimed_at_processing",
+            "claimed_at",
+            postgresql_where=sa.text("status = 'processing'"),
+        ),
+    )
 
     id: so.Mapped[int] = so.mapped_column(
         primary_key=True,
@@ -85,6 +93,18 @@ class Notification(BaseWithDt):
         comment="Время фактической отправки",
     )
 
+    # Claim of an instance sending the notification
+    claimed_by: so.Mapped[str | None] = so.mapped_column(
+        sa.String(255),
+        nullable=True,
+        comment="Экземпляр, взявший уведомление в отправку",
+    )
+    claimed_at: so.Mapped[datetime | None] = so.mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=True,
+        comment="Время захвата уведомления в отправку",
+    )
+
     # Message info
     message: so.Mapped[str | None] = so.mapped_column(
         sa.Text,
@@ -1,5 +1,7 @@
 """Metrics module for business and technical metrics."""
 
 from .business import business_metrics
+from .cache import cache_metrics
+from .notifications import notification_metrics
 
-__all__ = ["business_metrics"]
+__all__ = ["business_metrics", "cache_metrics", "notification_metrics"]
@@ -0,0 +1,23 @@
+from prometheus_client import Counter
+
+free_slots_cache_hits_total = Counter(
+    "free_slots_cache_hits_total",
+    "Total number of free slots cache hits",
+)
+free_slots_cache_misses_total = Counter(
+    "free_slots_cache_misses_total",
+    "Total number of free slots cache misses",
+)
+free_slots_cache_evictions_total = Counter(
+    "free_slots_cache_evictions_total",
+    "Total number of free slots cache entries evicted",
+    ["reason"],
+)
+cache_metrics = [
+    free_slots_cache_hits_total,
+    free_slots_cache_misses_total,
+    free_slots_cache_evictions_total,
+]
+free_slots_cache_evictions_total.labels(reason="ttl")
+free_slots_cache_evictions_total.labels(reason="lru")
+free_slots_cache_evictions_total.labels(reason="invalidate")
@@ -0,0 +1,14 @@
+from prometheus_client import Gauge
+
+notification_send_queue_depth = Gauge(
+    "notification_send_queue_depth",
+    "Number of notifications waiting for a sender",
+)
+notification_sends_in_flight = Gauge(
+    "notification_sends_in_flight",
+    "Number of notifications being sent",
+)
+notification_metrics = [
+    notification_send_queue_depth,
+    notification_sends_in_flight,
+]
@@ -1,5 +1,8 @@
 import asyncio
+import contextlib
 from datetime import datetime, timedelta
+import os
+import socket
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -10,16 +13,30 @@ from sqlalchemy import and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.config import config
+from app.domain.services.bookings import (
+    booking_archive_service,
+    idempotency_service,
+)
 from app.domain.services.feedback.evaluation_notification import (
     EvaluationNotificationService,
 )
-from app.domain.services.notification.service import NotificationService
-from app.infrastructure.database.models.booking import Booking
+from app.domain.services.notification.outcomes import NotificationOutcomes
+from app.domain.services.notification.service import (
+    NotificationBatch,
+    NotificationService,
+)
 from app.infrastructure.database.models.notification import (
     Notification,
     NotificationStatus,
 )
 from app.log import log
+from app.metrics.notifications import (
+    notification_send_queue_depth,
+    notification_sends_in_flight,
+)
+
+from .timer import NotificationTimer
 
 
 class NotificationScheduler:
@@ -41,8 +58,18 @@ class NotificationScheduler:
             },
         )
         self.is_running = False
+        # Minutes between safety scans; the timer sends on due time
         self.check_interval = 5
         self.batch_size = 50
+        self.concurrency = config.bot.NOTIFICATION_CONCURRENCY
+        # Seconds between timer refills, shorter than the look-ahead window
+        self.refill_interval = 60
+        self.timer = NotificationTimer(lookahead=timedelta(minutes=10))
+        self._timer_task: asyncio.Task | None = None
+        # Claims of this instance; claims older than claim_timeout are
+        # released by the reaper for another attempt
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.claim_timeout = timedelta(minutes=10)
 
     async def start(self) -> None:
         """Start the scheduler."""
@@ -75,6 +102,36 @@ class NotificationScheduler:
             replace_existing=True,
         )
 
+        # Claims of crashed instances go back to pending
+        self.scheduler.add_job(
+            self._reap_stale_claims_job,
+            trigger=IntervalTrigger(minutes=self.check_interval),
+            id="reap_stale_notification_claims",
+            name="Release stale notification claims",
+            replace_existing=True,
+        )
+
+        # Expired idempotency keys are only needed until their TTL
+        self.scheduler.add_job(
+            self._purge_idempotency_keys_job,
+            trigger=IntervalTrigger(hours=1),
+            id="purge_idempotency_keys",
+            name="Purge expired idempotency keys",
+            replace_existing=True,
+        )
+
+        # Move long-ended bookings to the partitioned archive
+        self.scheduler.add_job(
+            self._archive_bookings_job,
+            trigger=IntervalTrigger(
+                days=1,
+                start_date=datetime.now(ZoneInfo("UTC")) + timedelta(minutes=1),
+            ),
+            id="archive_bookings",
+            name="Archive ended bookings and manage archive partitions",
+            replace_existing=True,
+        )
+
         self.scheduler.start()
         self.is_running = True
         log(
@@ -87,12 +144,18 @@ class NotificationScheduler:
         asyncio.create_task(self._process_notifications_job())  # noqa: RUF006
         # First run of evaluation notifications after 15 seconds
         asyncio.create_task(self._create_evaluation_notifications_job())  # noqa: RUF006
+        self._timer_task = asyncio.create_task(self._timer_loop())
 
     async def stop(self) -> None:
         """Stop the scheduler."""
         if not self.is_running:
             return
         self.scheduler.shutdown(wait=True)
+        if self._timer_task is not None:
+            self._timer_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._timer_task
+            self._timer_task = None
 
         # Clear cache
         await self.notification_service.clear_bot_cache()
@@ -106,10 +169,10 @@ class NotificationScheduler:
         )
 
     async def _process_notifications_job(self):
-        """Main task for processing notifications"""
+        """Safety scan: send pending notifications the timer has missed"""
         try:
             async with self.session_factory() as session:
-                notifications = await self._get_pending_notifications(session)
+                notifications = await self._claim_notifications(session)
                 log(
                     level="info",
                     method="_process_notifications_job",
@@ -132,28 +195,7 @@ class NotificationScheduler:
                     path="NotificationScheduler",
                     text_detail=f"Found {len(notifications)} notifications to process",
                 )
-
-                for notification in notifications:
-                    try:
-                        # Call service method based on notification type
-                        success = await self._send_by_type(notification)
-                        if not success:
-                            log(
-                                level="error",
-                                method="_process_notifications_job",
-                                path="NotificationScheduler",
-                                text_detail=f"Failed to send notification {notification.id}",  # noqa: E501
-                            )
-                    except Exception as e:  # noqa: BLE001
-                        log(
-                            level="error",
-                            method="_process_notifications_job",
-                            path="NotificationScheduler",
-                            text_detail=f"Error processing notification {notification.id}: {e}",  # noqa: E501
-                            exception=e,
-                        )
-
-                await session.commit()
+                await self._send_notifications(notifications, session)
 
         except Exception as e:  # noqa: BLE001
             log(
@@ -164,49 +206,205 @@ class NotificationScheduler:
                 exception=e,
             )
 
-    async def _get_pending_notifications(
+    async def _timer_loop(self):
+        """Send notifications at their due time, refilling the timer."""
+        next_refill = datetime.now(ZoneInfo("UTC"))
+        while True:
+            try:
+                now = datetime.now(ZoneInfo("UTC"))
+                if now >= next_refill:
+                    async with self.session_factory() as session:
+                        await self.timer.refill(session, now)
+                    next_refill = now + timedelta(seconds=self.refill_interval)
+
+                due = self.timer.pop_due(now)
+                if due:
+                    await self._send_due(due)
+                    continue
+
+                wake_at = next_refill
+                next_due = self.timer.next_due()
+                if next_due is not None:
+                    wake_at = min(wake_at, next_due)
+                await asyncio.sleep(max((wake_at - now).total_seconds(), 0))
+            except Exception as e:  # noqa: BLE001
+                log(
+                    level="error",
+                    method="_timer_loop",
+                    path="NotificationScheduler",
+                    text_detail=f"Error in notification timer: {e}",
+                    exception=e,
+                )
+                # Retry the refill later; the safety scan covers the gap
+                next_refill = datetime.now(ZoneInfo("UTC")) + timedelta(
+                    seconds=self.refill_interval,
+                )
+                await asyncio.sleep(self.refill_interval)
+
+    async def _send_due(self, notification_ids: list[int]):
+        """Send notifications popped from the timer that are still pending."""
+        for i in range(0, len(notification_ids), self.batch_size):
+            async with self.session_factory() as session:
+                notifications = await self._claim_notifications(
+                    session,
+                    notification_ids[i : i + self.batch_size],
+                )
+                await self._send_notifications(notifications, session)
+
+    async def _send_notifications(
+        self,
+        notifications: list[Notification],
+        session: AsyncSession,
+    ):
+        """Send notifications with a pool of concurrency workers.
+
+        Bots and recipients are resolved for the whole batch first, so the
+        workers only talk to Telegram. Telegram latency dominates a send, so
+        workers overlap them; the service rate limiter keeps them within
+        per-chat and per-bot limits. Statuses are written in bulk by
+        NotificationOutcomes, not by the session unit of work.
+        """
+        if not notifications:
+            return
+        batch = await self.notification_service.resolve_batch(notifications, session)
+        session.expunge_all()
+        queue: asyncio.Queue[Notification] = asyncio.Queue()
+        for notification in notifications:
+            queue.put_nowait(notification)
+        notification_send_queue_depth.inc(len(notifications))
+        workers = min(self.concurrency, len(notifications))
+        async with NotificationOutcomes(self.session_factory) as outcomes:
+            await asyncio.gather(
+                *(self._send_worker(queue, batch, outcomes) for _ in range(workers)),
+            )
+
+    async def _send_worker(
+        self,
+        queue: asyncio.Queue[Notification],
+        batch: NotificationBatch,
+        outcomes: NotificationOutcomes,
+    ):
+        """Send notifications from queue until it is empty."""
+        while not queue.empty():
+            notification = queue.get_nowait()
+            notification_send_queue_depth.dec()
+            with notification_sends_in_flight.track_inprogress():
+                await self._send_one(notification, batch)
+            # Left processing on unexpected errors: the reaper retries it
+            if notification.status in {
+                NotificationStatus.SENT,
+                NotificationStatus.FAILED,
+            }:
+                await outcomes.record(notification)
+
+    async def _send_one(self, notification: Notification, batch: NotificationBatch):
+        """Send one notification, logging failures."""
+        try:
+            # Call service method based on notification type
+            success = await self._send_by_type(notification, batch)
+            if not success:
+                log(
+                    level="error",
+                    method="_send_one",
+                    path="NotificationScheduler",
+                    text_detail=f"Failed to send notification {notification.id}",
+                )
+        except Exception as e:  # noqa: BLE001
+            log(
+                level="error",
+                method="_send_one",
+                path="NotificationScheduler",
+                text_detail=f"Error processing notification {notification.id}: {e}",
+                exception=e,
+            )
+
+    async def _claim_notifications(
         self,
         session: AsyncSession,
+        notification_ids: list[int] | None = None,
     ) -> list[Notification]:
-        """Get notifications ready to send."""
+        """Claim due pending notifications (of ids if given) for this instance.
+
+        One UPDATE moves up to batch_size rows to processing; rows locked by
+        a concurrent claim of another instance are skipped, not waited for.
+        The claim is committed before sending, so other instances see it.
+        """
         now = datetime.now(ZoneInfo("UTC"))
+        conditions = [
+            Notification.status == NotificationStatus.PENDING,
+            Notification.scheduled_at <= now,
+            Notification.scheduled_at >= now - timedelta(hours=24),
+        ]
+        if notification_ids is not None:
+            conditions.append(Notification.id.in_(notification_ids))
+        candidates = (
+            sa.select(Notification.id)
+            .where(and_(*conditions))
+            .order_by(Notification.scheduled_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        claimed = await session.scalars(
+            sa.update(Notification)
+            .where(Notification.id.in_(candidates.scalar_subquery()))
+            .values(
+                status=NotificationStatus.PROCESSING,
+                claimed_by=self.worker_id,
+                claimed_at=sa.func.now(),
+            )
+            .returning(Notification.id)
+            .execution_options(synchronize_session=False),
+        )
+        claimed_ids = claimed.all()
+        await session.commit()
+        if not claimed_ids:
+            return []
+
         stmt = (
             sa.select(Notification)
             .options(
-                selectinload(Notification.booking).selectinload(Booking.resource_obj),
+                selectinload(Notification.booking),
                 selectinload(Notification.user),
             )
-            .where(
-                and_(
-                    Notification.status == NotificationStatus.PENDING,
-                    Notification.scheduled_at <= now,
-                    Notification.scheduled_at >= now - timedelta(hours=24),
-                ),
-            )
+            .where(Notification.id.in_(claimed_ids))
             .order_by(Notification.scheduled_at)
-            .limit(self.batch_size)
         )
-
         result = await session.scalars(stmt)
         return result.all()
 
     async def _send_by_type(
         self,
         notification: Notification,
+        batch: NotificationBatch,
     ) -> bool:
         """Route notification to appropriate service method based on type."""
         notification_type = notification.type
 
         if notification_type == "booking_24h":
-            return await self.notification_service.send_booking_24h(notification)
+            return await self.notification_service.send_booking_24h(
+                notification,
+                batch,
+            )
         if notification_type == "booking_1h":
-            return await self.notification_service.send_booking_1h(notification)
+            return await self.notification_service.send_booking_1h(
+                notification,
+                batch,
+            )
         if notification_type == "booking_start":
-            return await self.notification_service.send_booking_start(notification)
+            return await self.notification_service.send_booking_start(
+                notification,
+                batch,
+            )
         if notification_type == "booking_end":
-            return await self.notification_service.send_booking_end(notification)
+            return await self.notification_service.send_booking_end(
+                notification,
+                batch,
+            )
         if notification_type == "booking_eval":
-            return await self.notification_service.send_booking_eval(notification)
+            return await self.notification_service.send_booking_eval(
+                notification,
+                batch,
+            )
         log(
             level="error",
             method="_send_by_type",
@@ -228,6 +426,92 @@ class NotificationScheduler:
                 exception=e,
             )
 
+    async def _reap_stale_claims_job(self):
+        """Job for returning notifications of stale claims to pending."""
+        try:
+            async with self.session_factory() as session:
+                cutoff = datetime.now(ZoneInfo("UTC")) - self.claim_timeout
+                result = await session.execute(
+                    sa.update(Notification)
+                    .where(
+                        and_(
+                            Notification.status == NotificationStatus.PROCESSING,
+                            # Rows claimed before claims were recorded
+                            sa.func.coalesce(
+                                Notification.claimed_at,
+                                Notification.processed_at,
+                            )
+                            < cutoff,
+                        ),
+                    )
+                    .values(
+                        status=NotificationStatus.PENDING,
+                        claimed_by=None,
+                        claimed_at=None,
+                    )
+                    .execution_options(synchronize_session=False),
+                )
+                await session.commit()
+            if result.rowcount:
+                log(
+                    level="warning",
+                    method="_reap_stale_claims_job",
+                    path="NotificationScheduler",
+                    text_detail=f"Released {result.rowcount} stale notification claims",
+                )
+        except Exception as e:  # noqa: BLE001
+            log(
+                level="error",
+                method="_reap_stale_claims_job",
+                path="NotificationScheduler",
+                text_detail=f"Error in stale claims reaper job: {e}",
+                exception=e,
+            )
+
+    async def _purge_idempotency_keys_job(self):
+        """Job for deleting expired idempotency keys."""
+        try:
+            deleted = await idempotency_service.purge_expired()
+            if deleted:
+                log(
+                    level="info",
+                    method="_purge_idempotency_keys_job",
+                    path="NotificationScheduler",
+                    text_detail=f"Purged {deleted} expired idempotency keys",
+                )
+        except Exception as e:  # noqa: BLE001
+            log(
+                level="error",
+                method="_purge_idempotency_keys_job",
+                path="NotificationScheduler",
+                text_detail=f"Error in idempotency keys purge job: {e}",
+                exception=e,
+            )
+
+    async def _archive_bookings_job(self):
+        """Job for archiving ended bookings and managing archive partitions."""
+        try:
+            stats = await booking_archive_service.run()
+            if stats.created or stats.archived or stats.detached:
+                log(
+                    level="info",
+                    method="_archive_bookings_job",
+                    path="NotificationScheduler",
+                    text_detail=(
+                        f"Archived {stats.archived} bookings, "
+                        f"created partitions {stats.created}, "
+                        f"detached partitions {stats.detached}"
+                    ),
+                )
+        except Exception as e:  # noqa: BLE001
+            log(
+                level="error",
+                method="_archive_bookings_job",
+                path="NotificationScheduler",
+                text_detail=f"Error in booking archive job: {e}",
+                exception=e,
+            )
+
     async def force_check(self) -> dict[str, Any]:
         """Force manual check of pending notifications."""
         try:
@@ -0,0 +1,84 @@
+"""Min-heap of upcoming notification due times.
+
+The timer keeps (scheduled_at, id) of pending notifications due within a
+look-ahead window, so each one is sent at its due time instead of on the
+next poll. The window is loaded incrementally: a refill reads only
+notifications scheduled after the loaded window or inserted after the
+previous refill (id above the remembered max id). Rows committed out of id
+order are left to the periodic safety scan of the scheduler.
+"""
+
+from datetime import datetime, timedelta
+import heapq
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.models.notification import (
+    Notification,
+    NotificationStatus,
+)
+
+# Same age limit as the pending notifications scan
+MAX_OVERDUE = timedelta(hours=24)
+
+
+class NotificationTimer:
+    """Due times of pending notifications within the look-ahead window."""
+
+    def __init__(self, lookahead: timedelta):
+        self.lookahead = lookahead
+        self.loaded_until: datetime | None = None
+        self.max_id = 0
+        self._heap: list[tuple[datetime, int]] = []
+        self._queued: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, notification_id: int, scheduled_at: datetime) -> None:
+        if notification_id not in self._queued:
+            self._queued.add(notification_id)
+            heapq.heappush(self._heap, (scheduled_at, notification_id))
+
+    def next_due(self) -> datetime | None:
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> list[int]:
+        """Ids of notifications due by now, in due order."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, notification_id = heapq.heappop(self._heap)
+            self._queued.discard(notification_id)
+            due.append(notification_id)
+        return due
+
+    async def refill(self, session: AsyncSession, now: datetime) -> int:
+        """Extend the window to now + lookahead; return number of new entries."""
+        until = now + self.lookahead
+        max_id = await session.scalar(
+            sa.select(sa.func.coalesce(sa.func.max(Notification.id), 0)),
+        )
+        conditions = [
+            Notification.status == NotificationStatus.PENDING,
+            Notification.scheduled_at <= until,
+            Notification.scheduled_at >= now - MAX_OVERDUE,
+        ]
+        if self.loaded_until is not None:
+            conditions.append(
+                sa.or_(
+                    Notification.scheduled_at > self.loaded_until,
+                    Notification.id > self.max_id,
+                ),
+            )
+        rows = await session.execute(
+            sa.select(Notification.id, Notification.scheduled_at).where(
+                sa.and_(*conditions),
+            ),
+        )
+        before = len(self._heap)
+        for notification_id, scheduled_at in rows:
+            self.push(notification_id, scheduled_at)
+        self.loaded_until = until
+        self.max_id = max(self.max_id, max_id)
+        return len(self._heap) - before
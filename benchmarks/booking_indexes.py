@@ -0,0 +1,230 @@
+"""Benchmark the booking hot queries before and after the covering indexes.
+
+Loads a synthetic dataset into an unlogged scratch copy of bookings
+(bench_bookings, no foreign keys), so the real tables and their indexes are
+never touched. Runs every hot query with EXPLAIN (ANALYZE, BUFFERS) and
+timings on the indexes that existed before migration 2a6f3e8d1b94, then
+builds the indexes it adds and runs them again.
+
+Requires a migrated database configured via .env (for btree_gist):
+
+    uv run python -m benchmarks.booking_indexes --rows 10000000
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import hashlib
+import random
+import statistics
+import sys
+import time
+from uuid import UUID
+
+import sqlalchemy as sa
+
+from app.depends import provider
+
+TABLE = "bench_bookings"
+LOAD_CHUNK = 1_000_000
+
+# Indexes of bookings before the migration (primary key aside)
+BASELINE_INDEXES = (
+    f"CREATE INDEX ON {TABLE} USING gist (resource_id, during)",
+    f"CREATE INDEX ON {TABLE} (user_id, start_time, id)",
+    f"CREATE INDEX ON {TABLE} (resource_id, start_time, id)",
+)
+NEW_INDEXES = (
+    f"CREATE INDEX ON {TABLE} (end_time)",
+    f"CREATE INDEX ON {TABLE} (resource_id, start_time, id) INCLUDE (end_time)",
+)
+
+QUERIES = {
+    # Free slots and earliest slot: bookings of a resource within a window
+    "resource_window": (
+        f"SELECT start_time, end_time FROM {TABLE} "  # noqa: S608
+        "WHERE resource_id = :resource_id "
+        "AND start_time < :window_end AND end_time > :window_start "
+        "ORDER BY start_time"
+    ),
+    # Evaluation notifications: bookings ended 15 min - 24 h ago
+    "ended_recently": (
+        f"SELECT id FROM {TABLE} "  # noqa: S608
+        "WHERE end_time >= :ended_from AND end_time <= :ended_to "
+        "ORDER BY end_time DESC"
+    ),
+    # User listing, first keyset page
+    "user_page": (
+        f"SELECT id, start_time FROM {TABLE} "  # noqa: S608
+        "WHERE user_id = :user_id ORDER BY start_time, id LIMIT 50"
+    ),
+    # Archive job: oldest booking to move
+    "archive_oldest": (
+        f"SELECT min(start_time) FROM {TABLE} "  # noqa: S608
+        "WHERE end_time < :archive_cutoff"
+    ),
+}
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--resources", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=20,
+        help="Timed runs of every query (parameters vary between runs)",
+    )
+    parser.add_argument(
+        "--keep",
+        action="store_true",
+        help="Keep bench_bookings after the run",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def _user_id(number: int) -> UUID:
+    """UUID of synthetic user number, same as md5(number::text)::uuid in SQL."""
+    return UUID(hashlib.md5(str(number).encode()).hexdigest())  # noqa: S324
+
+
+async def _load(args: argparse.Namespace, base: datetime) -> None:
+    """Create bench_bookings and fill it with non-overlapping bookings.
+
+    Row g belongs to resource g % resources and is its (g / resources)-th
+    booking: one to two hours every two hours, so the data spans
+    2 * rows / resources hours back from base.
+    """
+    out = sys.stdout
+    async with provider.session_factory() as session:
+        await session.execute(sa.text(f"DROP TABLE IF EXISTS {TABLE}"))
+        await session.execute(
+            sa.text(
+                f"CREATE UNLOGGED TABLE {TABLE} ("
+                " id integer PRIMARY KEY,"
+                " resource_id integer NOT NULL,"
+                " user_id uuid NOT NULL,"
+                " start_time timestamptz NOT NULL,"
+                " end_time timestamptz NOT NULL,"
+                " during tstzrange GENERATED ALWAYS AS"
+                " (tstzrange(start_time, end_time)) STORED"
+                ")",
+            ),
+        )
+        await session.commit()
+
+        for offset in range(0, args.rows, LOAD_CHUNK):
+            last = min(offset + LOAD_CHUNK, args.rows) - 1
+            await session.execute(
+                sa.text(
+                    f"INSERT INTO {TABLE} "  # noqa: S608
+                    "(id, resource_id, user_id, start_time, end_time) "
+                    "SELECT g + 1, g % :resources, "
+                    "md5(((hashint8(g) & 2147483647) % :users)::text)::uuid, "
+                    "CAST(:base AS timestamptz) "
+                    "- (g / :resources) * interval '2 hours', "
+                    "CAST(:base AS timestamptz) "
+                    "- (g / :resources) * interval '2 hours' "
+                    "+ interval '1 hour' + (g % 4) * interval '15 minutes' "
+                    "FROM generate_series(CAST(:first AS bigint), :last) g",
+                ),
+                {
+                    "resources": args.resources,
+                    "users": args.users,
+                    "base": base,
+                    "first": offset,
+                    "last": last,
+                },
+            )
+            await session.commit()
+            out.write(f"loaded {last + 1} rows\n")
+            out.flush()
+
+        for ddl in BASELINE_INDEXES:
+            await session.execute(sa.text(ddl))
+        await session.execute(sa.text(f"ANALYZE {TABLE}"))
+        await session.commit()
+
+
+def _params(rng: random.Random, args: argparse.Namespace, base: datetime) -> dict:
+    span_hours = 2 * args.rows // args.resources
+    window_start = base - timedelta(hours=rng.randrange(max(span_hours, 1)))
+    ended_to = base - timedelta(hours=rng.randrange(max(span_hours, 1)))
+    return {
+        "resource_id": rng.randrange(args.resources),
+        "window_start": window_start,
+        "window_end": window_start + timedelta(days=7),
+        "ended_from": ended_to - timedelta(hours=24),
+        "ended_to": ended_to - timedelta(minutes=15),
+        "user_id": _user_id(rng.randrange(args.users)),
+        "archive_cutoff": base - timedelta(days=365),
+    }
+
+
+async def _measure(
+    args: argparse.Namespace,
+    base: datetime,
+    label: str,
+) -> dict[str, float]:
+    """Print plans and return median time (ms) of every query."""
+    out = sys.stdout
+    rng = random.Random(args.seed)  # noqa: S311
+    runs = [_params(rng, args, base) for _ in range(args.repeat)]
+    medians = {}
+    async with provider.session_factory() as session:
+        for name, sql in QUERIES.items():
+            stmt = sa.text(sql)
+            plan = await session.scalars(
+                sa.text("EXPLAIN (ANALYZE, BUFFERS) " + sql),
+                runs[0],
+            )
+            out.write(f"\n--- {label}: {name}\n")
+            out.write("\n".join(plan.all()) + "\n")
+
+            timings = []
+            for params in runs:
+                started = time.perf_counter()
+                await session.execute(stmt, params)
+                timings.append((time.perf_counter() - started) * 1000)
+            medians[name] = statistics.median(timings)
+    return medians
+
+
+async def main() -> None:
+    args = _parse_args()
+    base = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    out = sys.stdout
+    try:
+        await _load(args, base)
+        before = await _measure(args, base, "before")
+
+        async with provider.session_factory() as session:
+            for ddl in NEW_INDEXES:
+                started = time.perf_counter()
+                await session.execute(sa.text(ddl))
+                await session.commit()
+                out.write(f"{ddl}: {time.perf_counter() - started:.1f}s\n")
+            await session.execute(sa.text(f"ANALYZE {TABLE}"))
+            await session.commit()
+        after = await _measure(args, base, "after")
+
+        out.write(
+            f"\n{args.rows} rows, {args.resources} resources, "
+            f"{args.users} users, median of {args.repeat} runs\n",
+        )
+        out.write(f"{'query':<18}{'before ms':>12}{'after ms':>12}\n")
+        for name in QUERIES:
+            out.write(f"{name:<18}{before[name]:>12.2f}{after[name]:>12.2f}\n")
+    finally:
+        if not args.keep:
+            async with provider.session_factory() as session:
+                await session.execute(sa.text(f"DROP TABLE IF EXISTS {TABLE}"))
+                await session.commit()
+        await provider.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,186 @@
+"""Benchmark booking lock strategies under contention on one hot resource.
+
+Creates a temporary user, customer and resource, then for each strategy
+fires the same random stream of create requests at that resource from
+CONCURRENCY concurrent workers (one session each) and reports throughput,
+latency percentiles and how many bookings were created. The fixtures are
+deleted afterwards.
+
+Requires a migrated database configured via .env:
+
+    uv run python -m benchmarks.booking_lock_strategy --requests 2000 \\
+        --concurrency 32 --window-hours 200
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import random
+import statistics
+import sys
+import time
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from app.depends import provider
+from app.domain.services.bookings import BookingParams, BookingService
+from app.domain.services.bookings.booking import BookingLockStrategy
+from app.infrastructure.database import Booking, Customer, Resource, User
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument(
+        "--window-hours",
+        type=int,
+        default=200,
+        help="Requests start within this many hours: smaller means more conflicts",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def _requests(
+    args: argparse.Namespace,
+    user_id,
+    customer_id,
+    resource_id: int,
+) -> list[BookingParams]:
+    """Same pseudo-random hour-aligned requests for every strategy."""
+    rng = random.Random(args.seed)  # noqa: S311
+    base = datetime.now(timezone.utc).replace(
+        minute=0,
+        second=0,
+        microsecond=0,
+    ) + timedelta(days=2)
+    requests = []
+    for _ in range(args.requests):
+        start = base + timedelta(hours=rng.randrange(args.window_hours))
+        requests.append(
+            BookingParams(
+                user_id=user_id,
+                customer_id=customer_id,
+                resource_id=resource_id,
+                start_time=start,
+                end_time=start + timedelta(hours=rng.randint(1, 3)),
+                source="benchmark",
+            ),
+        )
+    return requests
+
+
+async def _run(
+    service: BookingService,
+    requests: list[BookingParams],
+    concurrency: int,
+) -> dict:
+    queue: asyncio.Queue[BookingParams] = asyncio.Queue()
+    for params in requests:
+        queue.put_nowait(params)
+    latencies: list[float] = []
+    created = 0
+
+    async def worker() -> None:
+        nonlocal created
+        while not queue.empty():
+            params = queue.get_nowait()
+            started = time.perf_counter()
+            result = await service.try_create_booking(params=params)
+            latencies.append(time.perf_counter() - started)
+            created += result.ok
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "rps": len(requests) / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p95_ms": quantiles[94] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "created": created,
+    }
+
+
+async def _overlapping_pairs(resource_id: int) -> int:
+    """Count overlapping booking pairs; must be 0 for every strategy."""
+    other = so.aliased(Booking)
+    stmt = (
+        sa.select(sa.func.count())
+        .select_from(Booking)
+        .join(
+            other,
+            sa.and_(
+                other.resource_id == Booking.resource_id,
+                other.id > Booking.id,
+                other.during.overlaps(Booking.during),
+            ),
+        )
+        .where(Booking.resource_id == resource_id)
+    )
+    async with provider.session_factory() as session:
+        return await session.scalar(stmt)
+
+
+async def _clear_bookings(resource_id: int) -> None:
+    async with provider.session_factory() as session:
+        await session.execute(
+            sa.delete(Booking).where(Booking.resource_id == resource_id),
+        )
+        await session.commit()
+
+
+async def main() -> None:
+    args = _parse_args()
+    async with provider.session_factory() as session:
+        user = await User.create(first_name="benchmark", session=session)
+        customer = await Customer.create(
+            name="benchmark",
+            owner_id=user.id,
+            session=session,
+        )
+        resource = await Resource.create(
+            name="benchmark",
+            customer_id=customer.id,
+            session=session,
+        )
+        await session.commit()
+
+    requests = _requests(args, user.id, customer.id, resource.id)
+    out = sys.stdout
+    out.write(
+        f"{args.requests} requests, concurrency {args.concurrency}, "
+        f"window {args.window_hours}h\n",
+    )
+    out.write(
+        f"{'strategy':<12}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'p99 ms':>10}{'created':>10}{'overlaps':>10}\n",
+    )
+    try:
+        for strategy in (BookingLockStrategy.CONSTRAINT, BookingLockStrategy.ADVISORY):
+            await _clear_bookings(resource.id)
+            stats = await _run(
+                BookingService(lock_strategy=strategy),
+                requests,
+                args.concurrency,
+            )
+            overlaps = await _overlapping_pairs(resource.id)
+            out.write(
+                f"{strategy:<12}{stats['rps']:>10.1f}{stats['p50_ms']:>10.1f}"
+                f"{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}"
+                f"{stats['created']:>10}{overlaps:>10}\n",
+            )
+    finally:
+        async with provider.session_factory() as session:
+            await session.execute(sa.delete(Customer).where(Customer.id == customer.id))
+            await session.execute(sa.delete(User).where(User.id == user.id))
+            await session.commit()
+        await provider.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
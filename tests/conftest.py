@@ -0,0 +1,11 @@
+import os
+
+# app.config requires these; tests never connect to the database or bots
+for name, value in {
+    "POSTGRES_USER": "test",
+    "POSTGRES_PASSWORD": "test",
+    "POSTGRES_DB": "test",
+    "ADMINBOT_TOKEN": "0:test",
+    "ADMINBOT_ID": "0",
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.domain.services.resource import resource
+from app.domain.services.resource.resource import _build_free_slots
+
+pytest.importorskip("numpy")
+
+MSK = timezone(timedelta(hours=3))
+
+
+@pytest.mark.parametrize("tz", [timezone.utc, MSK])
+def test_vectorized_slots_match_python_with_offsets(monkeypatch, tz):
+    start = datetime(2030, 1, 1, tzinfo=tz)
+    end = start + timedelta(days=1)
+    # Bookings come from the database in UTC
+    bookings = [
+        (
+            (start + timedelta(hours=h)).astimezone(timezone.utc),
+            (start + timedelta(hours=h, minutes=50)).astimezone(timezone.utc),
+        )
+        for h in (2, 3, 9, 20)
+    ]
+
+    monkeypatch.setattr(resource, "should_vectorize", lambda *_: True)
+    vectorized = list(_build_free_slots(bookings, start, end, 60))
+    monkeypatch.setattr(resource, "should_vectorize", lambda *_: False)
+    python = list(_build_free_slots(bookings, start, end, 60))
+
+    assert vectorized == python
+    assert [(s.utcoffset(), e.utcoffset()) for s, e in vectorized] == [
+        (s.utcoffset(), e.utcoffset()) for s, e in python
+    ]
+    assert {s.utcoffset() for s, _ in vectorized} == {start.utcoffset()}
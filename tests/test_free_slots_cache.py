@@ -0,0 +1,78 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from app.domain.services.bookings.booking import _invalidate_free_slots
+from app.domain.services.resource.buffers import Buffers
+from app.domain.services.resource.cache import free_slots_cache
+from app.domain.services.resource.schedule import ResourceSchedule, schedule_registry
+
+RESOURCE_ID = 10_001
+DAY = date(2030, 1, 1)
+NEXT_DAY = date(2030, 1, 2)
+SLOT = 1800
+
+
+def _day_start(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+
+def _cache_day(day: date) -> None:
+    start = _day_start(day)
+    free_slots_cache.set(
+        RESOURCE_ID,
+        day,
+        SLOT,
+        effective_start=start,
+        end=start + timedelta(days=1),
+        slots=[],
+        version=free_slots_cache.version(RESOURCE_ID),
+    )
+
+
+def _is_cached(day: date) -> bool:
+    start = _day_start(day)
+    return (
+        free_slots_cache.get(
+            RESOURCE_ID,
+            day,
+            SLOT,
+            effective_start=start,
+            end=start + timedelta(days=1),
+        )
+        is not None
+    )
+
+
+@pytest.fixture
+def buffered_resource():
+    schedule_registry._schedules[RESOURCE_ID] = ResourceSchedule(  # noqa: SLF001
+        buffers=Buffers(after=timedelta(minutes=30)),
+    )
+    yield
+    schedule_registry.drop(RESOURCE_ID)
+    free_slots_cache.invalidate_resource(RESOURCE_ID)
+
+
+@pytest.mark.usefixtures("buffered_resource")
+def test_booking_near_midnight_invalidates_next_day():
+    _cache_day(DAY)
+    _cache_day(NEXT_DAY)
+    start = _day_start(DAY) + timedelta(hours=23, minutes=40)
+
+    _invalidate_free_slots(RESOURCE_ID, start, start + timedelta(minutes=19))
+
+    assert not _is_cached(DAY)
+    assert not _is_cached(NEXT_DAY)
+
+
+def test_booking_without_buffers_keeps_next_day():
+    _cache_day(DAY)
+    _cache_day(NEXT_DAY)
+    start = _day_start(DAY) + timedelta(hours=23, minutes=40)
+
+    _invalidate_free_slots(RESOURCE_ID, start, start + timedelta(minutes=19))
+
+    assert not _is_cached(DAY)
+    assert _is_cached(NEXT_DAY)
+    free_slots_cache.invalidate_resource(RESOURCE_ID)
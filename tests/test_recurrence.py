@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+import uuid
+
+import pytest
+
+from app.domain.services.bookings.booking import (
+    MAX_BOOKING_DURATION_DAYS,
+    MAX_SERIES_OCCURRENCES,
+    SeriesParams,
+    _expand_series,
+)
+from app.domain.services.bookings.recurrence import RecurrenceRule, get_zone
+
+NOW = datetime(2030, 1, 1, tzinfo=timezone.utc)
+# Tuesday
+DTSTART = datetime(2030, 1, 1, 10, tzinfo=timezone.utc)
+
+
+def _series(rrule: str) -> tuple[SeriesParams, RecurrenceRule]:
+    params = SeriesParams(
+        user_id=uuid.uuid4(),
+        customer_id=uuid.uuid4(),
+        resource_id=1,
+        start_time=DTSTART,
+        end_time=DTSTART + timedelta(hours=1),
+        rrule=rrule,
+    )
+    return params, RecurrenceRule.parse(rrule)
+
+
+def test_byday_expands_weekdays_within_each_week():
+    rule = RecurrenceRule.parse("FREQ=WEEKLY;BYDAY=FR,TU;COUNT=5")
+
+    occurrences = list(rule.occurrences(DTSTART))
+
+    assert [o.strftime("%a %d") for o in occurrences] == [
+        "Tue 01",
+        "Fri 04",
+        "Tue 08",
+        "Fri 11",
+        "Tue 15",
+    ]
+
+
+def test_byday_with_interval_skips_weeks():
+    rule = RecurrenceRule.parse("FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE;COUNT=4")
+
+    occurrences = list(rule.occurrences(DTSTART))
+
+    # dtstart itself, then Wednesday of its week, then two weeks later
+    assert [o.strftime("%a %d") for o in occurrences] == [
+        "Tue 01",
+        "Wed 02",
+        "Mon 14",
+        "Wed 16",
+    ]
+
+
+def test_count_includes_dtstart():
+    rule = RecurrenceRule.parse("FREQ=DAILY;COUNT=3")
+
+    assert list(rule.occurrences(DTSTART)) == [
+        DTSTART,
+        DTSTART + timedelta(days=1),
+        DTSTART + timedelta(days=2),
+    ]
+
+
+def test_until_datetime_is_inclusive():
+    rule = RecurrenceRule.parse("FREQ=DAILY;UNTIL=20300103T100000Z")
+
+    assert list(rule.occurrences(DTSTART))[-1] == DTSTART + timedelta(days=2)
+
+
+def test_until_date_includes_the_whole_day():
+    rule = RecurrenceRule.parse("FREQ=DAILY;UNTIL=20300103")
+
+    assert [o.day for o in rule.occurrences(DTSTART)] == [1, 2, 3]
+
+
+def test_count_and_until_together_are_rejected():
+    with pytest.raises(ValueError, match="COUNT and UNTIL"):
+        RecurrenceRule.parse("FREQ=DAILY;COUNT=3;UNTIL=20300103")
+
+
+def test_series_over_occurrence_limit_is_rejected():
+    params, rule = _series(f"FREQ=DAILY;COUNT={MAX_SERIES_OCCURRENCES + 1}")
+
+    with pytest.raises(ValueError, match="occurrences"):
+        _expand_series(params, rule, NOW)
+
+
+def test_series_at_occurrence_limit_is_expanded():
+    params, rule = _series(f"FREQ=DAILY;COUNT={MAX_SERIES_OCCURRENCES}")
+
+    assert len(_expand_series(params, rule, NOW)) == MAX_SERIES_OCCURRENCES
+
+
+def test_series_past_booking_horizon_is_rejected():
+    until = NOW + timedelta(days=MAX_BOOKING_DURATION_DAYS + 7)
+    params, rule = _series(f"FREQ=WEEKLY;UNTIL={until:%Y%m%d}")
+
+    with pytest.raises(ValueError, match="within"):
+        _expand_series(params, rule, NOW)
+
+
+def test_series_skips_past_occurrences():
+    params, rule = _series("FREQ=DAILY;COUNT=5")
+
+    items = _expand_series(params, rule, DTSTART + timedelta(days=2))
+
+    assert [item.start_time for item in items] == [
+        DTSTART + timedelta(days=d) for d in (2, 3, 4)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("tz", "dtstart", "utc_hours"),
+    [
+        # Moscow left DST for permanent UTC+3 on 2014-10-26 (from UTC+4)
+        ("Europe/Moscow", datetime(2014, 10, 24, 6, tzinfo=timezone.utc), [6, 6, 7, 7]),
+        # Berlin switches to summer time on the last Sunday of March
+        ("Europe/Berlin", datetime(2030, 3, 29, 9, tzinfo=timezone.utc), [9, 9, 8, 8]),
+    ],
+)
+def test_local_time_is_kept_across_offset_change(tz, dtstart, utc_hours):
+    rule = RecurrenceRule.parse("FREQ=DAILY;COUNT=4")
+
+    occurrences = list(rule.occurrences(dtstart, tz))
+
+    assert [o.hour for o in occurrences] == utc_hours
+    assert {o.astimezone(get_zone(tz)).hour for o in occurrences} == {10}
+
+
+def test_unbounded_rule_is_lazy():
+    rule = RecurrenceRule.parse("FREQ=WEEKLY;BYDAY=MO")
+
+    assert not rule.is_bounded
+    assert [o.day for o in islice(rule.occurrences(DTSTART), 3)] == [1, 7, 14]